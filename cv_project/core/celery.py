@@ -25,15 +25,15 @@ app.conf.update(
     enable_utc=True,
     worker_pool="eventlet",  # For Windows compatibility
     worker_concurrency=2,
-    task_routes={
-        "main.tasks.send_cv_pdf_email": {"queue": "email"},
-        "main.tasks.cleanup_old_request_logs": {"queue": "maintenance"},
-    },
     beat_schedule={
         "cleanup-old-logs": {
             "task": "main.tasks.cleanup_old_request_logs",
             "schedule": 86400.0,  # Run daily
         },
+        "cleanup-expired-pdf-links": {
+            "task": "main.tasks.cleanup_expired_pdf_links",
+            "schedule": 86400.0,  # Run daily
+        },
     },
 )
 
@@ -56,6 +56,7 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "main.middleware.RequestLoggingMiddleware",
     "main.middleware.RequestLoggingCleanupMiddleware",
+    "main.instrumentation.RenderProfilingMiddleware",
 ]
 
 ROOT_URLCONF = "core.urls"
@@ -78,6 +79,17 @@ TEMPLATES = [
     },
 ]
 
+# Render cost instrumentation (context processors and template rendering),
+# off unless enabled. /metrics/render/ is readable by staff users and from
+# INTERNAL_IPS (comma-separated addresses, e.g. the Prometheus host).
+RENDER_INSTRUMENTATION_ENABLED = os.environ.get(
+    "RENDER_INSTRUMENTATION_ENABLED", "False"
+).lower() in ("true", "1", "yes", "on")
+RENDER_DEBUG_PANEL = DEBUG
+INTERNAL_IPS = [
+    ip.strip() for ip in os.getenv("INTERNAL_IPS", "").split(",") if ip.strip()
+]
+
 WSGI_APPLICATION = "core.wsgi.application"
 
 
@@ -187,14 +199,108 @@ TRANSLATION_SUPPORTED_LANGUAGES = {
     "saramaccan": "Saramaccan",
     "bislama": "Bislama",
 }
+# How long a CV translation is reused while the CV text stays unchanged
+TRANSLATION_CACHE_TIMEOUT = int(os.getenv("TRANSLATION_CACHE_TIMEOUT", 7 * 24 * 3600))
+# "batch": one JSON request per CV (split by size); "per_field": one per field
+TRANSLATION_MODE = os.getenv("TRANSLATION_MODE", "batch")
+TRANSLATION_BATCH_MAX_TOKENS = int(os.getenv("TRANSLATION_BATCH_MAX_TOKENS", 2000))
+# Terms kept untranslated on top of main.translation.TECHNICAL_TERMS
+TRANSLATION_EXTRA_TECHNICAL_TERMS = [
+    term.strip()
+    for term in os.getenv("TRANSLATION_EXTRA_TECHNICAL_TERMS", "").split(",")
+    if term.strip()
+]
+# Fields at least this long are streamed so progress shows partial text
+TRANSLATION_STREAM_MIN_CHARS = int(os.getenv("TRANSLATION_STREAM_MIN_CHARS", 1500))
+# OpenAI requests in flight per translation, and retries of 429/5xx errors
+TRANSLATION_CONCURRENCY = int(os.getenv("TRANSLATION_CONCURRENCY", 8))
+TRANSLATION_BACKOFF = {
+    "ATTEMPTS": 3,
+    "BASE_DELAY": 1.0,  # seconds, doubled per attempt before jitter
+    "MAX_DELAY": 20.0,
+}
+# Field translations reused across CVs: in-process LRU, then this cache
+TRANSLATION_MEMORY = {
+    "ENABLED": os.getenv("TRANSLATION_MEMORY_ENABLED", "True").lower() == "true",
+    "CACHE": "default",
+    "LRU_SIZE": int(os.getenv("TRANSLATION_MEMORY_LRU_SIZE", 2048)),  # entries
+    "TIMEOUT": 30 * 24 * 3600,  # seconds
+}
 
-EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
+# SMTP backend keeping authenticated connections open between sends
+EMAIL_BACKEND = os.getenv("EMAIL_BACKEND", "main.email_backends.PooledEmailBackend")
 EMAIL_HOST = os.getenv("EMAIL_HOST", "smtp.gmail.com")
 EMAIL_PORT = int(os.getenv("EMAIL_PORT", 587))
 EMAIL_USE_TLS = os.getenv("EMAIL_USE_TLS", "True").lower() == "true"
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD", "")
 EMAIL_FROM = os.getenv("EMAIL_FROM", EMAIL_HOST_USER)
+EMAIL_TIMEOUT = int(os.getenv("EMAIL_TIMEOUT", 30))
+
+# SMTP connection pool per worker process (see main.email_backends)
+EMAIL_POOL = {
+    "MAX_IDLE": int(os.getenv("EMAIL_POOL_MAX_IDLE", 4)),
+    "IDLE_TIMEOUT": int(os.getenv("EMAIL_POOL_IDLE_TIMEOUT", 60)),  # seconds
+    "MAX_MESSAGES": int(os.getenv("EMAIL_POOL_MAX_MESSAGES", 100)),
+    "HEALTH_CHECK_AFTER": 5,  # seconds idle before a NOOP check on reuse
+}
+
+# Asyncio email worker (manage.py run_email_worker, needs aiosmtplib)
+EMAIL_ASYNC_WORKER = {
+    "QUEUE": "emails",
+    "CONCURRENCY": int(os.getenv("EMAIL_ASYNC_CONCURRENCY", 200)),  # SMTP sessions
+    "THREADS": int(os.getenv("EMAIL_ASYNC_THREADS", 8)),  # building emails, DB
+}
+
+# Bulk CV emails: recipients sent per SMTP connection, and per request
+EMAIL_BULK_BATCH_SIZE = int(os.getenv("EMAIL_BULK_BATCH_SIZE", 20))
+EMAIL_BULK_MAX_RECIPIENTS = int(os.getenv("EMAIL_BULK_MAX_RECIPIENTS", 500))
+
+# Repeat submissions of a CV to the same recipient within this many seconds
+# are delivered once; a built email is kept this long for retries to resend
+EMAIL_DEDUPE_WINDOW = int(os.getenv("EMAIL_DEDUPE_WINDOW", 300))
+EMAIL_ARTIFACT_TIMEOUT = 3600
+
+# Email a signed download link instead of attaching CV PDFs larger than
+# THRESHOLD bytes (0 always attaches). Linked PDFs are stored in LOCATION
+# and links expire after MAX_AGE seconds.
+EMAIL_PDF_LINKS = {
+    "THRESHOLD": int(os.getenv("EMAIL_PDF_LINK_THRESHOLD", 0)),
+    "MAX_AGE": int(os.getenv("EMAIL_PDF_LINK_MAX_AGE", 7 * 24 * 3600)),
+    "LOCATION": os.getenv(
+        "EMAIL_PDF_LINK_LOCATION", str(BASE_DIR / "media" / "pdf_links")
+    ),
+}
+
+# Public address of the site, used for links in emails
+SITE_URL = os.getenv("SITE_URL", "http://localhost:8000")
+
+# Seconds an email status response is cached between polls
+EMAIL_STATUS_CACHE_TIMEOUT = 2
+
+# Token buckets for CV emails, shared through the Redis cache: RATE is the
+# refill rate ("n/s", "n/m", "n/h" or "n/d") and BURST the bucket size.
+# RECIPIENT limits emails per address, SENDER requests per client IP.
+# Set a scope to None to disable it.
+EMAIL_RATE_LIMITS = {
+    "CACHE": "default",
+    "RECIPIENT": {
+        "RATE": os.getenv("EMAIL_RATE_LIMIT_RECIPIENT", "5/h"),
+        "BURST": int(os.getenv("EMAIL_RATE_LIMIT_RECIPIENT_BURST", 3)),
+    },
+    "SENDER": {
+        "RATE": os.getenv("EMAIL_RATE_LIMIT_SENDER", "30/h"),
+        "BURST": int(os.getenv("EMAIL_RATE_LIMIT_SENDER_BURST", 10)),
+    },
+}
+
+# Proxies (addresses or networks) whose X-Forwarded-For header is trusted
+# when identifying the client for the SENDER limit, e.g. "10.0.0.0/8"
+RATE_LIMIT_TRUSTED_PROXIES = [
+    proxy.strip()
+    for proxy in os.getenv("RATE_LIMIT_TRUSTED_PROXIES", "").split(",")
+    if proxy.strip()
+]
 
 # For development, you can use console backend to see emails in console
 if DEBUG and not EMAIL_HOST_USER:
@@ -209,16 +315,16 @@ CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = True
 
-# Celery task routes and rate limiting
+# Celery task routes (the worker must consume these queues, see docker-compose)
 CELERY_TASK_ROUTES = {
-    "send_cv_pdf_email": {"queue": "emails"},
-    "cleanup_old_request_logs": {"queue": "maintenance"},
+    "main.tasks.send_cv_pdf_email": {"queue": "emails"},
+    "main.tasks.send_cv_pdf_bulk_email": {"queue": "emails"},
+    "main.tasks.cleanup_old_request_logs": {"queue": "maintenance"},
+    "main.tasks.cleanup_expired_pdf_links": {"queue": "maintenance"},
 }
 
-# Rate limiting for email tasks (1 email per minute per user)
 CELERY_TASK_ANNOTATIONS = {
-    "send_cv_pdf_email": {
-        "rate_limit": "1/m",  # 1 task per minute
+    "main.tasks.send_cv_pdf_email": {
         "time_limit": 300,  # 5 minutes timeout
         "soft_time_limit": 240,  # 4 minutes soft timeout
     },
@@ -235,6 +341,63 @@ CACHES = {
     }
 }
 
+# Generated CV PDF cache (content-addressed, invalidated on CV changes).
+# Set PDF_CACHE_BACKEND=main.pdf_cache.DjangoCachePDFCache to keep PDFs in Redis.
+PDF_CACHE = {
+    "BACKEND": os.getenv("PDF_CACHE_BACKEND", "main.pdf_cache.FileSystemPDFCache"),
+    "LOCATION": os.getenv("PDF_CACHE_LOCATION", str(BASE_DIR / "media" / "pdf_cache")),
+    "MAX_SIZE": int(os.getenv("PDF_CACHE_MAX_SIZE", 256 * 1024 * 1024)),
+}
+
+# Re-render PDFs in Celery whenever a CV or its children change
+PDF_PRERENDER_ON_CHANGE = os.getenv("PDF_PRERENDER_ON_CHANGE", "True").lower() == "true"
+PDF_PRERENDER_DELAY = int(os.getenv("PDF_PRERENDER_DELAY", 5))  # seconds
+
+# Hand pre-rendered PDF transfers to the front-end server:
+# "" (Django FileResponse), "nginx" (X-Accel-Redirect) or "apache" (X-Sendfile).
+# PDF_SENDFILE_URL is the nginx internal location aliased to PDF_CACHE LOCATION.
+PDF_SENDFILE_BACKEND = os.getenv("PDF_SENDFILE_BACKEND", "")
+PDF_SENDFILE_URL = os.getenv("PDF_SENDFILE_URL", "/protected/pdf/")
+
+# Named PDF theme (see main.pdf_styles.THEME_PALETTES)
+PDF_THEME = os.getenv("PDF_THEME", "default")
+
+# PDF output mode per use: "compact" (deflated page streams, ReportLab's
+# default output) or "fast" (uncompressed: larger files, quicker renders).
+# Run "manage.py benchmark_pdf_modes" to compare.
+PDF_DOWNLOAD_MODE = os.getenv("PDF_DOWNLOAD_MODE", "compact")
+PDF_EMAIL_MODE = os.getenv("PDF_EMAIL_MODE", "compact")
+
+# TrueType font embedded (as a glyph subset) for text the built-in
+# Helvetica cannot show, e.g. Cyrillic or CJK translations
+PDF_UNICODE_FONT = {
+    "REGULAR": os.getenv("PDF_FONT_PATH", ""),
+    "BOLD": os.getenv("PDF_FONT_BOLD_PATH", ""),
+}
+
+# Process pool for CPU-bound ReportLab rendering; off by default
+# (0 processes = render in-process)
+PDF_RENDER_POOL = {
+    "PROCESSES": int(os.getenv("PDF_RENDER_PROCESSES", 0)),
+    "MAX_QUEUE": int(os.getenv("PDF_RENDER_MAX_QUEUE", 32)),
+    "TIMEOUT": int(os.getenv("PDF_RENDER_TIMEOUT", 30)),  # seconds per job
+    "QUEUE_TIMEOUT": 5,  # seconds to wait for a free queue slot
+    "START_METHOD": "spawn",
+}
+
+# Concurrent requests for the same uncached PDF share one render. The lock in
+# LOCK_CACHE (django-redis) extends this across processes and nodes; TIMEOUT
+# bounds how long a request waits for another render before rendering itself.
+PDF_SINGLE_FLIGHT = {
+    "TIMEOUT": int(os.getenv("PDF_SINGLE_FLIGHT_TIMEOUT", 30)),  # seconds
+    "LOCK_CACHE": "default",
+}
+
+# Maximum PDFs rendering at once for one bulk ZIP export
+PDF_EXPORT_MAX_IN_FLIGHT = int(os.getenv("PDF_EXPORT_MAX_IN_FLIGHT", 8))
+# Maximum CVs in one ZIP export from the web view
+PDF_EXPORT_MAX_CVS = int(os.getenv("PDF_EXPORT_MAX_CVS", 500))
+
 # Session engine (use cache-based sessions with Redis)
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 SESSION_CACHE_ALIAS = "default"
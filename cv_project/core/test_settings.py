@@ -38,6 +38,16 @@ MIDDLEWARE = [
 # Email backend for testing
 EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
 
+# Email rate limits - Off unless a test enables them
+EMAIL_RATE_LIMITS = {"RECIPIENT": None, "SENDER": None}
+
+# Translation - One request per field, in order, as the mocked OpenAI
+# responses expect
+TRANSLATION_MODE = "per_field"
+TRANSLATION_CONCURRENCY = 1
+# Off unless a test enables it; it outlives each test's mocks
+TRANSLATION_MEMORY = {"ENABLED": False}
+
 # Celery - Use eager execution for tests (no Redis/broker needed)
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
@@ -81,6 +91,18 @@ CACHES = {
     }
 }
 
+# PDF cache - Never store generated PDFs between tests
+PDF_CACHE = {
+    "BACKEND": "main.pdf_cache.DummyPDFCache",
+}
+PDF_PRERENDER_ON_CHANGE = False
+
+# Render instrumentation - Installed so its metrics can be tested
+RENDER_INSTRUMENTATION_ENABLED = True
+
+# PDF rendering - Render in-process so mocks and query assertions apply
+PDF_RENDER_POOL = {"PROCESSES": 0}
+
 # Debug - Keep False for consistent testing
 DEBUG = False
 
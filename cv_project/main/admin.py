@@ -3,7 +3,7 @@ Admin configuration for CV models.
 """
 
 from django.contrib import admin
-from .models import CV, Skill, Project, Contact
+from .models import CV, Skill, Project, Contact, EmailDelivery, CVTranslation
 
 
 class SkillInline(admin.TabularInline):
@@ -62,3 +62,36 @@ class ContactAdmin(admin.ModelAdmin):
     list_display = ("contact_type", "value", "cv")
     list_filter = ("contact_type",)
     search_fields = ("value", "cv__firstname", "cv__lastname")
+
+
+@admin.register(EmailDelivery)
+class EmailDeliveryAdmin(admin.ModelAdmin):
+    list_display = (
+        "recipient",
+        "cv",
+        "state",
+        "attempts",
+        "message_size",
+        "created_at",
+        "finished_at",
+    )
+    list_filter = ("state", "created_at")
+    search_fields = (
+        "recipient",
+        "task_id",
+        "batch_id",
+        "cv__firstname",
+        "cv__lastname",
+    )
+    readonly_fields = [field.name for field in EmailDelivery._meta.fields]
+    list_select_related = ("cv",)
+    date_hierarchy = "created_at"
+
+
+@admin.register(CVTranslation)
+class CVTranslationAdmin(admin.ModelAdmin):
+    list_display = ("cv", "language", "field", "updated_at")
+    list_filter = ("language",)
+    search_fields = ("cv__firstname", "cv__lastname", "text")
+    readonly_fields = ("source_hash", "updated_at")
+    list_select_related = ("cv",)
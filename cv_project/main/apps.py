@@ -1,6 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class MainConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "main"
+
+    def ready(self):
+        from . import signals  # noqa: F401
+
+        if getattr(settings, "RENDER_INSTRUMENTATION_ENABLED", False):
+            from . import instrumentation
+
+            instrumentation.install()
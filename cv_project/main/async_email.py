@@ -0,0 +1,378 @@
+"""
+Asyncio email worker for the ``emails`` Celery queue.
+
+``manage.py run_email_worker`` consumes the queue Celery routes CV emails to
+and keeps up to ``EMAIL_ASYNC_WORKER["CONCURRENCY"]`` SMTP sessions in
+flight from one process, where the Celery worker sends one email per pool
+slot. Messages are built by the same ``CVEmailJob`` the Celery task uses
+(templates, PDF, delivery records, dedupe and rate limits), in a thread
+pool, and only the SMTP conversation runs on the event loop through
+aiosmtplib. Other tasks found on the queue (bulk sends) are traced in the
+thread pool as a Celery worker would, so their retries are published with
+their countdown.
+
+Like Celery, the worker honours the ``eta`` (retry countdowns) and
+``expires`` of task messages: a message that is not yet due is held,
+unacknowledged, until its time, and an expired one is discarded.
+
+aiosmtplib is optional and imported on first use.
+"""
+
+import asyncio
+import logging
+import queue
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+# Returned for a message put back on the queue instead of being handled
+REQUEUE = object()
+
+
+def _message_time(value):
+    """Parse an ``eta``/``expires`` task header; naive times are UTC."""
+    if not value:
+        return None
+    when = datetime.fromisoformat(value)
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when
+
+
+def _seconds_until(when):
+    return (when - datetime.now(timezone.utc)).total_seconds()
+
+
+def _blocking(func, *args):
+    """Run ``func`` on an executor thread with a usable database connection."""
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
+class AsyncSMTPSender:
+    """
+    Bounded pool of persistent aiosmtplib sessions.
+
+    At most ``concurrency`` sessions exist; ``send()`` waits for a free one,
+    opening it on first use and reconnecting once if the server dropped it.
+    Connection options default to Django's ``EMAIL_*`` settings.
+    """
+
+    def __init__(
+        self,
+        concurrency=100,
+        host=None,
+        port=None,
+        username=None,
+        password=None,
+        use_tls=None,
+        timeout=None,
+        tls_context=None,
+    ):
+        import aiosmtplib
+
+        self._smtp = aiosmtplib
+        self.concurrency = max(int(concurrency), 1)
+        self.host = host or settings.EMAIL_HOST
+        self.port = port or settings.EMAIL_PORT
+        self.username = settings.EMAIL_HOST_USER if username is None else username
+        self.password = settings.EMAIL_HOST_PASSWORD if password is None else password
+        self.use_tls = settings.EMAIL_USE_TLS if use_tls is None else use_tls
+        self.timeout = timeout or settings.EMAIL_TIMEOUT
+        self.tls_context = tls_context
+        self._clients = None
+
+    async def send(self, message):
+        """Send a Django ``EmailMessage``; return the size of the sent message."""
+        if self._clients is None:
+            self._clients = asyncio.Queue()
+            for _ in range(self.concurrency):
+                self._clients.put_nowait(None)
+
+        data = message.message().as_bytes(linesep="\r\n")
+        client = await self._clients.get()
+        try:
+            if client is None or not client.is_connected:
+                client = await self._connect()
+            try:
+                await client.sendmail(message.from_email, message.recipients(), data)
+            except self._smtp.SMTPServerDisconnected:
+                logger.info(f"SMTP session to {self.host} was closed, reconnecting")
+                client = await self._connect()
+                await client.sendmail(message.from_email, message.recipients(), data)
+        except Exception:
+            # Start the next send on a fresh session
+            if client is not None:
+                client.close()
+            client = None
+            raise
+        finally:
+            self._clients.put_nowait(client)
+        return len(data)
+
+    async def close(self):
+        """Quit every open session."""
+        if self._clients is None:
+            return
+        while not self._clients.empty():
+            client = self._clients.get_nowait()
+            if client is not None and client.is_connected:
+                try:
+                    await client.quit()
+                except self._smtp.SMTPException:
+                    client.close()
+        self._clients = None
+
+    async def _connect(self):
+        client = self._smtp.SMTP(
+            hostname=self.host,
+            port=self.port,
+            timeout=self.timeout,
+            start_tls=self.use_tls,
+            tls_context=self.tls_context,
+        )
+        await client.connect()
+        if self.username:
+            await client.login(self.username, self.password)
+        return client
+
+
+class EmailQueueWorker:
+    """
+    Drain a Celery queue, sending CV emails with ``sender``.
+
+    A consumer thread receives task messages (prefetching ``concurrency`` at
+    a time) and hands them to the event loop; each message is acknowledged
+    once its job has finished, successfully or not. A failed send is retried
+    by publishing the task again with a countdown, as ``Task.retry`` would.
+    Messages waiting for their ``eta`` do not count against the prefetch
+    limit, and are requeued if the worker stops first.
+    """
+
+    def __init__(self, sender, concurrency=None, queue_name=None, executor=None):
+        config = getattr(settings, "EMAIL_ASYNC_WORKER", {})
+        self.sender = sender
+        self.concurrency = concurrency or config.get("CONCURRENCY", 100)
+        self.queue_name = queue_name or config.get("QUEUE", "emails")
+        self.executor = executor or ThreadPoolExecutor(
+            max_workers=config.get("THREADS", 8), thread_name_prefix="email-worker"
+        )
+        self._acks = queue.Queue()
+        self._stopping = threading.Event()
+        self._tracers = {}
+        # Messages held until their eta; only used on the consumer thread
+        self._held = set()
+        self._consumer = None
+
+    def run(self):
+        """Consume until interrupted, then finish the jobs in flight."""
+        asyncio.run(self._run())
+
+    def stop(self):
+        self._stopping.set()
+
+    async def handle(
+        self, task_name, task_id, retries, args, kwargs, delivery_info=None
+    ):
+        """Run one task message."""
+        from .tasks import send_cv_pdf_email
+
+        loop = asyncio.get_running_loop()
+        if task_name != send_cv_pdf_email.name:
+            request = {
+                "id": task_id,
+                "retries": retries,
+                "delivery_info": delivery_info or {},
+            }
+            return await loop.run_in_executor(
+                self.executor,
+                _blocking,
+                partial(self._trace, task_name, task_id, args, kwargs, request),
+            )
+        return await self.send_cv_email(task_id, retries, args, kwargs)
+
+    async def handle_message(self, headers, args, kwargs, delivery_info=None):
+        """
+        Run a task message once its ``eta`` has passed.
+
+        Returns ``None`` without running an expired message, and ``REQUEUE``
+        when the worker stops before the message is due.
+        """
+        eta = _message_time(headers.get("eta"))
+        while eta is not None and _seconds_until(eta) > 0:
+            if self._stopping.is_set():
+                return REQUEUE
+            await asyncio.sleep(min(_seconds_until(eta), 1))
+
+        expires = _message_time(headers.get("expires"))
+        if expires is not None and _seconds_until(expires) <= 0:
+            logger.warning(
+                f"Discarding expired task {headers['task']}[{headers['id']}]"
+            )
+            return None
+
+        return await self.handle(
+            headers["task"],
+            headers["id"],
+            headers.get("retries", 0),
+            args,
+            kwargs,
+            delivery_info,
+        )
+
+    def _trace(self, task_name, task_id, args, kwargs, request):
+        """Run a task as a worker does; ``self.retry`` publishes a new message."""
+        from celery import current_app
+        from celery.app.trace import build_tracer
+
+        if task_name not in self._tracers:
+            self._tracers[task_name] = build_tracer(
+                task_name, current_app.tasks[task_name], app=current_app
+            )
+        return self._tracers[task_name](task_id, args, kwargs, request).retval
+
+    async def send_cv_email(self, task_id, retries, args, kwargs):
+        """Do the work of ``send_cv_pdf_email`` with an asynchronous send."""
+        from .tasks import CVEmailJob
+
+        loop = asyncio.get_running_loop()
+        job = CVEmailJob(task_id, retries, *args, **kwargs)
+        try:
+            result = await loop.run_in_executor(self.executor, _blocking, job.prepare)
+        except Exception as e:
+            return await loop.run_in_executor(
+                self.executor, _blocking, self._retry, job, args, kwargs, e
+            )
+        if result is not None:
+            return result
+
+        try:
+            size = await self.sender.send(job.message())
+        except Exception as e:
+            logger.error(f"Failed to send email to {job.recipient_email}: {str(e)}")
+            return await loop.run_in_executor(
+                self.executor, _blocking, self._retry, job, args, kwargs, e
+            )
+        return await loop.run_in_executor(self.executor, _blocking, job.succeeded, size)
+
+    def _retry(self, job, args, kwargs, exc):
+        """Publish the next attempt of ``job``, or fail it once retries run out."""
+        from .tasks import send_cv_pdf_email
+
+        if job.retries >= send_cv_pdf_email.max_retries:
+            return job.failed(exc, send_cv_pdf_email.max_retries)
+
+        job.retrying(exc)
+        send_cv_pdf_email.apply_async(
+            args=args,
+            kwargs=kwargs,
+            task_id=job.task_id,
+            countdown=60,
+            retries=job.retries + 1,
+        )
+        return {"success": False, "retrying": True, "error": str(exc)}
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        consumer = threading.Thread(
+            target=self._consume, args=(loop,), name="email-consumer", daemon=True
+        )
+        consumer.start()
+        try:
+            while consumer.is_alive():
+                await asyncio.sleep(0.5)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            self.stop()
+            await loop.run_in_executor(None, consumer.join)
+            await self.sender.close()
+            self.executor.shutdown()
+
+    def _consume(self, loop):
+        """Consumer thread: receive task messages and acknowledge finished ones."""
+        from celery import current_app
+
+        task_queue = current_app.amqp.queues[self.queue_name]
+        in_flight = set()
+        with current_app.connection_for_read() as connection:
+            with connection.Consumer(
+                [task_queue], callbacks=[partial(self._received, loop, in_flight)]
+            ) as consumer:
+                self._consumer = consumer
+                consumer.qos(prefetch_count=self.concurrency)
+                logger.info(
+                    f"Email worker consuming {self.queue_name!r}, "
+                    f"{self.concurrency} concurrent sends"
+                )
+                while not self._stopping.is_set() or in_flight:
+                    if self._stopping.is_set():
+                        consumer.cancel()
+                    self._ack_finished(in_flight)
+                    try:
+                        connection.drain_events(timeout=0.2)
+                    except socket.timeout:
+                        pass
+                self._ack_finished(in_flight)
+
+    def _received(self, loop, in_flight, body, message):
+        headers = message.headers or {}
+        if "task" not in headers or not isinstance(body, (list, tuple)):
+            logger.error(f"Rejecting message that is not a Celery task: {headers}")
+            message.reject()
+            return
+
+        eta = _message_time(headers.get("eta"))
+        if eta is not None and _seconds_until(eta) > 0:
+            # Held messages must not stop due ones from being prefetched
+            self._held.add(message)
+            self._update_prefetch()
+
+        args, kwargs = body[0], body[1]
+        future = asyncio.run_coroutine_threadsafe(
+            self.handle_message(headers, args, kwargs, message.delivery_info), loop
+        )
+        in_flight.add(message)
+        future.add_done_callback(partial(self._finished, headers, message))
+
+    def _finished(self, headers, message, future):
+        requeue = False
+        if not future.cancelled():
+            if future.exception() is not None:
+                logger.error(
+                    f"Email worker task {headers['task']}[{headers['id']}] raised: "
+                    f"{future.exception()}"
+                )
+            else:
+                requeue = future.result() is REQUEUE
+        # Acknowledge on the consumer thread, which owns the channel
+        self._acks.put((message, requeue))
+
+    def _ack_finished(self, in_flight):
+        while True:
+            try:
+                message, requeue = self._acks.get_nowait()
+            except queue.Empty:
+                return
+            in_flight.discard(message)
+            if requeue:
+                message.requeue()
+            else:
+                message.ack()
+            if message in self._held:
+                self._held.discard(message)
+                self._update_prefetch()
+
+    def _update_prefetch(self):
+        if self._consumer is not None:
+            self._consumer.qos(prefetch_count=self.concurrency + len(self._held))
@@ -0,0 +1,170 @@
+"""
+Shared helpers for the PDF and email benchmark management commands.
+"""
+
+import re
+import statistics
+import time
+import tracemalloc
+from datetime import date, datetime, timezone
+
+from .pdf import ContactData, CVData, ProjectData, SkillData
+
+PROFICIENCIES = [
+    ("beginner", "Beginner"),
+    ("intermediate", "Intermediate"),
+    ("advanced", "Advanced"),
+    ("expert", "Expert"),
+]
+CONTACT_TYPES = [
+    ("linkedin", "LinkedIn"),
+    ("github", "GitHub"),
+    ("website", "Website"),
+    ("twitter", "Twitter"),
+    ("other", "Other"),
+]
+# Metrics compared against a baseline; larger values are worse for all.
+REGRESSION_METRICS = ("wall_time_ms", "peak_memory_kb", "bytes")
+PAGE_PATTERN = re.compile(rb"/Type\s*/Page\b")
+LOREM = (
+    "Experienced engineer building reliable web platforms with Python, Django "
+    "and PostgreSQL, focused on performance, maintainability and mentoring. "
+)
+
+
+def synthetic_text(length):
+    """Return ``length`` characters of filler prose."""
+    repeats = length // len(LOREM) + 1
+    return (LOREM * repeats)[:length]
+
+
+def synthetic_cv_data(skills=10, projects=5, contacts=3, bio_chars=1000):
+    """Build an in-memory ``CVData`` snapshot of the requested size."""
+    return CVData(
+        firstname="Bench",
+        lastname="Mark",
+        email="bench@example.com",
+        phone="+1 555 0100",
+        bio=synthetic_text(bio_chars),
+        updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+        skills=tuple(
+            SkillData(
+                name=f"Skill {index}",
+                proficiency=PROFICIENCIES[index % 4][0],
+                proficiency_display=PROFICIENCIES[index % 4][1],
+            )
+            for index in range(skills)
+        ),
+        projects=tuple(
+            ProjectData(
+                title=f"Project {index}",
+                description=synthetic_text(400),
+                technologies="Python, Django, PostgreSQL, Redis",
+                url=f"https://example.com/projects/{index}",
+                start_date=date(2020, 1 + index % 12, 1),
+                end_date=None if index % 3 == 0 else date(2021, 1 + index % 12, 1),
+            )
+            for index in range(projects)
+        ),
+        contacts=tuple(
+            ContactData(
+                contact_type=CONTACT_TYPES[index % 5][0],
+                contact_type_display=CONTACT_TYPES[index % 5][1],
+                value=f"bench{index}",
+                url=f"https://example.com/contacts/{index}",
+            )
+            for index in range(contacts)
+        ),
+    )
+
+
+def count_pdf_pages(pdf):
+    """Return the number of pages in an uncompressed-object PDF."""
+    return len(PAGE_PATTERN.findall(pdf))
+
+
+def benchmark_pdf_case(render, data, repeat=3):
+    """
+    Measure one CV snapshot with ``render(data) -> BytesIO``.
+
+    Timing runs are kept separate from the traced run because tracemalloc
+    slows allocation-heavy code considerably.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        buffer = render(data)
+        timings.append((time.perf_counter() - start) * 1000)
+        pdf = buffer.getvalue()
+        buffer.close()
+
+    tracemalloc.start()
+    try:
+        render(data).close()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "wall_time_ms": round(min(timings), 3),
+        "wall_time_mean_ms": round(statistics.mean(timings), 3),
+        "peak_memory_kb": round(peak / 1024, 1),
+        "pages": count_pdf_pages(pdf),
+        "bytes": len(pdf),
+    }
+
+
+def run_pdf_benchmark(render, item_counts, bio_lengths, repeat=3, progress=None):
+    """
+    Benchmark every combination of related-row count and bio length.
+
+    Each case uses ``items`` skills, projects and contacts. Returns a list of
+    result dicts keyed by a stable ``case`` name.
+    """
+    results = []
+    for items in item_counts:
+        for bio_chars in bio_lengths:
+            data = synthetic_cv_data(
+                skills=items, projects=items, contacts=items, bio_chars=bio_chars
+            )
+            result = {
+                "case": f"items={items},bio={bio_chars}",
+                "items": items,
+                "bio_chars": bio_chars,
+                **benchmark_pdf_case(render, data, repeat=repeat),
+            }
+            if progress is not None:
+                progress(result)
+            results.append(result)
+    return results
+
+
+def compare_pdf_benchmarks(results, baseline, threshold=0.2):
+    """
+    Return regressions of ``results`` against ``baseline`` results.
+
+    A metric regresses when it exceeds the baseline value by more than
+    ``threshold`` (a fraction). Cases missing from either side are skipped.
+    """
+    baseline_cases = {entry["case"]: entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        previous = baseline_cases.get(entry["case"])
+        if previous is None:
+            continue
+        for metric in REGRESSION_METRICS:
+            before, after = previous.get(metric), entry.get(metric)
+            if not before or after is None:
+                continue
+            change = (after - before) / before
+            if change > threshold:
+                regressions.append(
+                    {
+                        "case": entry["case"],
+                        "metric": metric,
+                        "baseline": before,
+                        "current": after,
+                        "change": round(change, 3),
+                    }
+                )
+    return regressions
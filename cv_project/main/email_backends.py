@@ -0,0 +1,282 @@
+"""
+SMTP email backend that reuses connections across sends.
+
+Django's SMTP backend opens a connection, runs STARTTLS and logs in for every
+``EmailMessage.send()``, then quits again; the TLS handshake dominates the
+cost of a single CV email. ``PooledEmailBackend`` hands authenticated
+connections back to a per-process pool instead, so the next send on the same
+worker skips the handshake. Idle connections expire after ``IDLE_TIMEOUT``
+seconds, are checked with ``NOOP`` before reuse once they have been idle for
+``HEALTH_CHECK_AFTER`` seconds, and are retired after ``MAX_MESSAGES``
+messages. A send on a connection the server dropped is retried once on a
+fresh connection.
+"""
+
+import logging
+import smtplib
+import threading
+import time
+from collections import defaultdict, deque
+
+from celery.signals import worker_process_shutdown
+from django.conf import settings
+from django.core.mail.backends.smtp import EmailBackend
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+# Errors meaning the server went away, as opposed to rejecting a message
+DISCONNECT_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError)
+
+# Rejections after which the SMTP session is still in a known state
+CLEAN_REFUSALS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+)
+
+
+class PooledConnection:
+    """An open SMTP connection and its usage bookkeeping."""
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.messages = 0
+        self.reused = False
+        self.broken = False
+        self.last_used = time.monotonic()
+
+
+class SMTPConnectionPool:
+    """
+    Per-process pool of idle SMTP connections keyed by server and account.
+
+    At most ``max_idle`` connections are kept per key; more are closed when
+    they are returned.
+    """
+
+    def __init__(
+        self, max_idle=4, idle_timeout=60, max_messages=100, health_check_after=5
+    ):
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.max_messages = max_messages
+        self.health_check_after = health_check_after
+        self._idle = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._stats = {
+            "opened": 0,
+            "reused": 0,
+            "expired": 0,
+            "unhealthy": 0,
+            "retired": 0,
+        }
+
+    def track(self, connection):
+        """Wrap a newly opened connection for pooling."""
+        self._count("opened")
+        return PooledConnection(connection)
+
+    def checkout(self, key):
+        """Return a healthy idle connection for ``key``, or ``None``."""
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                # Most recently used first: it is the least likely to be stale
+                pooled = idle.pop()
+
+            idle_for = time.monotonic() - pooled.last_used
+            if idle_for > self.idle_timeout:
+                self._count("expired")
+                self._quit(pooled)
+                continue
+
+            if idle_for > self.health_check_after and not self._healthy(pooled):
+                self._count("unhealthy")
+                self._quit(pooled)
+                continue
+
+            pooled.reused = True
+            self._count("reused")
+            return pooled
+
+    def checkin(self, key, pooled):
+        """Return a connection to the pool, or close it if it cannot be reused."""
+        if pooled is None:
+            return
+
+        if pooled.broken or (
+            self.max_messages and pooled.messages >= self.max_messages
+        ):
+            self.discard(pooled)
+            return
+
+        pooled.last_used = time.monotonic()
+        with self._lock:
+            idle = self._idle[key]
+            if len(idle) < self.max_idle:
+                idle.append(pooled)
+                return
+        self._quit(pooled)
+
+    def discard(self, pooled):
+        """Close a connection instead of returning it to the pool."""
+        self._count("retired")
+        self._quit(pooled)
+
+    def clear(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle = [pooled for queue in self._idle.values() for pooled in queue]
+            self._idle.clear()
+        for pooled in idle:
+            self._quit(pooled)
+
+    def stats(self):
+        """Return connection counters for this process."""
+        with self._lock:
+            return dict(self._stats, idle=sum(map(len, self._idle.values())))
+
+    def _healthy(self, pooled):
+        try:
+            code, _ = pooled.connection.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+        return code == 250
+
+    def _quit(self, pooled):
+        try:
+            pooled.connection.quit()
+        except (smtplib.SMTPException, OSError):
+            try:
+                pooled.connection.close()
+            except OSError:
+                pass
+
+    def _count(self, name):
+        with self._lock:
+            self._stats[name] += 1
+
+
+class PooledEmailBackend(EmailBackend):
+    """
+    Django SMTP backend drawing its connection from ``get_smtp_pool()``.
+
+    ``close()`` returns the connection to the pool instead of quitting, so
+    code that sends with ``EmailMessage.send()`` needs no changes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pooled = None
+
+    @property
+    def pool_key(self):
+        return (self.host, self.port, self.username, self.use_tls, self.use_ssl)
+
+    def open(self):
+        if self.connection:
+            return False
+
+        pooled = get_smtp_pool().checkout(self.pool_key)
+        if pooled is not None:
+            self.connection = pooled.connection
+            self._pooled = pooled
+            return True
+
+        opened = super().open()
+        if self.connection is not None:
+            self._pooled = get_smtp_pool().track(self.connection)
+        return opened
+
+    def close(self):
+        if self.connection is None:
+            return
+
+        pooled, self._pooled = self._pooled, None
+        self.connection = None
+        get_smtp_pool().checkin(self.pool_key, pooled)
+
+    def _send(self, email_message):
+        pool = get_smtp_pool()
+        if pool.max_messages and self._pooled.messages >= pool.max_messages:
+            if not self._reconnect():
+                return False
+
+        try:
+            return self._send_counted(email_message)
+        except DISCONNECT_ERRORS:
+            if not self._pooled.reused:
+                raise
+
+        # The server dropped a pooled connection since its last health check
+        logger.info(f"Pooled SMTP connection to {self.host} was closed, reconnecting")
+        if not self._reconnect():
+            return False
+        return self._send_counted(email_message)
+
+    def _send_counted(self, email_message):
+        try:
+            sent = super()._send(email_message)
+        except CLEAN_REFUSALS:
+            raise
+        except (smtplib.SMTPException, OSError):
+            # E.g. a timeout during DATA leaves the session in an unknown state
+            self._pooled.broken = True
+            raise
+        if sent:
+            self._pooled.messages += 1
+        return sent
+
+    def _reconnect(self):
+        """Replace the current connection with a freshly opened one."""
+        get_smtp_pool().discard(self._pooled)
+        self.connection = None
+        self._pooled = None
+        # Bypass the pool: idle connections may be just as stale
+        super().open()
+        if self.connection is None:
+            return False
+        self._pooled = get_smtp_pool().track(self.connection)
+        return True
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_smtp_pool():
+    """Return the process-wide SMTP connection pool (see ``EMAIL_POOL``)."""
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                config = getattr(settings, "EMAIL_POOL", {})
+                _pool = SMTPConnectionPool(
+                    max_idle=config.get("MAX_IDLE", 4),
+                    idle_timeout=config.get("IDLE_TIMEOUT", 60),
+                    max_messages=config.get("MAX_MESSAGES", 100),
+                    health_check_after=config.get("HEALTH_CHECK_AFTER", 5),
+                )
+    return _pool
+
+
+@worker_process_shutdown.connect
+def _close_smtp_pool(**kwargs):
+    """Quit pooled connections when a Celery worker process exits."""
+    if _pool is not None:
+        _pool.clear()
+
+
+@receiver(setting_changed)
+def _reset_smtp_pool(setting, **kwargs):
+    """Drop the pool when ``EMAIL_POOL`` is overridden."""
+    global _pool
+
+    if setting == "EMAIL_POOL" and _pool is not None:
+        _pool.clear()
+        _pool = None
@@ -0,0 +1,321 @@
+"""
+Render cost instrumentation for context processors and templates.
+
+Wraps every configured context processor and the Django template engine's
+render step, recording wall time and database query counts per processor
+and per template. Aggregates are kept in-process and exposed through the
+metrics endpoint; per-request timings feed the ``Server-Timing`` header and
+the debug panel injected by ``RenderProfilingMiddleware``.
+"""
+
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from functools import wraps
+
+from django.conf import settings
+from django.db import connections
+from django.utils.functional import cached_property
+from django.utils.html import escape
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+
+
+def _label_value(value):
+    """Escape a Prometheus label value (backslash, double quote, newline)."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RenderMetrics:
+    """
+    Thread-safe, process-wide aggregate of render timings.
+
+    Entries are grouped by kind ("context_processors" or "templates") and
+    keyed by processor path or template name.
+    """
+
+    KINDS = ("context_processors", "templates")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data = {kind: {} for kind in self.KINDS}
+
+    def record(self, kind, name, duration_ms, queries, self_ms=None):
+        """Add one measurement to the aggregate for ``name``."""
+        if self_ms is None:
+            self_ms = duration_ms
+        with self._lock:
+            entry = self._data[kind].setdefault(
+                name,
+                {
+                    "calls": 0,
+                    "total_ms": 0.0,
+                    "self_ms": 0.0,
+                    "max_ms": 0.0,
+                    "queries": 0,
+                },
+            )
+            entry["calls"] += 1
+            entry["total_ms"] += duration_ms
+            entry["self_ms"] += self_ms
+            entry["max_ms"] = max(entry["max_ms"], duration_ms)
+            entry["queries"] += queries
+
+    def snapshot(self):
+        """Return a copy of the aggregates with per-call averages."""
+        with self._lock:
+            result = {}
+            for kind, entries in self._data.items():
+                result[kind] = {}
+                for name, entry in entries.items():
+                    calls = entry["calls"] or 1
+                    result[kind][name] = {
+                        **entry,
+                        "avg_ms": entry["total_ms"] / calls,
+                        "avg_queries": entry["queries"] / calls,
+                    }
+            return result
+
+    def reset(self):
+        """Drop all recorded measurements."""
+        with self._lock:
+            self._data = {kind: {} for kind in self.KINDS}
+
+    def as_prometheus(self):
+        """Render the aggregates in the Prometheus text exposition format."""
+        metric_names = {
+            "context_processors": "cv_context_processor",
+            "templates": "cv_template_render",
+        }
+        label_names = {"context_processors": "processor", "templates": "template"}
+        lines = []
+        for kind, entries in self.snapshot().items():
+            metric = metric_names[kind]
+            label = label_names[kind]
+            lines.append(f"# TYPE {metric}_calls_total counter")
+            lines.append(f"# TYPE {metric}_seconds_total counter")
+            lines.append(f"# TYPE {metric}_queries_total counter")
+            for name, entry in sorted(entries.items()):
+                labels = f'{{{label}="{_label_value(name)}"}}'
+                lines.append(f"{metric}_calls_total{labels} {entry['calls']}")
+                lines.append(
+                    f"{metric}_seconds_total{labels} {entry['total_ms'] / 1000:.6f}"
+                )
+                lines.append(f"{metric}_queries_total{labels} {entry['queries']}")
+        return "\n".join(lines) + "\n"
+
+
+render_metrics = RenderMetrics()
+
+
+class _QueryCounter:
+    """Database execute wrapper that counts executed queries."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+def _render_stack():
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+@contextmanager
+def measure(kind, name):
+    """
+    Time a block and count the queries it runs, then record the result.
+
+    Nested measurements are subtracted from the enclosing one so that
+    ``self_ms`` reflects time spent in the block itself.
+    """
+    counter = _QueryCounter()
+    stack = _render_stack()
+    frame = {"child_ms": 0.0}
+    stack.append(frame)
+    start = time.perf_counter()
+    try:
+        with ExitStack() as wrappers:
+            for connection in connections.all():
+                wrappers.enter_context(connection.execute_wrapper(counter))
+            yield
+    finally:
+        duration_ms = (time.perf_counter() - start) * 1000
+        stack.pop()
+        if stack:
+            stack[-1]["child_ms"] += duration_ms
+        self_ms = duration_ms - frame["child_ms"]
+        render_metrics.record(kind, name, duration_ms, counter.count, self_ms)
+
+        profile = getattr(_local, "profile", None)
+        if profile is not None:
+            profile.append(
+                {
+                    "kind": kind,
+                    "name": name,
+                    "duration_ms": duration_ms,
+                    "self_ms": self_ms,
+                    "queries": counter.count,
+                }
+            )
+
+
+def instrument_context_processor(processor):
+    """Wrap a context processor so each call is measured."""
+    if getattr(processor, "_render_instrumented", False):
+        return processor
+
+    name = f"{processor.__module__}.{processor.__qualname__}"
+
+    @wraps(processor)
+    def wrapper(request):
+        with measure("context_processors", name):
+            return processor(request)
+
+    wrapper._render_instrumented = True
+    return wrapper
+
+
+def instrument_template_render(render):
+    """Wrap ``Template._render`` so each template render is measured."""
+    if getattr(render, "_render_instrumented", False):
+        return render
+
+    @wraps(render)
+    def _render(self, context):
+        with measure("templates", self.name or "<string>"):
+            return render(self, context)
+
+    _render._render_instrumented = True
+    return _render
+
+
+def install():
+    """
+    Patch the template engine so processors and renders are measured.
+
+    Safe to call more than once; only the first call patches.
+    """
+    global _installed
+
+    with _install_lock:
+        if _installed:
+            return
+
+        from django.template.base import Template
+        from django.template.engine import Engine
+
+        original_processors = Engine.template_context_processors.func
+
+        def template_context_processors(self):
+            return tuple(
+                instrument_context_processor(processor)
+                for processor in original_processors(self)
+            )
+
+        instrumented = cached_property(template_context_processors)
+        instrumented.__set_name__(Engine, "template_context_processors")
+        Engine.template_context_processors = instrumented
+
+        Template._render = instrument_template_render(Template._render)
+        _installed = True
+
+
+def start_profile():
+    """Begin collecting per-request measurements on this thread."""
+    _local.profile = []
+    _local.stack = []
+
+
+def finish_profile():
+    """Stop collecting and return the measurements for this request."""
+    profile = getattr(_local, "profile", None) or []
+    _local.profile = None
+    return profile
+
+
+class RenderProfilingMiddleware:
+    """
+    Middleware that attaches per-request render timings to the response.
+
+    Adds a ``Server-Timing`` header summarising context processor and
+    template cost and, when ``RENDER_DEBUG_PANEL`` is enabled, injects a
+    small breakdown panel into HTML pages.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        start_profile()
+        try:
+            response = self.get_response(request)
+        finally:
+            profile = finish_profile()
+
+        if profile:
+            response["Server-Timing"] = self._server_timing(profile)
+            if getattr(settings, "RENDER_DEBUG_PANEL", False):
+                self._inject_panel(response, profile)
+
+        return response
+
+    def _server_timing(self, profile):
+        """Summarise the profile as a Server-Timing header value."""
+        totals = {"context_processors": 0.0, "templates": 0.0}
+        for entry in profile:
+            totals[entry["kind"]] += entry["self_ms"]
+        return (
+            f'ctxproc;dur={totals["context_processors"]:.2f};desc="Context processors", '
+            f'tpl;dur={totals["templates"]:.2f};desc="Template rendering"'
+        )
+
+    def _inject_panel(self, response, profile):
+        """Insert the render breakdown before ``</body>`` of HTML responses."""
+        if getattr(response, "streaming", False):
+            return
+        if "text/html" not in response.get("Content-Type", ""):
+            return
+
+        content = response.content
+        marker = b"</body>"
+        index = content.rfind(marker)
+        if index == -1:
+            return
+
+        panel = self._render_panel(profile).encode(response.charset)
+        response.content = content[:index] + panel + content[index:]
+        if response.has_header("Content-Length"):
+            response["Content-Length"] = str(len(response.content))
+
+    def _render_panel(self, profile):
+        """Build the debug panel markup for a request profile."""
+        rows = []
+        for entry in sorted(profile, key=lambda e: e["self_ms"], reverse=True):
+            kind = "processor" if entry["kind"] == "context_processors" else "template"
+            rows.append(
+                "<tr>"
+                f"<td>{kind}</td>"
+                f"<td><code>{escape(entry['name'])}</code></td>"
+                f"<td class=\"text-end\">{entry['duration_ms']:.2f}</td>"
+                f"<td class=\"text-end\">{entry['self_ms']:.2f}</td>"
+                f"<td class=\"text-end\">{entry['queries']}</td>"
+                "</tr>"
+            )
+        return (
+            '<div id="render-debug-panel" class="bg-dark text-light py-2">'
+            '<div class="container"><strong class="text-warning">'
+            '<i class="fas fa-stopwatch"></i> Render cost</strong>'
+            '<table class="table table-dark table-sm small mb-0">'
+            "<thead><tr><th>Kind</th><th>Name</th>"
+            '<th class="text-end">Total ms</th><th class="text-end">Self ms</th>'
+            '<th class="text-end">Queries</th></tr></thead>'
+            f"<tbody>{''.join(rows)}</tbody></table></div></div>"
+        )
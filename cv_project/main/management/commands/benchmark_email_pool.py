@@ -0,0 +1,144 @@
+"""
+Compare per-email SMTP connections with the pooled email backend.
+
+Runs a local aiosmtpd server as a stand-in for the real SMTP relay and sends
+the same messages through Django's SMTP backend (one connection per send,
+as ``EmailMessage.send()`` does) and through ``PooledEmailBackend``.
+"""
+
+import socket
+import ssl
+import time
+
+from django.core.mail import EmailMessage
+from django.core.mail.backends.smtp import EmailBackend
+from django.core.management.base import BaseCommand, CommandError
+
+from main.email_backends import PooledEmailBackend, get_smtp_pool
+
+
+class CountingHandler:
+    """aiosmtpd handler that accepts and counts messages."""
+
+    def __init__(self):
+        self.messages = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 Message accepted for delivery"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class Command(BaseCommand):
+    help = "Benchmark SMTP delivery with and without connection pooling."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--messages", type=int, default=50, help="Emails sent per backend."
+        )
+        parser.add_argument(
+            "--attachment-kb",
+            type=int,
+            default=60,
+            help="Size of the fake PDF attached to each email.",
+        )
+        parser.add_argument(
+            "--certfile",
+            help="Server certificate enabling STARTTLS (must be valid for "
+            "localhost; it is also trusted by the client).",
+        )
+        parser.add_argument("--keyfile", help="Private key for --certfile.")
+
+    def handle(self, *args, **options):
+        try:
+            from aiosmtpd.controller import Controller
+        except ImportError:
+            raise CommandError(
+                "This benchmark needs aiosmtpd: pip install aiosmtpd"
+            ) from None
+
+        use_tls = bool(options["certfile"])
+        server_context = client_context = None
+        if use_tls:
+            server_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+            server_context.load_cert_chain(options["certfile"], options["keyfile"])
+            client_context = ssl.create_default_context(cafile=options["certfile"])
+
+        handler = CountingHandler()
+        controller = Controller(
+            handler, hostname="localhost", port=free_port(), tls_context=server_context
+        )
+        controller.start()
+        try:
+            attachment = b"%PDF" + b"0" * (options["attachment_kb"] * 1024)
+            messages = [
+                self._message(index, attachment) for index in range(options["messages"])
+            ]
+            connection_options = {
+                "host": "localhost",
+                "port": controller.port,
+                "username": "",
+                "password": "",
+                "use_tls": use_tls,
+                "timeout": 10,
+            }
+
+            get_smtp_pool().clear()
+            opened_before = get_smtp_pool().stats()["opened"]
+            results = [
+                (
+                    "per-send",
+                    self._run(
+                        EmailBackend, messages, connection_options, client_context
+                    ),
+                    len(messages),
+                ),
+                (
+                    "pooled",
+                    self._run(
+                        PooledEmailBackend, messages, connection_options, client_context
+                    ),
+                    get_smtp_pool().stats()["opened"] - opened_before,
+                ),
+            ]
+            get_smtp_pool().clear()
+        finally:
+            controller.stop()
+
+        self.stdout.write(
+            f"{len(messages)} messages, TLS {'on' if use_tls else 'off'}, "
+            f"{handler.messages} delivered"
+        )
+        baseline = results[0][1]
+        for label, elapsed, connections in results:
+            self.stdout.write(
+                f"{label:<10}{elapsed * 1000 / len(messages):>9.2f} ms/email"
+                f"{connections:>6} connections"
+                f"{baseline / elapsed:>8.2f}x"
+            )
+
+    def _message(self, index, attachment):
+        message = EmailMessage(
+            subject=f"CV #{index}",
+            body="<p>Please find attached the CV.</p>",
+            from_email="benchmark@example.com",
+            to=["recipient@example.com"],
+        )
+        message.content_subtype = "html"
+        message.attach(f"cv_{index}.pdf", attachment, "application/pdf")
+        return message
+
+    def _run(self, backend_class, messages, connection_options, client_context):
+        """Send each message with its own backend, like ``EmailMessage.send()``."""
+        start = time.perf_counter()
+        for message in messages:
+            backend = backend_class(**connection_options)
+            if client_context is not None:
+                backend.ssl_context = client_context
+            backend.send_messages([message])
+        return time.perf_counter() - start
@@ -0,0 +1,157 @@
+"""
+Compare the Celery email worker with the asyncio email worker.
+
+Runs a local aiosmtpd server that takes ``--latency-ms`` to accept each
+message, as a stand-in for a remote relay, and sends the same CV-sized
+emails the way each worker does: the Celery worker (``-P eventlet
+--concurrency=2``) sends one email per pool slot through
+``PooledEmailBackend``, the asyncio worker keeps ``--concurrency`` sessions
+in flight through ``AsyncSMTPSender``. Reports emails per second.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.mail import EmailMessage
+from django.core.management.base import BaseCommand, CommandError
+
+from main.async_email import AsyncSMTPSender
+from main.email_backends import PooledEmailBackend, get_smtp_pool
+
+from .benchmark_email_pool import free_port
+
+
+class SlowHandler:
+    """aiosmtpd handler that accepts messages after a delay."""
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.messages = 0
+
+    async def handle_DATA(self, server, session, envelope):
+        await asyncio.sleep(self.latency)
+        self.messages += 1
+        return "250 Message accepted for delivery"
+
+
+class Command(BaseCommand):
+    help = "Benchmark emails/second of the Celery and asyncio email workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--messages", type=int, default=500, help="Emails sent per worker."
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=200,
+            help="SMTP sessions kept in flight by the asyncio worker.",
+        )
+        parser.add_argument(
+            "--celery-concurrency",
+            type=int,
+            default=2,
+            help="Pool size of the Celery worker being compared.",
+        )
+        parser.add_argument(
+            "--latency-ms",
+            type=int,
+            default=50,
+            help="Time the SMTP server takes to accept each message.",
+        )
+        parser.add_argument(
+            "--attachment-kb",
+            type=int,
+            default=60,
+            help="Size of the fake PDF attached to each email.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            from aiosmtpd.controller import Controller
+            import aiosmtplib  # noqa: F401
+        except ImportError:
+            raise CommandError(
+                "This benchmark needs aiosmtpd and aiosmtplib: "
+                "pip install aiosmtpd aiosmtplib"
+            ) from None
+
+        handler = SlowHandler(options["latency_ms"] / 1000)
+        controller = Controller(handler, hostname="localhost", port=free_port())
+        controller.start()
+        try:
+            attachment = b"%PDF" + b"0" * (options["attachment_kb"] * 1024)
+            messages = [
+                self._message(index, attachment) for index in range(options["messages"])
+            ]
+            get_smtp_pool().clear()
+            celery_elapsed = self._run_celery(
+                messages, controller.port, options["celery_concurrency"]
+            )
+            get_smtp_pool().clear()
+            async_elapsed = asyncio.run(
+                self._run_async(messages, controller.port, options["concurrency"])
+            )
+        finally:
+            controller.stop()
+
+        self.stdout.write(
+            f"{len(messages)} messages, {options['latency_ms']} ms server latency, "
+            f"{handler.messages} delivered"
+        )
+        results = [
+            (f"celery x{options['celery_concurrency']}", celery_elapsed),
+            (f"asyncio x{options['concurrency']}", async_elapsed),
+        ]
+        for label, elapsed in results:
+            self.stdout.write(
+                f"{label:<16}{len(messages) / elapsed:>9.1f} emails/s"
+                f"{celery_elapsed / elapsed:>8.2f}x"
+            )
+
+    def _message(self, index, attachment):
+        message = EmailMessage(
+            subject=f"CV #{index}",
+            body="<p>Please find attached the CV.</p>",
+            from_email="benchmark@example.com",
+            to=["recipient@example.com"],
+        )
+        message.content_subtype = "html"
+        message.attach(f"cv_{index}.pdf", attachment, "application/pdf")
+        return message
+
+    def _run_celery(self, messages, port, concurrency):
+        """Send like the Celery task: one ``send_messages`` call per email."""
+
+        def send(message):
+            backend = PooledEmailBackend(
+                host="localhost",
+                port=port,
+                username="",
+                password="",
+                use_tls=False,
+                timeout=30,
+            )
+            backend.send_messages([message])
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            list(executor.map(send, messages))
+        return time.perf_counter() - start
+
+    async def _run_async(self, messages, port, concurrency):
+        sender = AsyncSMTPSender(
+            concurrency=concurrency,
+            host="localhost",
+            port=port,
+            username="",
+            password="",
+            use_tls=False,
+            timeout=30,
+        )
+        start = time.perf_counter()
+        await asyncio.gather(*(sender.send(message) for message in messages))
+        elapsed = time.perf_counter() - start
+        await sender.close()
+        return elapsed
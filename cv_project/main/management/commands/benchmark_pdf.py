@@ -0,0 +1,106 @@
+"""
+Benchmark PDF generation across synthetic CV sizes.
+"""
+
+import json
+import platform
+import sys
+
+import reportlab
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import override_settings
+from django.utils import timezone
+
+from main.benchmarks import compare_pdf_benchmarks, run_pdf_benchmark
+from main.views import generate_cv_pdf_buffer
+
+
+def _int_list(value):
+    try:
+        return [int(item) for item in value.split(",") if item.strip()]
+    except ValueError:
+        raise CommandError(f"Expected comma-separated integers, got {value!r}")
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure generate_cv_pdf_buffer wall time, peak memory, page count and "
+        "size over synthetic CVs, optionally comparing against a baseline."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--items",
+            default="0,10,100,1000",
+            help="Skills/projects/contacts per CV (comma separated).",
+        )
+        parser.add_argument(
+            "--bios",
+            default="100,1000,10000,50000",
+            help="Bio lengths in characters (comma separated).",
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Timed runs per case."
+        )
+        parser.add_argument("--output", help="Write results to this JSON file.")
+        parser.add_argument(
+            "--compare", help="Baseline JSON file to check for regressions."
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed slowdown/growth over the baseline (default: 0.2 = 20%%).",
+        )
+
+    def handle(self, *args, **options):
+        item_counts = _int_list(options["items"])
+        bio_lengths = _int_list(options["bios"])
+
+        def progress(result):
+            self.stdout.write(
+                f"{result['case']:<24}{result['wall_time_ms']:>10.1f} ms"
+                f"{result['peak_memory_kb']:>12.1f} KB"
+                f"{result['pages']:>6} pages{result['bytes']:>10} bytes"
+            )
+
+        # Render in this process so tracemalloc sees the allocations
+        with override_settings(PDF_RENDER_POOL={"PROCESSES": 0}):
+            results = run_pdf_benchmark(
+                generate_cv_pdf_buffer,
+                item_counts,
+                bio_lengths,
+                repeat=options["repeat"],
+                progress=progress,
+            )
+
+        if options["output"]:
+            report = {
+                "created_at": timezone.now().isoformat(),
+                "python": sys.version.split()[0],
+                "reportlab": reportlab.Version,
+                "machine": platform.machine(),
+                "results": results,
+            }
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2)
+            self.stdout.write(f"Results written to {options['output']}")
+
+        if options["compare"]:
+            with open(options["compare"]) as baseline_file:
+                baseline = json.load(baseline_file)["results"]
+
+            regressions = compare_pdf_benchmarks(
+                results, baseline, threshold=options["threshold"]
+            )
+            for regression in regressions:
+                self.stdout.write(
+                    self.style.ERROR(
+                        f"REGRESSION {regression['case']} {regression['metric']}: "
+                        f"{regression['baseline']} -> {regression['current']} "
+                        f"(+{regression['change']:.0%})"
+                    )
+                )
+            if regressions:
+                raise CommandError(f"{len(regressions)} benchmark regression(s)")
+            self.stdout.write(self.style.SUCCESS("No regressions against baseline"))
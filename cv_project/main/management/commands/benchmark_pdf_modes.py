@@ -0,0 +1,54 @@
+"""
+Compare PDF output modes by size and render time.
+
+"compact" is ReportLab's default output, so it is the reference: the other
+modes are reported relative to it.
+"""
+
+from django.core.management.base import BaseCommand
+
+from main.benchmarks import benchmark_pdf_case, synthetic_cv_data
+from main.pdf import PDF_MODE_COMPACT, PDF_MODES, PDFGenerator
+from main.pdf_cache import pdf_render_options
+
+CASES = [
+    ("small", {"skills": 0, "projects": 0, "contacts": 1, "bio_chars": 300}),
+    ("typical", {"skills": 10, "projects": 5, "contacts": 3, "bio_chars": 1500}),
+    ("large", {"skills": 100, "projects": 50, "contacts": 5, "bio_chars": 10000}),
+]
+
+
+class Command(BaseCommand):
+    help = "Measure PDF size and render time for each output mode."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repeat", type=int, default=5, help="Timed runs per case."
+        )
+
+    def handle(self, *args, **options):
+        render_options = pdf_render_options()
+
+        self.stdout.write(
+            f"{'case':<10}{'mode':<10}{'bytes':>10}{'time':>12}"
+            f"{'size vs compact':>17}{'time vs compact':>17}"
+        )
+        for label, size in CASES:
+            data = synthetic_cv_data(**size)
+            results = {}
+            for mode in PDF_MODES:
+                render_options["mode"] = mode
+                results[mode] = benchmark_pdf_case(
+                    lambda data: PDFGenerator(data, **render_options).generate(),
+                    data,
+                    repeat=options["repeat"],
+                )
+
+            compact = results[PDF_MODE_COMPACT]
+            for mode, result in results.items():
+                self.stdout.write(
+                    f"{label:<10}{mode:<10}{result['bytes']:>10}"
+                    f"{result['wall_time_ms']:>9.1f} ms"
+                    f"{result['bytes'] / compact['bytes']:>16.0%}"
+                    f"{result['wall_time_ms'] / compact['wall_time_ms']:>16.0%}"
+                )
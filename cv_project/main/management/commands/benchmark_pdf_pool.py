@@ -0,0 +1,63 @@
+"""
+Measure PDF rendering throughput of the process pool across worker counts.
+"""
+
+import os
+import time
+
+from django.core.management.base import BaseCommand
+
+from main.benchmarks import synthetic_cv_data
+from main.pdf import render_cv_pdf_data
+from main.pdf_service import PDFRenderService
+
+
+class Command(BaseCommand):
+    help = "Benchmark PDF rendering throughput with 1..N worker processes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--max-processes",
+            type=int,
+            default=os.cpu_count() or 1,
+            help="Largest pool size to measure (default: CPU count).",
+        )
+        parser.add_argument(
+            "--jobs", type=int, default=64, help="PDFs to render per run."
+        )
+        parser.add_argument("--skills", type=int, default=20)
+        parser.add_argument("--projects", type=int, default=10)
+
+    def handle(self, *args, **options):
+        data = synthetic_cv_data(
+            skills=options["skills"], projects=options["projects"]
+        ).to_dict()
+        jobs = options["jobs"]
+
+        # In-process baseline: what a single web/Celery worker does today
+        start = time.perf_counter()
+        for _ in range(jobs):
+            render_cv_pdf_data(data)
+        baseline = jobs / (time.perf_counter() - start)
+        self.stdout.write(f"{'in-process':>12}: {baseline:8.1f} PDFs/s")
+
+        for processes in range(1, options["max_processes"] + 1):
+            service = PDFRenderService(processes=processes, max_queue=jobs)
+            try:
+                # Warm the pool so process start-up is not measured
+                for future in [service.submit(data) for _ in range(processes)]:
+                    future.result()
+
+                start = time.perf_counter()
+                futures = [service.submit(data) for _ in range(jobs)]
+                for future in futures:
+                    future.result()
+                elapsed = time.perf_counter() - start
+            finally:
+                service.shutdown()
+
+            throughput = jobs / elapsed
+            self.stdout.write(
+                f"{processes:>3} processes: {throughput:8.1f} PDFs/s "
+                f"({throughput / baseline:.2f}x in-process)"
+            )
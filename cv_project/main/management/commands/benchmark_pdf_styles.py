@@ -0,0 +1,92 @@
+"""
+Compare per-PDF style construction with the shared theme registry.
+"""
+
+import time
+import tracemalloc
+
+from django.core.management.base import BaseCommand
+
+from main.benchmarks import synthetic_cv_data
+from main.pdf import PDFGenerator
+from main.pdf_styles import DEFAULT_THEME, THEME_PALETTES, build_theme, get_theme
+
+
+def _measure(func, iterations):
+    """Return (microseconds per call, peak bytes allocated per call)."""
+    func()  # warm-up so one-off imports and caches are not counted
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    elapsed_us = (time.perf_counter() - start) * 1_000_000 / iterations
+
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(min(iterations, 50)):
+            baseline = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+
+    return elapsed_us, sum(peaks) / len(peaks)
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-render style allocation against shared PDF themes."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--iterations", type=int, default=200, help="Calls per measurement."
+        )
+        parser.add_argument(
+            "--theme",
+            default=DEFAULT_THEME,
+            choices=sorted(THEME_PALETTES),
+            help="Theme to measure.",
+        )
+
+    def handle(self, *args, **options):
+        iterations = options["iterations"]
+        name = options["theme"]
+        palette = THEME_PALETTES[name]
+        data = synthetic_cv_data()
+
+        rows = [
+            (
+                "styles, per render",
+                _measure(lambda: build_theme(name, **palette), iterations),
+            ),
+            ("styles, shared", _measure(lambda: get_theme(name), iterations)),
+            (
+                "PDF, per-render styles",
+                _measure(
+                    lambda: PDFGenerator(
+                        data, theme=build_theme(name, **palette)
+                    ).generate(),
+                    max(iterations // 10, 1),
+                ),
+            ),
+            (
+                "PDF, shared styles",
+                _measure(
+                    lambda: PDFGenerator(data, theme=name).generate(),
+                    max(iterations // 10, 1),
+                ),
+            ),
+        ]
+
+        self.stdout.write(f"{'':<24}{'time/call':>14}{'peak alloc/call':>18}")
+        for label, (elapsed_us, peak_bytes) in rows:
+            self.stdout.write(
+                f"{label:<24}{elapsed_us:>11.1f} us{peak_bytes / 1024:>15.1f} KB"
+            )
+
+        (style_us, style_bytes), (shared_us, shared_bytes) = rows[0][1], rows[1][1]
+        self.stdout.write(
+            f"\nSaved per PDF: {style_us - shared_us:.1f} us, "
+            f"{(style_bytes - shared_bytes) / 1024:.1f} KB peak allocation"
+        )
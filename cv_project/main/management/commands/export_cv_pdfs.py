@@ -0,0 +1,71 @@
+"""
+Export the PDFs of many CVs into one ZIP archive.
+"""
+
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from main.pdf_export import filter_cvs, iter_cv_pdfs, stream_zip
+
+
+class Command(BaseCommand):
+    help = "Render CV PDFs in parallel and write them to a ZIP archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "output", help="Path of the ZIP file to write, or - for stdout."
+        )
+        parser.add_argument(
+            "--ids", default="", help="Comma-separated CV ids to export."
+        )
+        parser.add_argument(
+            "-q", "--query", default="", help="Search names, email and bio."
+        )
+        parser.add_argument(
+            "--created-from", help="Earliest creation date (YYYY-MM-DD)."
+        )
+        parser.add_argument("--created-to", help="Latest creation date (YYYY-MM-DD).")
+        parser.add_argument(
+            "--max-in-flight",
+            type=int,
+            default=None,
+            help="PDFs rendering at once (default: PDF_EXPORT_MAX_IN_FLIGHT).",
+        )
+
+    def handle(self, *args, **options):
+        ids = [pk for pk in options["ids"].split(",") if pk.strip()]
+        try:
+            queryset = filter_cvs(
+                ids=ids,
+                q=options["query"],
+                created_from=options["created_from"],
+                created_to=options["created_to"],
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        entries = iter_cv_pdfs(queryset, max_in_flight=options["max_in_flight"])
+        exported = []
+
+        def counted(entries):
+            for filename, data in entries:
+                if data is not None:
+                    exported.append(filename)
+                yield filename, data
+
+        if options["output"] == "-":
+            for chunk in stream_zip(counted(entries)):
+                sys.stdout.buffer.write(chunk)
+            sys.stdout.buffer.flush()
+            return
+
+        with open(options["output"], "wb") as output:
+            for chunk in stream_zip(counted(entries)):
+                output.write(chunk)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Exported {len(exported)} CV PDFs to {options['output']}"
+            )
+        )
@@ -0,0 +1,47 @@
+"""
+Run the asyncio email worker on the ``emails`` queue.
+
+Replaces the Celery worker for that queue: start Celery without it
+(``-Q celery,maintenance``) and run this alongside. See ``main.async_email``.
+"""
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from main.async_email import AsyncSMTPSender, EmailQueueWorker
+
+
+class Command(BaseCommand):
+    help = "Send queued CV emails with many concurrent SMTP sessions (asyncio)."
+
+    def add_arguments(self, parser):
+        config = getattr(settings, "EMAIL_ASYNC_WORKER", {})
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=config.get("CONCURRENCY", 100),
+            help="SMTP sessions kept in flight.",
+        )
+        parser.add_argument(
+            "--queue", default=config.get("QUEUE", "emails"), help="Queue to drain."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sender = AsyncSMTPSender(concurrency=options["concurrency"])
+        except ImportError:
+            raise CommandError(
+                "The email worker needs aiosmtplib: pip install aiosmtplib"
+            ) from None
+
+        worker = EmailQueueWorker(
+            sender, concurrency=options["concurrency"], queue_name=options["queue"]
+        )
+        self.stdout.write(
+            f"Email worker on {options['queue']!r}, "
+            f"{options['concurrency']} concurrent sends (Ctrl+C to stop)"
+        )
+        try:
+            worker.run()
+        except KeyboardInterrupt:
+            pass
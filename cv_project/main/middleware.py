@@ -26,6 +26,7 @@ class RequestLoggingMiddleware(MiddlewareMixin):
         "/favicon.ico",
         "/robots.txt",
         "/sitemap.xml",
+        "/metrics/",
     ]
 
     # File extensions to exclude
@@ -4,6 +4,7 @@ Models for the CV management system.
 
 from django.db import models
 from django.urls import reverse
+from django.utils import timezone
 
 
 class CV(models.Model):
@@ -53,6 +54,7 @@ class Skill(models.Model):
         default="intermediate",
         verbose_name="Proficiency Level",
     )
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Skill"
@@ -79,6 +81,7 @@ class Project(models.Model):
     url = models.URLField(blank=True, verbose_name="Project URL")
     start_date = models.DateField(verbose_name="Start Date")
     end_date = models.DateField(null=True, blank=True, verbose_name="End Date")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Project"
@@ -116,6 +119,7 @@ class Contact(models.Model):
     )
     value = models.CharField(max_length=200, verbose_name="Contact Value")
     url = models.URLField(verbose_name="Contact URL")
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Contact"
@@ -207,3 +211,128 @@ class RequestLog(models.Model):
             "avg_response_time": avg_response_time,
             "unique_ips": unique_ips,
         }
+
+
+class EmailDelivery(models.Model):
+    """
+    Model recording one CV emailed to one recipient.
+
+    Rows are written by the email tasks, so delivery status and history are
+    read from the database instead of the Celery result backend. A bulk
+    send writes one row per recipient, linked by ``batch_id``.
+    """
+
+    STATE_QUEUED = "queued"
+    STATE_SENDING = "sending"
+    STATE_RETRYING = "retrying"
+    STATE_SENT = "sent"
+    STATE_DUPLICATE = "duplicate"
+    STATE_FAILED = "failed"
+    STATE_CHOICES = [
+        (STATE_QUEUED, "Queued"),
+        (STATE_SENDING, "Sending"),
+        (STATE_RETRYING, "Retrying"),
+        (STATE_SENT, "Sent"),
+        (STATE_DUPLICATE, "Duplicate"),
+        (STATE_FAILED, "Failed"),
+    ]
+    FINISHED_STATES = (STATE_SENT, STATE_DUPLICATE, STATE_FAILED)
+
+    cv = models.ForeignKey(
+        CV,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="email_deliveries",
+    )
+    task_id = models.CharField(
+        max_length=255, unique=True, null=True, blank=True, verbose_name="Task ID"
+    )
+    batch_id = models.CharField(
+        max_length=255,
+        null=True,
+        blank=True,
+        db_index=True,
+        verbose_name="Bulk Task ID",
+    )
+    recipient = models.EmailField(verbose_name="Recipient")
+    language = models.CharField(max_length=50, blank=True, verbose_name="Language")
+    state = models.CharField(
+        max_length=20, choices=STATE_CHOICES, default=STATE_QUEUED, verbose_name="State"
+    )
+    attempts = models.PositiveIntegerField(default=0, verbose_name="Attempts")
+    error = models.TextField(blank=True, verbose_name="Last Error")
+    message_size = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name="Message Size (bytes)"
+    )
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name="Queued At")
+    started_at = models.DateTimeField(null=True, blank=True, verbose_name="Started At")
+    finished_at = models.DateTimeField(
+        null=True, blank=True, verbose_name="Finished At"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Email Delivery"
+        verbose_name_plural = "Email Deliveries"
+        ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["cv", "-created_at"]),
+            models.Index(fields=["recipient", "-created_at"]),
+            models.Index(fields=["state"]),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient} ({self.state})"
+
+    @property
+    def duration_ms(self):
+        """Milliseconds from the first attempt to the outcome."""
+        if self.started_at and self.finished_at:
+            return int((self.finished_at - self.started_at).total_seconds() * 1000)
+        return None
+
+    def mark(self, state, **fields):
+        """Move to ``state``, updating ``fields`` and the timestamps."""
+        self.state = state
+        for name, value in fields.items():
+            setattr(self, name, value)
+        update_fields = ["state", "updated_at", *fields]
+
+        if state == self.STATE_SENDING and self.started_at is None:
+            self.started_at = timezone.now()
+            update_fields.append("started_at")
+        if state in self.FINISHED_STATES:
+            self.finished_at = timezone.now()
+            update_fields.append("finished_at")
+
+        if self.pk is None:
+            self.save()
+        else:
+            self.save(update_fields=update_fields)
+
+
+class CVTranslation(models.Model):
+    """
+    Model storing one translated field of a CV.
+
+    ``field`` is ``"bio"``, ``"project:<pk>"`` or ``"skill:<pk>"``, and
+    ``source_hash`` identifies the text it was translated from, so editing a
+    CV only re-translates the fields whose text changed.
+    """
+
+    cv = models.ForeignKey(CV, on_delete=models.CASCADE, related_name="translations")
+    language = models.CharField(max_length=50, verbose_name="Language")
+    field = models.CharField(max_length=50, verbose_name="Field")
+    source_hash = models.CharField(max_length=64, verbose_name="Source Hash")
+    text = models.TextField(verbose_name="Translation")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="Translated At")
+
+    class Meta:
+        verbose_name = "CV Translation"
+        verbose_name_plural = "CV Translations"
+        ordering = ["language", "field"]
+        unique_together = ["cv", "language", "field"]
+
+    def __str__(self):
+        return f"{self.cv} - {self.language} {self.field}"
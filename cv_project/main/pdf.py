@@ -0,0 +1,472 @@
+"""
+PDF generation for CVs.
+
+The generator renders from ``CVData``, a plain snapshot of a CV and its
+related rows. Snapshots serialize to JSON-compatible dicts, so rendering can
+run in worker processes (see ``main.pdf_service``) without Django or a
+database connection. This module must stay free of Django model imports.
+"""
+
+from dataclasses import dataclass, field, replace
+from datetime import date, datetime
+from io import BytesIO
+
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+
+from .pdf_styles import (
+    DEFAULT_THEME,
+    STANDARD_FONTS,
+    PDFTheme,
+    get_theme,
+    register_unicode_font,
+)
+
+# Output modes. "compact" deflates page content streams, as ReportLab does by
+# default and as every earlier version of this app did; "fast" writes them
+# raw, trading larger files (about 1.4x to 4x) for somewhat quicker renders.
+PDF_MODE_COMPACT = "compact"
+PDF_MODE_FAST = "fast"
+PDF_MODES = (PDF_MODE_COMPACT, PDF_MODE_FAST)
+
+
+@dataclass(frozen=True)
+class SkillData:
+    """Snapshot of a skill as rendered in the PDF."""
+
+    name: str
+    proficiency: str
+    proficiency_display: str
+    id: int = None
+
+
+@dataclass(frozen=True)
+class ProjectData:
+    """Snapshot of a project as rendered in the PDF."""
+
+    title: str
+    description: str
+    technologies: str
+    url: str
+    start_date: date
+    end_date: date = None
+    id: int = None
+
+    @property
+    def is_ongoing(self):
+        return self.end_date is None
+
+    @property
+    def technologies_list(self):
+        return [tech.strip() for tech in self.technologies.split(",") if tech.strip()]
+
+
+@dataclass(frozen=True)
+class ContactData:
+    """Snapshot of a contact as rendered in the PDF."""
+
+    contact_type: str
+    contact_type_display: str
+    value: str
+    url: str
+
+
+@dataclass(frozen=True)
+class CVData:
+    """Immutable snapshot of everything ``PDFGenerator`` renders for a CV."""
+
+    firstname: str
+    lastname: str
+    email: str
+    phone: str
+    bio: str
+    updated_at: datetime
+    skills: tuple = field(default_factory=tuple)
+    projects: tuple = field(default_factory=tuple)
+    contacts: tuple = field(default_factory=tuple)
+    id: int = None
+
+    @property
+    def full_name(self):
+        return f"{self.firstname} {self.lastname}"
+
+    @classmethod
+    def from_cv(cls, cv):
+        """
+        Build a snapshot from a CV model instance.
+
+        Related rows are read through ``.all()``, so a CV loaded with
+        ``prefetch_related("skills", "projects", "contacts")`` is
+        snapshotted without further queries.
+        """
+        return cls(
+            id=cv.pk,
+            firstname=cv.firstname,
+            lastname=cv.lastname,
+            email=cv.email,
+            phone=cv.phone,
+            bio=cv.bio,
+            updated_at=cv.updated_at,
+            skills=tuple(
+                SkillData(
+                    id=skill.pk,
+                    name=skill.name,
+                    proficiency=skill.proficiency,
+                    proficiency_display=skill.get_proficiency_display(),
+                )
+                for skill in cv.skills.all()
+            ),
+            projects=tuple(
+                ProjectData(
+                    id=project.pk,
+                    title=project.title,
+                    description=project.description,
+                    technologies=project.technologies,
+                    url=project.url,
+                    start_date=project.start_date,
+                    end_date=project.end_date,
+                )
+                for project in cv.projects.all()
+            ),
+            contacts=tuple(
+                ContactData(
+                    contact_type=contact.contact_type,
+                    contact_type_display=contact.get_contact_type_display(),
+                    value=contact.value,
+                    url=contact.url,
+                )
+                for contact in cv.contacts.all()
+            ),
+        )
+
+    def to_dict(self):
+        """Return a JSON-compatible representation of the snapshot."""
+        return {
+            "id": self.id,
+            "firstname": self.firstname,
+            "lastname": self.lastname,
+            "email": self.email,
+            "phone": self.phone,
+            "bio": self.bio,
+            "updated_at": self.updated_at.isoformat(),
+            "skills": [
+                [skill.name, skill.proficiency, skill.proficiency_display, skill.id]
+                for skill in self.skills
+            ],
+            "projects": [
+                [
+                    project.title,
+                    project.description,
+                    project.technologies,
+                    project.url,
+                    project.start_date.isoformat(),
+                    project.end_date.isoformat() if project.end_date else None,
+                    project.id,
+                ]
+                for project in self.projects
+            ],
+            "contacts": [
+                [
+                    contact.contact_type,
+                    contact.contact_type_display,
+                    contact.value,
+                    contact.url,
+                ]
+                for contact in self.contacts
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a snapshot from the output of ``to_dict``."""
+        return cls(
+            id=data.get("id"),
+            firstname=data["firstname"],
+            lastname=data["lastname"],
+            email=data["email"],
+            phone=data["phone"],
+            bio=data["bio"],
+            updated_at=datetime.fromisoformat(data["updated_at"]),
+            skills=tuple(SkillData(*skill) for skill in data["skills"]),
+            projects=tuple(
+                ProjectData(
+                    title=title,
+                    description=description,
+                    technologies=technologies,
+                    url=url,
+                    start_date=date.fromisoformat(start_date),
+                    end_date=date.fromisoformat(end_date) if end_date else None,
+                    id=project_id,
+                )
+                for (
+                    title,
+                    description,
+                    technologies,
+                    url,
+                    start_date,
+                    end_date,
+                    project_id,
+                ) in data["projects"]
+            ),
+            contacts=tuple(ContactData(*contact) for contact in data["contacts"]),
+        )
+
+    def translated(self, translation):
+        """
+        Return a copy with the translated text from ``translate_cv_content``.
+
+        ``translation`` is the task's ``translated_data`` payload: ``bio``
+        plus ``skills`` and ``projects`` lists matched to rows by ``id``.
+        Rows missing from the payload keep their original text.
+        """
+        skills = {entry["id"]: entry for entry in translation.get("skills", [])}
+        projects = {entry["id"]: entry for entry in translation.get("projects", [])}
+
+        return replace(
+            self,
+            bio=translation.get("bio") or self.bio,
+            skills=tuple(
+                (
+                    replace(skill, name=skills[skill.id].get("name") or skill.name)
+                    if skill.id in skills
+                    else skill
+                )
+                for skill in self.skills
+            ),
+            projects=tuple(
+                (
+                    replace(
+                        project,
+                        title=projects[project.id].get("title") or project.title,
+                        description=projects[project.id].get("description")
+                        or project.description,
+                    )
+                    if project.id in projects
+                    else project
+                )
+                for project in self.projects
+            ),
+        )
+
+
+def needs_unicode_font(data):
+    """Return whether any text in ``data`` falls outside the standard fonts."""
+    texts = [data.firstname, data.lastname, data.email, data.phone, data.bio]
+    for skill in data.skills:
+        texts.extend([skill.name, skill.proficiency_display])
+    for project in data.projects:
+        texts.extend([project.title, project.description, project.technologies])
+    for contact in data.contacts:
+        texts.extend([contact.contact_type_display, contact.url])
+
+    try:
+        "".join(text or "" for text in texts).encode("cp1252")
+    except UnicodeEncodeError:
+        return True
+    return False
+
+
+class PDFGenerator:
+    """
+    Centralized PDF generation class to avoid code duplication.
+    Handles all PDF styling and content generation.
+
+    ``unicode_font`` is an optional ``(regular_path, bold_path)`` pair of
+    TrueType files, embedded as a glyph subset only when the CV contains
+    text the standard fonts cannot show. ``translation`` is a
+    ``translate_cv_content`` payload rendered in place of the original text.
+    """
+
+    def __init__(
+        self,
+        cv,
+        theme=DEFAULT_THEME,
+        mode=PDF_MODE_COMPACT,
+        unicode_font=None,
+        translation=None,
+    ):
+        if mode not in PDF_MODES:
+            raise ValueError(f"Unknown PDF mode: {mode}")
+
+        self.cv = cv
+        self.data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+        if translation:
+            self.data = self.data.translated(translation)
+        self.mode = mode
+        if isinstance(theme, PDFTheme):
+            self.theme = theme
+        else:
+            fonts = STANDARD_FONTS
+            if unicode_font and unicode_font[0] and needs_unicode_font(self.data):
+                fonts = register_unicode_font(*unicode_font)
+            self.theme = get_theme(theme, fonts=fonts)
+        self.buffer = BytesIO()
+        self.elements = []
+        self.styles = self.theme.styles
+
+    def _add_header(self):
+        """Add CV title and contact information."""
+        # Title
+        title = Paragraph(self.data.full_name, self.styles["title"])
+        self.elements.append(title)
+
+        # Contact info
+        contact_info = f"Email: {self.data.email}"
+        if self.data.phone:
+            contact_info += f" | Phone: {self.data.phone}"
+        contact_para = Paragraph(contact_info, self.styles["contact"])
+        self.elements.append(contact_para)
+        self.elements.append(Spacer(1, 20))
+
+    def _add_biography(self):
+        """Add professional summary section."""
+        bio_heading = Paragraph("Professional Summary", self.styles["heading"])
+        self.elements.append(bio_heading)
+        bio_content = Paragraph(self.data.bio, self.styles["normal"])
+        self.elements.append(bio_content)
+        self.elements.append(Spacer(1, 15))
+
+    def _add_skills(self):
+        """Add skills section with table layout."""
+        if not self.data.skills:
+            return
+
+        skills_heading = Paragraph("Core Skills", self.styles["heading"])
+        self.elements.append(skills_heading)
+
+        # Create skills table (2 columns)
+        skills_data = []
+        skills_row = []
+
+        for skill in self.data.skills:
+            skill_text = f"{skill.name}\n{skill.proficiency_display}"
+            skills_row.append(skill_text)
+
+            if len(skills_row) == 2:
+                skills_data.append(skills_row)
+                skills_row = []
+
+        # Add remaining skill if odd number
+        if skills_row:
+            skills_row.append("")
+            skills_data.append(skills_row)
+
+        if skills_data:
+            skills_table = Table(skills_data, colWidths=[3 * inch, 3 * inch])
+            skills_table.setStyle(self.theme.skills_table_style)
+            self.elements.append(skills_table)
+            self.elements.append(Spacer(1, 15))
+
+    def _add_projects(self):
+        """Add projects section."""
+        if not self.data.projects:
+            return
+
+        projects_heading = Paragraph("Professional Projects", self.styles["heading"])
+        self.elements.append(projects_heading)
+
+        for project in self.data.projects:
+            # Project title with ongoing indicator
+            project_title_text = f"<b>{project.title}</b>"
+            if project.is_ongoing:
+                project_title_text += (
+                    f" <font color='{self.theme.success}'>(Ongoing)</font>"
+                )
+
+            # Date range
+            date_range = f"{project.start_date.strftime('%b %Y')}"
+            if project.end_date:
+                date_range += f" - {project.end_date.strftime('%b %Y')}"
+            else:
+                date_range += " - Present"
+
+            # Add project elements
+            self.elements.append(Paragraph(project_title_text, self.styles["normal"]))
+            self.elements.append(
+                Paragraph(
+                    f"<font color='{self.theme.muted}'>{date_range}</font>",
+                    self.styles["normal"],
+                )
+            )
+            self.elements.append(Paragraph(project.description, self.styles["normal"]))
+
+            # Technologies
+            if project.technologies_list:
+                tech_text = "<b>Technologies:</b> " + ", ".join(
+                    project.technologies_list
+                )
+                self.elements.append(Paragraph(tech_text, self.styles["normal"]))
+
+            # URL
+            if project.url:
+                url_text = f"<b>URL:</b> <font color='{self.theme.accent}'>{project.url}</font>"
+                self.elements.append(Paragraph(url_text, self.styles["normal"]))
+
+            self.elements.append(Spacer(1, 12))
+
+    def _add_contacts(self):
+        """Add contact information section."""
+        if not self.data.contacts:
+            return
+
+        contacts_heading = Paragraph("Contact & Social Media", self.styles["heading"])
+        self.elements.append(contacts_heading)
+
+        contacts_data = []
+        for contact in self.data.contacts:
+            contacts_data.append([contact.contact_type_display, contact.url])
+
+        if contacts_data:
+            contacts_table = Table(contacts_data, colWidths=[2 * inch, 4 * inch])
+            contacts_table.setStyle(self.theme.contacts_table_style)
+            self.elements.append(contacts_table)
+
+    def _add_footer(self):
+        """Add footer with generation date."""
+        self.elements.append(Spacer(1, 30))
+        footer_text = f"Generated on {self.data.updated_at.strftime('%B %d, %Y')} | {self.data.full_name} Professional CV"
+        footer_para = Paragraph(footer_text, self.styles["contact"])
+        self.elements.append(footer_para)
+
+    def generate(self):
+        """Generate the complete PDF and return the buffer."""
+        # Create PDF document
+        doc = SimpleDocTemplate(
+            self.buffer,
+            pagesize=A4,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18,
+            # Byte-identical output for identical content, so the content
+            # hash is a valid strong ETag for the rendered document
+            invariant=1,
+            pageCompression=1 if self.mode == PDF_MODE_COMPACT else 0,
+        )
+
+        # Add all sections
+        self._add_header()
+        self._add_biography()
+        self._add_skills()
+        self._add_projects()
+        self._add_contacts()
+        self._add_footer()
+
+        # Build PDF
+        doc.build(self.elements)
+
+        return self.buffer
+
+
+def render_cv_pdf_data(data, **options):
+    """
+    Render a serialized ``CVData`` dict to PDF bytes.
+
+    Entry point for worker processes: takes and returns only plain,
+    picklable values. ``options`` are ``PDFGenerator`` keyword arguments.
+    """
+    buffer = PDFGenerator(CVData.from_dict(data), **options).generate()
+    pdf = buffer.getvalue()
+    buffer.close()
+    return pdf
@@ -0,0 +1,336 @@
+"""
+Content-addressed cache for generated CV PDFs.
+
+Entries are namespaced by CV id and keyed by a hash of everything that ends
+up in the rendered document, so an unchanged CV always maps to the same
+entry while any edit produces a new key. Stale entries for a CV are dropped
+by the model signals in ``main.signals``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils.module_loading import import_string
+
+from .pdf import PDF_MODE_COMPACT, CVData
+from .pdf_styles import DEFAULT_THEME
+
+logger = logging.getLogger(__name__)
+
+# Bump when the PDF layout changes so previously cached documents are ignored.
+PDF_LAYOUT_VERSION = 2
+
+
+def pdf_render_options(mode=None, translation=None):
+    """
+    Return the ``PDFGenerator`` keyword arguments configured in settings.
+
+    ``mode`` defaults to ``PDF_DOWNLOAD_MODE``; the email task passes
+    ``PDF_EMAIL_MODE``. A ``translation`` payload is included only when
+    given, so each language is cached as its own variant.
+    """
+    font = getattr(settings, "PDF_UNICODE_FONT", {})
+    options = {
+        "theme": getattr(settings, "PDF_THEME", DEFAULT_THEME),
+        "mode": mode or getattr(settings, "PDF_DOWNLOAD_MODE", PDF_MODE_COMPACT),
+        "unicode_font": (
+            (font["REGULAR"], font.get("BOLD") or None) if font.get("REGULAR") else None
+        ),
+    }
+    if translation:
+        options["translation"] = translation
+    return options
+
+
+def cv_content_hash(cv, options=None):
+    """
+    Return a stable hash of the CV content that is rendered into the PDF.
+
+    Accepts a CV model instance or a ``CVData`` snapshot. Hashing the
+    snapshot that is also handed to ``PDFGenerator`` means the key and the
+    rendered document always describe the same state of the CV. ``options``
+    are the render options (see ``pdf_render_options``), so each output
+    mode and theme is cached separately.
+    """
+    data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+    payload = {
+        "layout": PDF_LAYOUT_VERSION,
+        "options": options or pdf_render_options(),
+        "cv": data.to_dict(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def cv_last_modified(cv):
+    """
+    Return the newest ``updated_at`` across a CV and its related rows.
+
+    Like ``CVData.from_cv``, reads relations through ``.all()`` so a
+    prefetched CV costs no queries.
+    """
+    timestamps = [cv.updated_at]
+    for related in (cv.skills.all(), cv.projects.all(), cv.contacts.all()):
+        timestamps.extend(row.updated_at for row in related)
+    return max(timestamp for timestamp in timestamps if timestamp is not None)
+
+
+class BasePDFCache:
+    """Interface shared by all PDF cache backends."""
+
+    def __init__(self, **options):
+        self._stats_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, cv_id, key):
+        """Return cached PDF bytes or ``None``."""
+        raise NotImplementedError
+
+    def get_path(self, cv_id, key):
+        """
+        Return the filesystem path of a cached PDF, or ``None``.
+
+        Only disk-backed caches can hand out paths; others always return
+        ``None`` so callers fall back to ``get``.
+        """
+        return None
+
+    def set(self, cv_id, key, data):
+        """Store PDF bytes for a CV under ``key``."""
+        raise NotImplementedError
+
+    def invalidate(self, cv_id):
+        """Drop every cached PDF for a CV."""
+        raise NotImplementedError
+
+    def clear(self):
+        """Drop every cached PDF."""
+        raise NotImplementedError
+
+    def _record(self, hit):
+        with self._stats_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def stats(self):
+        """Return hit and miss counters for this process."""
+        with self._stats_lock:
+            return {"hits": self.hits, "misses": self.misses}
+
+
+class DummyPDFCache(BasePDFCache):
+    """Backend that never stores anything (used in tests)."""
+
+    def get(self, cv_id, key):
+        self._record(False)
+        return None
+
+    def set(self, cv_id, key, data):
+        pass
+
+    def invalidate(self, cv_id):
+        pass
+
+    def clear(self):
+        pass
+
+
+class FileSystemPDFCache(BasePDFCache):
+    """
+    Local-disk backend with size-bound LRU eviction.
+
+    Files live at ``<location>/<cv_id>/<key>.pdf``. Reads refresh the file's
+    modification time, and writes evict the least recently used files once
+    the directory grows past ``max_size`` bytes.
+    """
+
+    def __init__(self, location, max_size=256 * 1024 * 1024, **options):
+        super().__init__(**options)
+        self.location = Path(location)
+        self.max_size = max_size
+
+    def path(self, cv_id, key):
+        """Return the on-disk path for a cache entry."""
+        return self.location / str(cv_id) / f"{key}.pdf"
+
+    def get(self, cv_id, key):
+        path = self.path(cv_id, key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            self._record(False)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self._record(True)
+        return data
+
+    def get_path(self, cv_id, key):
+        path = self.path(cv_id, key)
+        try:
+            os.utime(path)
+        except OSError:
+            self._record(False)
+            return None
+
+        self._record(True)
+        return path
+
+    def set(self, cv_id, key, data):
+        path = self.path(cv_id, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Write to a temporary file first so readers never see partial PDFs
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning(f"Failed to write cached PDF {path}", exc_info=True)
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+
+        self._cull()
+
+    def invalidate(self, cv_id):
+        shutil.rmtree(self.location / str(cv_id), ignore_errors=True)
+
+    def clear(self):
+        shutil.rmtree(self.location, ignore_errors=True)
+
+    def _cull(self):
+        """Evict least recently used files until under ``max_size``."""
+        if not self.max_size:
+            return
+
+        entries = []
+        total_size = 0
+        for path in self.location.glob("*/*.pdf"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total_size += stat.st_size
+
+        if total_size <= self.max_size:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total_size -= size
+            if total_size <= self.max_size:
+                break
+
+
+class DjangoCachePDFCache(BasePDFCache):
+    """
+    Backend storing PDFs in a Django cache alias (Redis in production).
+
+    Eviction is delegated to the cache server (``maxmemory-policy allkeys-lru``
+    for Redis); documents larger than ``max_entry_size`` are not cached.
+    """
+
+    def __init__(
+        self,
+        cache_alias="default",
+        timeout=7 * 24 * 3600,
+        max_entry_size=5 * 1024 * 1024,
+        **options,
+    ):
+        super().__init__(**options)
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self.max_entry_size = max_entry_size
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _key(self, cv_id, key):
+        return f"pdf:{cv_id}:{key}"
+
+    def _index_key(self, cv_id):
+        return f"pdf:index:{cv_id}"
+
+    def get(self, cv_id, key):
+        data = self.cache.get(self._key(cv_id, key))
+        self._record(data is not None)
+        return data
+
+    def set(self, cv_id, key, data):
+        if self.max_entry_size and len(data) > self.max_entry_size:
+            return
+
+        cache_key = self._key(cv_id, key)
+        self.cache.set(cache_key, data, self.timeout)
+
+        index = set(self.cache.get(self._index_key(cv_id)) or ())
+        index.add(cache_key)
+        self.cache.set(self._index_key(cv_id), index, self.timeout)
+
+    def invalidate(self, cv_id):
+        index = self.cache.get(self._index_key(cv_id)) or ()
+        self.cache.delete_many([*index, self._index_key(cv_id)])
+
+    def clear(self):
+        delete_pattern = getattr(self.cache, "delete_pattern", None)
+        if delete_pattern is not None:
+            delete_pattern("pdf:*")
+
+
+_pdf_cache = None
+_pdf_cache_lock = threading.Lock()
+
+
+def get_pdf_cache():
+    """Return the process-wide PDF cache configured by ``PDF_CACHE``."""
+    global _pdf_cache
+
+    if _pdf_cache is None:
+        with _pdf_cache_lock:
+            if _pdf_cache is None:
+                config = dict(
+                    getattr(
+                        settings,
+                        "PDF_CACHE",
+                        {"BACKEND": "main.pdf_cache.DummyPDFCache"},
+                    )
+                )
+                backend = import_string(config.pop("BACKEND"))
+                options = {name.lower(): value for name, value in config.items()}
+                _pdf_cache = backend(**options)
+
+    return _pdf_cache
+
+
+@receiver(setting_changed)
+def _reset_pdf_cache(setting, **kwargs):
+    """Rebuild the PDF cache when ``PDF_CACHE`` is overridden."""
+    global _pdf_cache
+
+    if setting == "PDF_CACHE":
+        _pdf_cache = None
@@ -0,0 +1,182 @@
+"""
+Bulk export of CV PDFs as a streamed ZIP archive.
+
+CVs are read in chunks, rendered through the PDF cache and the render pool
+with a bounded number of jobs in flight, and written into a ZIP archive that
+is emitted chunk by chunk. Memory use depends on ``max_in_flight`` and the
+size of a single PDF, not on the number of CVs in the archive.
+"""
+
+import logging
+import time
+import zipfile
+from collections import deque
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_date
+
+from .models import CV
+from .pdf import CVData
+from .pdf_cache import cv_content_hash, get_pdf_cache, pdf_render_options
+from .pdf_service import PDFRenderError, get_pdf_render_service
+
+logger = logging.getLogger(__name__)
+
+
+def filter_cvs(ids=None, q=None, created_from=None, created_to=None):
+    """
+    Return the CVs selected for export, oldest first.
+
+    ``ids`` is an iterable of primary keys, ``q`` a case-insensitive search
+    over names, email and bio, and ``created_from``/``created_to`` inclusive
+    ``YYYY-MM-DD`` dates. Raises ``ValueError`` for malformed dates.
+    """
+    queryset = CV.objects.all()
+
+    if ids:
+        queryset = queryset.filter(pk__in=[int(pk) for pk in ids])
+
+    if q:
+        queryset = queryset.filter(
+            Q(firstname__icontains=q)
+            | Q(lastname__icontains=q)
+            | Q(email__icontains=q)
+            | Q(bio__icontains=q)
+        )
+
+    if created_from:
+        date_from = parse_date(created_from)
+        if date_from is None:
+            raise ValueError(f"Invalid date: {created_from}")
+        queryset = queryset.filter(created_at__date__gte=date_from)
+
+    if created_to:
+        date_to = parse_date(created_to)
+        if date_to is None:
+            raise ValueError(f"Invalid date: {created_to}")
+        queryset = queryset.filter(created_at__date__lt=date_to + timedelta(days=1))
+
+    return queryset.order_by("created_at", "pk")
+
+
+def export_filename(data):
+    """Return the archive member name for a CV snapshot."""
+    return f"{data.full_name.replace(' ', '_')}_CV_{data.id}.pdf"
+
+
+def iter_cv_pdfs(queryset, max_in_flight=None, chunk_size=100):
+    """
+    Yield ``(filename, pdf_bytes)`` for each CV in ``queryset``, in order.
+
+    Cached PDFs are yielded as they are read; misses are rendered in the
+    render pool with at most ``max_in_flight`` jobs outstanding, or in this
+    process when the pool is disabled. A CV that fails to render is yielded
+    with ``None`` instead of PDF bytes.
+    """
+    from .views import generate_cv_pdf_buffer
+
+    if max_in_flight is None:
+        max_in_flight = getattr(settings, "PDF_EXPORT_MAX_IN_FLIGHT", 8)
+
+    pdf_cache = get_pdf_cache()
+    service = get_pdf_render_service()
+    options = pdf_render_options()
+    pending = deque()
+
+    def finish(entry):
+        data, content_hash, future, pdf = entry
+        if future is not None:
+            try:
+                pdf = future.result(timeout=service.timeout)
+                pdf_cache.set(data.id, content_hash, pdf)
+            except Exception as e:
+                logger.error(f"Failed to export PDF for CV {data.id}: {str(e)}")
+                pdf = None
+        return export_filename(data), pdf
+
+    cvs = queryset.prefetch_related("skills", "projects", "contacts").iterator(
+        chunk_size=chunk_size
+    )
+    for cv in cvs:
+        data = CVData.from_cv(cv)
+        content_hash = cv_content_hash(data, options)
+        pdf = pdf_cache.get(data.id, content_hash)
+        future = None
+
+        if pdf is None and service is not None:
+            try:
+                future = service.submit(data.to_dict(), **options)
+            except PDFRenderError:
+                # Pool saturated by other traffic: render this one inline
+                future = None
+
+        if pdf is None and future is None:
+            try:
+                buffer = generate_cv_pdf_buffer(data)
+                pdf = buffer.getvalue()
+                buffer.close()
+                pdf_cache.set(data.id, content_hash, pdf)
+            except Exception as e:
+                logger.error(f"Failed to export PDF for CV {data.id}: {str(e)}")
+
+        pending.append((data, content_hash, future, pdf))
+        while pending and (
+            len(pending) >= max_in_flight
+            or pending[0][2] is None
+            or pending[0][2].done()
+        ):
+            yield finish(pending.popleft())
+
+    while pending:
+        yield finish(pending.popleft())
+
+
+class _ZipOutput:
+    """Write-only, non-seekable sink that hands written bytes back in chunks."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def stream_zip(entries):
+    """
+    Yield a ZIP archive of ``(filename, data)`` entries chunk by chunk.
+
+    Entries whose data is ``None`` are listed in an ``errors.txt`` member
+    instead. PDFs are already compressed, so members are stored as is.
+    """
+    output = _ZipOutput()
+    failed = []
+    date_time = time.localtime()[:6]
+
+    with zipfile.ZipFile(output, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for filename, data in entries:
+            if data is None:
+                failed.append(filename)
+                continue
+            archive.writestr(zipfile.ZipInfo(filename, date_time), data)
+            chunk = output.drain()
+            if chunk:
+                yield chunk
+
+        if failed:
+            archive.writestr(
+                zipfile.ZipInfo("errors.txt", date_time),
+                "Failed to render:\n" + "\n".join(failed) + "\n",
+            )
+
+    yield output.drain()
@@ -0,0 +1,110 @@
+"""
+Signed, expiring download links for emailed CV PDFs.
+
+PDFs larger than ``EMAIL_PDF_LINKS["THRESHOLD"]`` bytes are not attached to
+CV emails; they are stored under ``LOCATION`` and the email carries a link
+to ``cv_pdf_link`` instead. Stored files are content-addressed, so a bulk
+send stores one file for all its recipients. The link token is signed with
+``SECRET_KEY`` and names the file and download filename; it stops working
+``MAX_AGE`` seconds after it was issued, and ``cleanup_pdf_links`` removes
+files no link can reach any more.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core import signing
+from django.urls import reverse
+from django.utils import timezone
+
+SIGNING_SALT = "main.pdf_links"
+
+
+def _config():
+    return getattr(settings, "EMAIL_PDF_LINKS", {})
+
+
+def pdf_links_location():
+    """Return the directory holding linked PDFs."""
+    return Path(
+        _config().get("LOCATION", Path(settings.BASE_DIR) / "media" / "pdf_links")
+    )
+
+
+def pdf_link_max_age():
+    """Return how many seconds a download link stays valid."""
+    return _config().get("MAX_AGE", 7 * 24 * 3600)
+
+
+def should_link_pdf(pdf):
+    """Return whether ``pdf`` is large enough to be linked, not attached."""
+    threshold = _config().get("THRESHOLD", 0)
+    return bool(threshold) and len(pdf) > threshold
+
+
+def store_linked_pdf(cv_id, pdf):
+    """
+    Store ``pdf`` for download links and return its name.
+
+    A file stored more than ``MAX_AGE`` seconds ago is rewritten, so it
+    outlives every link issued now (see ``cleanup_pdf_links``).
+    """
+    name = f"{cv_id}/{hashlib.sha256(pdf).hexdigest()[:32]}.pdf"
+    path = pdf_links_location() / name
+    try:
+        if time.time() - path.stat().st_mtime < pdf_link_max_age():
+            return name
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temporary file first so downloads never see partial PDFs
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            tmp_file.write(pdf)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    return name
+
+
+def make_pdf_link(name, filename):
+    """Return the absolute signed download URL and its expiry time."""
+    token = signing.dumps({"p": name, "f": filename}, salt=SIGNING_SALT)
+    url = settings.SITE_URL.rstrip("/") + reverse("cv_pdf_link", args=[token])
+    return url, timezone.now() + timedelta(seconds=pdf_link_max_age())
+
+
+def resolve_pdf_link(token):
+    """
+    Return the stored file path and download filename for ``token``.
+
+    Raises ``signing.SignatureExpired`` for expired links and
+    ``signing.BadSignature`` for tampered ones.
+    """
+    data = signing.loads(token, salt=SIGNING_SALT, max_age=pdf_link_max_age())
+    return pdf_links_location() / data["p"], data["f"]
+
+
+def cleanup_pdf_links():
+    """Delete stored PDFs that no unexpired link can point to; return the count."""
+    cutoff = time.time() - 2 * pdf_link_max_age()
+    deleted = 0
+    for path in pdf_links_location().glob("*/*.pdf"):
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+                deleted += 1
+        except OSError:
+            continue
+    return deleted
@@ -0,0 +1,188 @@
+"""
+Process-pool PDF rendering service.
+
+ReportLab layout is CPU-bound pure Python and holds the GIL, so rendering in
+the web or Celery worker blocks everything else in that process. This
+service hands serialized ``CVData`` dicts to a pool of worker processes,
+bounds the number of queued jobs and enforces a per-job timeout.
+"""
+
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .pdf import render_cv_pdf_data
+
+logger = logging.getLogger(__name__)
+
+
+class PDFRenderError(Exception):
+    """Base class for PDF rendering service errors."""
+
+
+class PDFRenderQueueFull(PDFRenderError):
+    """Raised when the render queue has no free slot."""
+
+
+class PDFRenderTimeout(PDFRenderError):
+    """Raised when a render job exceeds its timeout."""
+
+
+class PDFRenderService:
+    """
+    Bounded process pool for PDF rendering.
+
+    At most ``processes + max_queue`` jobs are accepted at once; further
+    submissions wait up to ``queue_timeout`` seconds for a slot and then
+    fail with ``PDFRenderQueueFull``. A job running longer than ``timeout``
+    raises ``PDFRenderTimeout`` and the pool is recycled so the stuck worker
+    does not hold a process slot. Other jobs lost with the recycled (or
+    otherwise broken) pool are run again once on a fresh one.
+    """
+
+    def __init__(
+        self,
+        processes,
+        max_queue=32,
+        timeout=30,
+        queue_timeout=5,
+        start_method="spawn",
+    ):
+        self.processes = processes
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.queue_timeout = queue_timeout
+        self.start_method = start_method
+        self._slots = threading.BoundedSemaphore(processes + max_queue)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context(self.start_method),
+                )
+            return self._executor
+
+    def submit(self, data, **options):
+        """
+        Queue a serialized CV for rendering and return a future.
+
+        ``options`` are passed on to ``render_cv_pdf_data``. The caller's
+        slot is released when the job finishes.
+        """
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise PDFRenderQueueFull("PDF render queue is full")
+
+        try:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(render_cv_pdf_data, data, **options)
+            except BrokenProcessPool:
+                # A worker died since the last job: start a fresh pool
+                self._discard(executor)
+                future = self._get_executor().submit(
+                    render_cv_pdf_data, data, **options
+                )
+        except Exception:
+            self._slots.release()
+            raise
+
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def render(self, data, timeout=None, **options):
+        """Render a serialized CV and return the PDF bytes."""
+        for attempt in range(2):
+            future = self.submit(data, **options)
+            try:
+                return future.result(timeout=timeout or self.timeout)
+            except FutureTimeoutError:
+                logger.error("PDF render exceeded %ss, recycling pool", self.timeout)
+                self.restart()
+                raise PDFRenderTimeout(f"PDF rendering exceeded {self.timeout}s")
+            except BrokenProcessPool as e:
+                # Another job's timeout recycled the pool, or a worker died
+                if attempt:
+                    raise PDFRenderError(f"PDF render pool failed: {str(e)}") from e
+                logger.warning("PDF render pool broke, retrying: %s", e)
+
+    def restart(self):
+        """Terminate the current worker processes and start a fresh pool."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        if executor is None:
+            return
+
+        terminate_workers = getattr(executor, "terminate_workers", None)
+        if terminate_workers is not None:
+            terminate_workers()
+        else:
+            # Python < 3.14 has no public API to stop a busy worker
+            for process in list(getattr(executor, "_processes", {}).values()):
+                process.terminate()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _discard(self, executor):
+        """Drop ``executor`` if it is still the current pool."""
+        with self._executor_lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self, wait=True):
+        """Stop the worker processes."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_pdf_render_service():
+    """
+    Return the process-wide render service, or ``None`` when disabled.
+
+    Rendering happens in-process when ``PDF_RENDER_POOL["PROCESSES"]`` is 0.
+    """
+    global _service
+
+    config = getattr(settings, "PDF_RENDER_POOL", {})
+    if not config.get("PROCESSES"):
+        return None
+
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = PDFRenderService(
+                    processes=config["PROCESSES"],
+                    max_queue=config.get("MAX_QUEUE", 32),
+                    timeout=config.get("TIMEOUT", 30),
+                    queue_timeout=config.get("QUEUE_TIMEOUT", 5),
+                    start_method=config.get("START_METHOD", "spawn"),
+                )
+    return _service
+
+
+@receiver(setting_changed)
+def _reset_pdf_render_service(setting, **kwargs):
+    """Drop the render service when ``PDF_RENDER_POOL`` is overridden."""
+    global _service
+
+    if setting == "PDF_RENDER_POOL" and _service is not None:
+        _service.shutdown(wait=False)
+        _service = None
@@ -0,0 +1,159 @@
+"""
+Single-flight deduplication of concurrent PDF renders.
+
+When many requests ask for the same uncached PDF at once (a shared CV link),
+only the first one renders; the rest wait for it and reuse the result.
+Within a process the waiters share an in-memory flight, across processes
+and nodes the renderer holds a lock in the Django cache (Redis) so other
+nodes wait and then read the stored PDF instead of rendering it again.
+Every wait is bounded: a render that takes longer than ``timeout`` never
+blocks anyone for longer, waiters then render themselves.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    """One in-progress call shared by its leader and waiters."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Run a function at most once at a time per key.
+
+    ``lock_cache`` names a Django cache alias whose backend provides
+    ``lock()`` (django-redis does); without one, deduplication stays
+    within the current process.
+    """
+
+    def __init__(self, timeout=30, lock_cache=None):
+        self.timeout = timeout
+        self.lock_cache = lock_cache
+        self._flights = {}
+        self._flights_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {"leaders": 0, "waiters": 0, "timeouts": 0}
+
+    def do(self, key, fn, lookup=None):
+        """
+        Return ``fn()``, sharing one call between concurrent callers of ``key``.
+
+        ``lookup`` returns the stored result or ``None``; it is checked after
+        waiting for another node's lock so their render is reused. If the
+        leader raises, its waiters get the same exception.
+        """
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            self._count("waiters")
+            if flight.done.wait(self.timeout):
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+
+            self._count("timeouts")
+            logger.warning(f"Gave up waiting {self.timeout}s for render {key}")
+            return fn()
+
+        self._count("leaders")
+        try:
+            flight.result = self._run_locked(key, fn, lookup)
+            return flight.result
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
+    def _run_locked(self, key, fn, lookup):
+        """Run ``fn`` while holding the cross-node lock for ``key``."""
+        lock = self._distributed_lock(key)
+        if lock is None:
+            return fn()
+
+        try:
+            acquired = lock.acquire(blocking=True, blocking_timeout=self.timeout)
+        except Exception as e:
+            logger.warning(f"Render lock unavailable for {key}: {str(e)}")
+            return fn()
+
+        if not acquired:
+            self._count("timeouts")
+            logger.warning(f"Gave up waiting {self.timeout}s for render lock {key}")
+            return fn()
+
+        try:
+            # Another node may have rendered while we waited for the lock
+            result = lookup() if lookup is not None else None
+            return result if result is not None else fn()
+        finally:
+            try:
+                lock.release()
+            except Exception:
+                # The lock expired during a slow render; nothing to release
+                pass
+
+    def _distributed_lock(self, key):
+        if not self.lock_cache:
+            return None
+
+        make_lock = getattr(caches[self.lock_cache], "lock", None)
+        if make_lock is None:
+            return None
+        return make_lock(f"pdf:render-lock:{key}", timeout=self.timeout)
+
+    def _count(self, name):
+        with self._stats_lock:
+            self._stats[name] += 1
+
+    def stats(self):
+        """Return leader, waiter and timeout counters for this process."""
+        with self._stats_lock:
+            return dict(self._stats)
+
+
+_single_flight = None
+_single_flight_lock = threading.Lock()
+
+
+def get_pdf_single_flight():
+    """Return the process-wide single-flight group (see ``PDF_SINGLE_FLIGHT``)."""
+    global _single_flight
+
+    if _single_flight is None:
+        with _single_flight_lock:
+            if _single_flight is None:
+                config = getattr(settings, "PDF_SINGLE_FLIGHT", {})
+                _single_flight = SingleFlight(
+                    timeout=config.get("TIMEOUT", 30),
+                    lock_cache=config.get("LOCK_CACHE"),
+                )
+    return _single_flight
+
+
+@receiver(setting_changed)
+def _reset_pdf_single_flight(setting, **kwargs):
+    """Drop the single-flight group when ``PDF_SINGLE_FLIGHT`` is overridden."""
+    global _single_flight
+
+    if setting == "PDF_SINGLE_FLIGHT":
+        _single_flight = None
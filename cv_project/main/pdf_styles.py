@@ -0,0 +1,230 @@
+"""
+Shared PDF themes for CV rendering.
+
+Paragraph styles, table styles and colours are built once per process the
+first time a theme is requested and then shared by every render. ReportLab
+only reads styles while laying out a document, so a theme must be treated as
+read-only: never mutate its styles, derive a new theme instead. Like
+``main.pdf`` this module is Django-free so worker processes can import it.
+"""
+
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+from reportlab.platypus import TableStyle
+
+DEFAULT_THEME = "default"
+
+# Built-in Type 1 fonts: never embedded, but limited to the cp1252 charset.
+STANDARD_FONTS = ("Helvetica", "Helvetica-Bold")
+
+# Colour palettes for the built-in themes. ``accent`` drives headings and
+# links, ``muted`` secondary text, ``success`` the ongoing-project marker.
+THEME_PALETTES = {
+    "default": {
+        "accent": "#007bff",
+        "muted": "#666666",
+        "success": "#28a745",
+        "background": "#f8f9fa",
+        "grid": "#e9ecef",
+    },
+    "monochrome": {
+        "accent": "#212529",
+        "muted": "#6c757d",
+        "success": "#343a40",
+        "background": "#ffffff",
+        "grid": "#adb5bd",
+    },
+    "forest": {
+        "accent": "#2d6a4f",
+        "muted": "#52606d",
+        "success": "#40916c",
+        "background": "#f1f8f4",
+        "grid": "#d8f3dc",
+    },
+}
+
+
+@dataclass(frozen=True)
+class PDFTheme:
+    """Read-only bundle of everything ``PDFGenerator`` styles with."""
+
+    name: str
+    styles: MappingProxyType
+    skills_table_style: TableStyle
+    contacts_table_style: TableStyle
+    accent: str
+    muted: str
+    success: str
+
+
+def build_theme(name, accent, muted, success, background, grid, fonts=STANDARD_FONTS):
+    """
+    Construct a fresh theme from a colour palette.
+
+    ``fonts`` is a ``(regular, bold)`` pair of registered font names.
+    """
+    regular_font, bold_font = fonts
+    base_styles = getSampleStyleSheet()
+    accent_color = colors.HexColor(accent)
+    muted_color = colors.HexColor(muted)
+    background_color = colors.HexColor(background)
+    grid_color = colors.HexColor(grid)
+
+    styles = {
+        "title": ParagraphStyle(
+            f"{name}:CustomTitle",
+            parent=base_styles["Heading1"],
+            fontName=bold_font,
+            fontSize=24,
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            textColor=accent_color,
+        ),
+        "heading": ParagraphStyle(
+            f"{name}:CustomHeading",
+            parent=base_styles["Heading2"],
+            fontName=bold_font,
+            fontSize=16,
+            spaceAfter=12,
+            spaceBefore=20,
+            textColor=accent_color,
+            borderWidth=1,
+            borderColor=accent_color,
+            borderPadding=5,
+            backColor=background_color,
+        ),
+        "normal": ParagraphStyle(
+            f"{name}:CustomNormal",
+            parent=base_styles["Normal"],
+            fontName=regular_font,
+            fontSize=11,
+            spaceAfter=12,
+            alignment=TA_JUSTIFY,
+        ),
+        "contact": ParagraphStyle(
+            f"{name}:ContactStyle",
+            parent=base_styles["Normal"],
+            fontName=regular_font,
+            fontSize=10,
+            spaceAfter=6,
+            alignment=TA_CENTER,
+            textColor=muted_color,
+        ),
+    }
+
+    skills_table_style = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, -1), background_color),
+            ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("FONTNAME", (0, 0), (-1, -1), regular_font),
+            ("FONTSIZE", (0, 0), (-1, -1), 11),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
+            ("TOPPADDING", (0, 0), (-1, -1), 12),
+            ("LEFTPADDING", (0, 0), (-1, -1), 10),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+            ("GRID", (0, 0), (-1, -1), 1, grid_color),
+        ]
+    )
+    contacts_table_style = TableStyle(
+        [
+            ("BACKGROUND", (0, 0), (-1, -1), background_color),
+            ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
+            ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("FONTNAME", (0, 0), (0, -1), bold_font),
+            ("FONTNAME", (1, 0), (1, -1), regular_font),
+            ("FONTSIZE", (0, 0), (-1, -1), 10),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+            ("TOPPADDING", (0, 0), (-1, -1), 8),
+            ("LEFTPADDING", (0, 0), (-1, -1), 10),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 10),
+            ("GRID", (0, 0), (-1, -1), 1, grid_color),
+            ("TEXTCOLOR", (1, 0), (1, -1), accent_color),
+        ]
+    )
+
+    return PDFTheme(
+        name=name if fonts == STANDARD_FONTS else f"{name}:{regular_font}",
+        styles=MappingProxyType(styles),
+        skills_table_style=skills_table_style,
+        contacts_table_style=contacts_table_style,
+        accent=accent,
+        muted=muted,
+        success=success,
+    )
+
+
+_themes = {}
+_themes_lock = threading.Lock()
+_fonts = {}
+_fonts_lock = threading.Lock()
+
+
+def get_theme(name=DEFAULT_THEME, fonts=STANDARD_FONTS):
+    """
+    Return the shared theme called ``name``, building it on first use.
+
+    Each ``fonts`` pair gets its own shared variant of the theme. Raises
+    ``ValueError`` for names missing from ``THEME_PALETTES``.
+    """
+    key = (name, fonts)
+    theme = _themes.get(key)
+    if theme is not None:
+        return theme
+
+    with _themes_lock:
+        theme = _themes.get(key)
+        if theme is None:
+            try:
+                palette = THEME_PALETTES[name]
+            except KeyError:
+                raise ValueError(f"Unknown PDF theme: {name}") from None
+            theme = _themes[key] = build_theme(name, fonts=fonts, **palette)
+    return theme
+
+
+def register_theme(name, **palette):
+    """Add or replace a theme palette; the theme is rebuilt on next use."""
+    with _themes_lock:
+        THEME_PALETTES[name] = palette
+        for key in [key for key in _themes if key[0] == name]:
+            del _themes[key]
+
+
+def register_unicode_font(regular_path, bold_path=None):
+    """
+    Register a TrueType font pair for text outside the standard fonts.
+
+    ReportLab embeds only the glyphs a document uses (font subsetting), so
+    the cost is proportional to the characters rendered, not the font
+    size. Returns the ``(regular, bold)`` font names; registration happens
+    once per process and path.
+    """
+    key = (regular_path, bold_path)
+    fonts = _fonts.get(key)
+    if fonts is not None:
+        return fonts
+
+    with _fonts_lock:
+        fonts = _fonts.get(key)
+        if fonts is None:
+            index = len(_fonts)
+            regular = f"CVUnicode{index}"
+            bold = f"CVUnicode{index}-Bold" if bold_path else regular
+            pdfmetrics.registerFont(TTFont(regular, regular_path))
+            if bold_path:
+                pdfmetrics.registerFont(TTFont(bold, bold_path))
+            pdfmetrics.registerFontFamily(
+                regular, normal=regular, bold=bold, italic=regular, boldItalic=bold
+            )
+            fonts = _fonts[key] = (regular, bold)
+    return fonts
@@ -0,0 +1,189 @@
+"""
+Token-bucket rate limiting for CV emails.
+
+Each bucket holds up to ``burst`` tokens and refills at ``rate`` (for
+example ``"5/h"``); a send takes one token and is refused once the bucket
+is empty, with the seconds until the next token as the retry delay. Buckets
+live in Redis and are updated by a Lua script, so the limits hold across
+web and worker nodes. When the cache is not Redis-backed the buckets are
+kept per process instead.
+"""
+
+import ipaddress
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+logger = logging.getLogger(__name__)
+
+RATE_PERIODS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# KEYS[1] bucket; ARGV rate (tokens/s), burst, now, tokens to take
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local requested = tonumber(ARGV[4])
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or burst
+local updated = tonumber(bucket[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - updated) * rate)
+local allowed = 0
+local retry_after = 0
+if tokens >= math.max(requested, 1) then
+    tokens = tokens - requested
+    allowed = 1
+else
+    retry_after = (math.max(requested, 1) - tokens) / rate
+end
+redis.call("HSET", KEYS[1], "tokens", tostring(tokens), "updated", tostring(now))
+redis.call("EXPIRE", KEYS[1], math.ceil(burst / rate) + 1)
+return {allowed, tostring(retry_after)}
+"""
+
+
+def parse_rate(rate):
+    """Return tokens per second for a rate such as ``"5/h"`` or ``"30/m"``."""
+    count, _, period = str(rate).partition("/")
+    try:
+        return float(count) / RATE_PERIODS[period.strip().lower()[:1] or "s"]
+    except (KeyError, ValueError):
+        raise ValueError(f"Invalid rate {rate!r}, expected e.g. '5/h'") from None
+
+
+class TokenBucket:
+    """
+    A family of token buckets sharing one rate, one per key.
+
+    ``cache_alias`` names the Django cache holding the buckets; only a
+    django-redis cache is shared between processes.
+    """
+
+    def __init__(self, name, rate, burst=1, cache_alias="default"):
+        self.name = name
+        self.rate = parse_rate(rate)
+        self.burst = max(int(burst), 1)
+        self.cache_alias = cache_alias
+        self._local = {}
+        self._local_lock = threading.Lock()
+        self._script = None
+
+    def take(self, key, tokens=1):
+        """
+        Take ``tokens`` from the bucket for ``key``.
+
+        Returns ``(allowed, retry_after)``; nothing is taken when the bucket
+        is short. ``tokens=0`` only checks whether one token is available.
+        """
+        now = time.time()
+        bucket_key = f"ratelimit:{self.name}:{key}"
+
+        script = self._redis_script()
+        if script is not None:
+            try:
+                allowed, retry_after = script(
+                    keys=[caches[self.cache_alias].make_key(bucket_key)],
+                    args=[self.rate, self.burst, now, tokens],
+                )
+                return bool(allowed), math.ceil(float(retry_after))
+            except Exception as e:
+                # Never block email because the limiter is unreachable
+                logger.warning(f"Rate limiter {self.name} unavailable: {str(e)}")
+                return True, 0
+
+        with self._local_lock:
+            available, updated = self._local.get(bucket_key, (self.burst, now))
+            available = min(self.burst, available + max(0.0, now - updated) * self.rate)
+            needed = max(tokens, 1)
+            if available < needed:
+                self._local[bucket_key] = (available, now)
+                return False, math.ceil((needed - available) / self.rate)
+            self._local[bucket_key] = (available - tokens, now)
+            return True, 0
+
+    def _redis_script(self):
+        if self._script is None:
+            client = getattr(caches[self.cache_alias], "client", None)
+            get_client = getattr(client, "get_client", None)
+            if get_client is None:
+                return None
+            self._script = get_client(write=True).register_script(TOKEN_BUCKET_SCRIPT)
+        return self._script
+
+
+def _is_trusted_proxy(address, networks):
+    try:
+        ip = ipaddress.ip_address(address)
+    except ValueError:
+        return False
+    return any(ip in network for network in networks)
+
+
+def client_ip(request):
+    """
+    Return the client address for per-client limits.
+
+    ``X-Forwarded-For`` can be set by anyone, so it is only read when
+    ``REMOTE_ADDR`` is one of ``RATE_LIMIT_TRUSTED_PROXIES``; the client
+    is then the right-most hop that is not a trusted proxy.
+    """
+    remote_addr = request.META.get("REMOTE_ADDR", "")
+    networks = [
+        ipaddress.ip_network(proxy, strict=False)
+        for proxy in getattr(settings, "RATE_LIMIT_TRUSTED_PROXIES", [])
+    ]
+    if not _is_trusted_proxy(remote_addr, networks):
+        return remote_addr
+
+    forwarded = request.META.get("HTTP_X_FORWARDED_FOR", "")
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop, networks):
+            return hop
+    # Every hop is a trusted proxy: the left-most one is the closest we get
+    return hops[0] if hops else remote_addr
+
+
+_limiters = None
+_limiters_lock = threading.Lock()
+
+
+def get_email_rate_limiter(scope):
+    """
+    Return the bucket family for ``scope`` (``"RECIPIENT"`` or ``"SENDER"``).
+
+    Returns ``None`` when ``EMAIL_RATE_LIMITS`` disables that scope.
+    """
+    global _limiters
+
+    if _limiters is None:
+        with _limiters_lock:
+            if _limiters is None:
+                config = getattr(settings, "EMAIL_RATE_LIMITS", {})
+                cache_alias = config.get("CACHE", "default")
+                _limiters = {
+                    name: TokenBucket(
+                        name.lower(),
+                        limit["RATE"],
+                        burst=limit.get("BURST", 1),
+                        cache_alias=cache_alias,
+                    )
+                    for name, limit in config.items()
+                    if name != "CACHE" and limit
+                }
+    return _limiters.get(scope)
+
+
+@receiver(setting_changed)
+def _reset_email_rate_limiters(setting, **kwargs):
+    """Drop the buckets when ``EMAIL_RATE_LIMITS`` is overridden."""
+    global _limiters
+
+    if setting == "EMAIL_RATE_LIMITS":
+        _limiters = None
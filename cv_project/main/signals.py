@@ -0,0 +1,79 @@
+"""
+Signal handlers for the CV management system.
+"""
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import CV, Contact, Project, Skill
+from .pdf_cache import get_pdf_cache
+
+
+def _cv_id_for(sender, instance):
+    """Return the id of the CV affected by a change to ``instance``."""
+    if sender is CV:
+        return instance.pk
+    return instance.cv_id
+
+
+def schedule_pdf_prerender(cv_id):
+    """
+    Queue a PDF re-render for a CV once the current transaction commits.
+
+    Bursts of changes (e.g. saving a CV with its inlines in the admin) are
+    coalesced into a single task per ``PDF_PRERENDER_DELAY`` window.
+    """
+    delay = getattr(settings, "PDF_PRERENDER_DELAY", 5)
+    if not cache.add(f"pdf-prerender:{cv_id}", True, timeout=delay):
+        return
+
+    def enqueue():
+        from .tasks import prerender_cv_pdf
+
+        prerender_cv_pdf.apply_async(args=[cv_id], countdown=delay)
+
+    transaction.on_commit(enqueue)
+
+
+@receiver(post_save, sender=CV)
+@receiver(post_save, sender=Skill)
+@receiver(post_save, sender=Project)
+@receiver(post_save, sender=Contact)
+@receiver(post_delete, sender=CV)
+@receiver(post_delete, sender=Skill)
+@receiver(post_delete, sender=Project)
+@receiver(post_delete, sender=Contact)
+def invalidate_cv_pdf_cache(sender, instance, **kwargs):
+    """
+    Drop cached PDFs for a CV whenever it or its children change, and
+    schedule a fresh render unless the CV itself was deleted.
+    """
+    if kwargs.get("raw"):
+        # Rows saved as-is by loaddata; cached PDFs are keyed by content
+        # hash, so a stale one is never served
+        return
+
+    origin = kwargs.get("origin")
+    if sender is not CV and (
+        isinstance(origin, CV) or getattr(origin, "model", None) is CV
+    ):
+        # Cascade from deleting the CV, whose own post_delete cleans up
+        return
+
+    cv_id = _cv_id_for(sender, instance)
+    if cv_id is None:
+        return
+
+    get_pdf_cache().invalidate(cv_id)
+
+    deleted_cv = sender is CV and kwargs.get("signal") is post_delete
+    if sender is not CV and kwargs.get("signal") is post_delete:
+        # A removed row leaves no updated_at behind; move the CV's forward so
+        # Last-Modified on PDF downloads still advances
+        CV.objects.filter(pk=cv_id).update(updated_at=timezone.now())
+    if getattr(settings, "PDF_PRERENDER_ON_CHANGE", False) and not deleted_cv:
+        schedule_pdf_prerender(cv_id)
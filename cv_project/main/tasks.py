@@ -1,130 +1,608 @@
 """
 Celery tasks for CV management system.
 """
+import hashlib
 import logging
-import re
 import sys
+import uuid
 from datetime import timedelta
 
 from celery import shared_task
 from django.conf import settings
-from django.core.mail import EmailMessage
+from django.core.cache import cache
+from django.core.mail import EmailMessage, get_connection
 from django.template.loader import render_to_string
 from django.utils import timezone
-
-from .models import CV, RequestLog
+from django.utils.html import escape, strip_tags
+
+from .models import CV, EmailDelivery, RequestLog
+from .pdf_links import (
+    cleanup_pdf_links,
+    make_pdf_link,
+    should_link_pdf,
+    store_linked_pdf,
+)
+from .rate_limit import get_email_rate_limiter
+from .translation import (
+    get_cached_translation,
+    language_key,
+    store_translation,
+    translate_cv,
+)
 
 logger = logging.getLogger(__name__)
 
+# Stands in for the recipient while a bulk email body is rendered once
+RECIPIENT_PLACEHOLDER = "__CV_EMAIL_RECIPIENT__"
+
+
+def _email_translation(cv_id, data, language):
+    """
+    Return the translation for a CV emailed in ``language``.
+
+    Reuses the stored translation of this CV version and translates only
+    when there is none yet. Raises ``ValueError`` when translation fails.
+    """
+    translation = get_cached_translation(data, language)
+    if translation is None:
+        result = translate_cv_content(cv_id, language)
+        if not result.get("success"):
+            raise ValueError(result.get("error"))
+        translation = result["translated_data"]
+    return translation
+
+
+def _render_cv_email(cv, sender_name, recipient_email, download=None):
+    """
+    Return the HTML and plain text bodies of a CV email.
+
+    ``download`` is the ``(url, expires)`` pair of a PDF sent as a link
+    instead of an attachment.
+    """
+    download_url, download_expires = download or (None, None)
+    context = {
+        "cv": cv,
+        "sender_name": sender_name or "CV Management System",
+        "recipient_email": recipient_email,
+        "download_url": download_url,
+        "download_expires": download_expires,
+    }
+
+    try:
+        html_content = render_to_string("emails/cv_pdf_email.html", context)
+        text_content = render_to_string("emails/cv_pdf_email.txt", context)
+    except Exception as e:
+        logger.error(f"Failed to render email templates: {str(e)}")
+        # Fallback to simple text
+        if download_url:
+            intro = f'Download the CV for {cv.full_name}: <a href="{escape(download_url)}">{escape(download_url)}</a>'
+        else:
+            intro = f"Please find attached the CV for {cv.full_name}."
+        html_content = f"""
+        <html>
+        <body>
+            <h2>CV: {cv.full_name}</h2>
+            <p>{intro}</p>
+            <p>Best regards,<br>{sender_name or 'CV Management System'}</p>
+        </body>
+        </html>
+        """
+        text_content = f"CV: {cv.full_name}\n\n{strip_tags(intro)}\n\nBest regards,\n{sender_name or 'CV Management System'}"
+
+    return html_content, text_content
+
+
+def _cv_email_subject(cv, language=None):
+    subject = f"CV: {cv.full_name}"
+    if language:
+        subject += f" ({language})"
+    return subject
+
+
+def _recipient_retry_after(recipient_email):
+    """Take a send token for ``recipient_email``; return seconds to wait if refused."""
+    limiter = get_email_rate_limiter("RECIPIENT")
+    if limiter is None:
+        return 0
+    allowed, retry_after = limiter.take(recipient_email.lower())
+    return 0 if allowed else retry_after
+
+
+def _pdf_download(cv_id, pdf_data, filename):
+    """
+    Return the ``(url, expires)`` download link for a large PDF.
+
+    Returns ``None`` when the PDF is small enough to attach.
+    """
+    if not should_link_pdf(pdf_data):
+        return None
+    return make_pdf_link(store_linked_pdf(cv_id, pdf_data), filename)
+
+
+def _cv_email_filename(cv, language=None):
+    name = cv.full_name.replace(" ", "_")
+    if language:
+        return f"{name}_CV_{language_key(language)}.pdf"
+    return f"{name}_CV.pdf"
+
+
+def email_delivery_key(cv_id, recipient_email, language=None):
+    """Return the idempotency key of one CV delivered to one recipient."""
+    source = f"{cv_id}:{recipient_email.strip().lower()}:{language or ''}"
+    return hashlib.sha256(source.encode()).hexdigest()[:32]
+
+
+def _claim_delivery(delivery_key, owner):
+    """
+    Claim a delivery for ``owner`` (a task id) within the dedupe window.
+
+    Returns False when another task already claimed the same delivery;
+    retries of the claiming task keep their claim.
+    """
+    claim_key = f"email:delivery:{delivery_key}"
+    window = getattr(settings, "EMAIL_DEDUPE_WINDOW", 300)
+    if cache.add(claim_key, owner, window):
+        return True
+    claimed_by = cache.get(claim_key)
+    return claimed_by is None or claimed_by == owner
+
+
+def _release_delivery(delivery_key):
+    """Forget a claim so the delivery can be submitted again."""
+    cache.delete(f"email:delivery:{delivery_key}")
+
+
+def build_cv_email_artifact(cv_id, recipient_email, sender_name=None, language=None):
+    """
+    Build everything needed to send a CV email, without sending it.
+
+    Loads the CV, renders (or reuses) its PDF and renders the templates.
+    PDFs above ``EMAIL_PDF_LINKS["THRESHOLD"]`` are linked rather than
+    attached, leaving the artifact's ``pdf`` empty. Raises
+    ``CV.DoesNotExist`` and, for failed translations, ``ValueError``.
+    """
+    cv = (
+        CV.objects.select_related()
+        .prefetch_related("skills", "projects", "contacts")
+        .get(pk=cv_id)
+    )
+
+    # Generate PDF using the helper function from views (served from the
+    # PDF cache when this CV has not changed since the last render). The
+    # snapshot is built from the prefetched relations, so layout runs
+    # without further queries.
+    from .pdf import CVData
+    from .views import get_cv_pdf
+
+    data = CVData.from_cv(cv)
+
+    translation = None
+    if language:
+        try:
+            translation = _email_translation(cv_id, data, language)
+        except ValueError as e:
+            raise ValueError(f"Failed to translate CV to {language}: {str(e)}")
+
+    pdf_data = get_cv_pdf(
+        data,
+        mode=getattr(settings, "PDF_EMAIL_MODE", None),
+        translation=translation,
+    )
+    filename = _cv_email_filename(cv, language)
+    download = _pdf_download(cv_id, pdf_data, filename)
+    html_content, _ = _render_cv_email(cv, sender_name, recipient_email, download)
+
+    return {
+        "cv_name": cv.full_name,
+        "subject": _cv_email_subject(cv, language),
+        "body": html_content,
+        "from_email": settings.EMAIL_FROM or settings.EMAIL_HOST_USER,
+        "to": [recipient_email],
+        "filename": filename,
+        "pdf": None if download else pdf_data,
+    }
+
+
+class CVEmailJob:
+    """
+    One attempt at delivering a CV to one recipient.
+
+    Shared by the ``send_cv_pdf_email`` Celery task and the asyncio email
+    worker (``manage.py run_email_worker``): ``prepare()`` does the
+    blocking work (delivery record, dedupe, rate limit, building the
+    email), the caller sends ``message()`` however it likes, then reports
+    back through ``succeeded()``, ``retrying()`` or ``failed()``.
+    """
+
+    def __init__(
+        self, task_id, retries, cv_id, recipient_email, sender_name=None, language=None
+    ):
+        self.task_id = task_id
+        self.retries = retries
+        self.cv_id = cv_id
+        self.recipient_email = recipient_email
+        self.sender_name = sender_name
+        self.language = language
+        self.delivery_key = email_delivery_key(cv_id, recipient_email, language)
+        self.artifact_key = f"email:artifact:{self.delivery_key}"
+        self.delivery = None
+        self.artifact = None
+
+    def prepare(self):
+        """
+        Get the email ready to send.
+
+        Returns a result dict when the job ends here (duplicate, rate limited
+        or not buildable), otherwise ``None``. Other build errors (such as a
+        failed PDF render) are raised and may be retried.
+        """
+        self.delivery = self._start_delivery()
+        if not _claim_delivery(self.delivery_key, self.task_id or uuid.uuid4().hex):
+            logger.info(
+                f"CV {self.cv_id} is already being sent to {self.recipient_email}"
+            )
+            self.delivery.mark(EmailDelivery.STATE_DUPLICATE)
+            return {
+                "success": True,
+                "duplicate": True,
+                "message": f"CV was already sent to {self.recipient_email} recently",
+                "recipient": self.recipient_email,
+            }
+
+        # Refuse rather than queue behind the recipient's limit
+        retry_after = (
+            0 if self.retries else _recipient_retry_after(self.recipient_email)
+        )
+        if retry_after:
+            logger.warning(
+                f"Rate limit reached for {self.recipient_email}, retry in {retry_after}s"
+            )
+            result = self._end(
+                f"Too many emails to {self.recipient_email}, retry in {retry_after}s"
+            )
+            result["retry_after"] = retry_after
+            return result
+
+        # Stage 1: build the email, unless an earlier attempt already did
+        self.artifact = cache.get(self.artifact_key)
+        if self.artifact is not None:
+            return None
+
+        try:
+            self.artifact = build_cv_email_artifact(
+                self.cv_id, self.recipient_email, self.sender_name, self.language
+            )
+        except CV.DoesNotExist:
+            logger.error(f"CV with ID {self.cv_id} does not exist")
+            return self._end(f"CV with ID {self.cv_id} not found")
+        except ValueError as e:
+            logger.error(f"Failed to build email for CV {self.cv_id}: {str(e)}")
+            return self._end(str(e))
+        except Exception as e:
+            logger.error(f"Failed to generate PDF for CV {self.cv_id}: {str(e)}")
+            raise
+
+        cache.set(
+            self.artifact_key,
+            self.artifact,
+            getattr(settings, "EMAIL_ARTIFACT_TIMEOUT", 3600),
+        )
+        return None
+
+    def message(self):
+        """Return the ``EmailMessage`` for the prepared artifact."""
+        artifact = self.artifact
+        email = EmailMessage(
+            subject=artifact["subject"],
+            body=artifact["body"],
+            from_email=artifact["from_email"],
+            to=artifact["to"],
+        )
+        email.content_subtype = "html"  # Set email as HTML
+        if artifact["pdf"] is not None:
+            email.attach(artifact["filename"], artifact["pdf"], "application/pdf")
+        return email
+
+    def succeeded(self, message_size):
+        """Record the delivery as sent and return the task result."""
+        cache.delete(self.artifact_key)
+        self.delivery.mark(
+            EmailDelivery.STATE_SENT, error="", message_size=message_size
+        )
+        logger.info(
+            f"CV PDF email sent successfully to {self.recipient_email} for CV {self.cv_id}"
+        )
+        return {
+            "success": True,
+            "message": f"CV sent successfully to {self.recipient_email}",
+            "cv_name": self.artifact["cv_name"],
+            "recipient": self.recipient_email,
+            "filename": self.artifact["filename"],
+        }
+
+    def retrying(self, exc):
+        """Record a failed attempt that will be retried."""
+        logger.warning(
+            f"Retrying CV PDF email task (attempt {self.retries + 1}): {str(exc)}"
+        )
+        if self.delivery is not None:
+            self.delivery.mark(EmailDelivery.STATE_RETRYING, error=str(exc))
+
+    def failed(self, exc, attempts):
+        """Record the delivery as failed after ``attempts`` and return the result."""
+        logger.error(
+            f"Failed to send CV PDF email after {attempts} retries: {str(exc)}"
+        )
+        result = self._end(
+            f"Failed to send email after {attempts} attempts: {str(exc)}"
+        )
+        if self.delivery is not None:
+            self.delivery.error = str(exc)
+            self.delivery.save(update_fields=["error"])
+        return result
+
+    def _end(self, error):
+        """Fail the delivery for good and free it for a later submission."""
+        _release_delivery(self.delivery_key)
+        # A later submission must rebuild the email from the current CV
+        cache.delete(self.artifact_key)
+        if self.delivery is not None:
+            self.delivery.mark(EmailDelivery.STATE_FAILED, error=error)
+        return {"success": False, "error": error}
+
+    def _start_delivery(self):
+        """Return the ``EmailDelivery`` of this task, marked as sending."""
+        fields = {
+            "cv": CV.objects.filter(pk=self.cv_id).first(),
+            "recipient": self.recipient_email,
+            "language": self.language or "",
+        }
+        if self.task_id:
+            # The queueing view records it too; whichever runs first creates it
+            delivery, _ = EmailDelivery.objects.get_or_create(
+                task_id=self.task_id, defaults=fields
+            )
+        else:
+            delivery = EmailDelivery(**fields)
+        delivery.mark(EmailDelivery.STATE_SENDING, attempts=self.retries + 1)
+        return delivery
+
+
+def _retry_cv_email(task, job, exc):
+    """Retry a failed CV email, or report failure once retries are used up."""
+    if task.request.retries >= task.max_retries:
+        return job.failed(exc, task.max_retries)
+
+    job.retrying(exc)
+    raise task.retry(exc=exc, countdown=60)
+
 
 @shared_task(bind=True, max_retries=3, default_retry_delay=60)
-def send_cv_pdf_email(self, cv_id, recipient_email, sender_name=None):
+def send_cv_pdf_email(self, cv_id, recipient_email, sender_name=None, language=None):
     """
     Send CV PDF via email using Celery.
 
+    The email is built once (CV, PDF and templates) and stored under the
+    delivery's idempotency key, so a retry after an SMTP failure only
+    resends it. Repeated submissions of the same CV to the same recipient
+    within ``EMAIL_DEDUPE_WINDOW`` seconds are delivered once. Progress is
+    recorded in an ``EmailDelivery`` row keyed by the task id.
+
     Args:
         cv_id (int): ID of the CV to send
         recipient_email (str): Email address to send CV to
         sender_name (str, optional): Name of the person sending the email
+        language (str, optional): Language to translate the attached CV into
 
     Returns:
         dict: Status information about the email sending
     """
+    job = CVEmailJob(
+        self.request.id,
+        self.request.retries,
+        cv_id,
+        recipient_email,
+        sender_name,
+        language,
+    )
     try:
-        # Get CV object
-        try:
-            cv = (
-                CV.objects.select_related()
-                .prefetch_related("skills", "projects", "contacts")
-                .get(pk=cv_id)
-            )
-        except CV.DoesNotExist:
-            logger.error(f"CV with ID {cv_id} does not exist")
-            return {"success": False, "error": f"CV with ID {cv_id} not found"}
+        result = job.prepare()
+    except Exception as e:
+        return _retry_cv_email(self, job, e)
+    if result is not None:
+        return result
 
-        # Generate PDF using the helper function from views
-        try:
-            from .views import generate_cv_pdf_buffer
+    # Stage 2: send it; only this part is repeated on retries
+    email = job.message()
+    try:
+        email.send()
+    except Exception as e:
+        logger.error(f"Failed to send email to {recipient_email}: {str(e)}")
+        return _retry_cv_email(self, job, e)
 
-            pdf_buffer = generate_cv_pdf_buffer(cv)
-            pdf_data = pdf_buffer.getvalue()
-            pdf_buffer.close()
-        except Exception as e:
-            logger.error(f"Failed to generate PDF for CV {cv_id}: {str(e)}")
-            raise self.retry(exc=e, countdown=60)
-
-        # Prepare email content
-        context = {
-            "cv": cv,
-            "sender_name": sender_name or "CV Management System",
-            "recipient_email": recipient_email,
-        }
+    return job.succeeded(len(email.message().as_bytes()))
 
-        # Render email templates
-        try:
-            html_content = render_to_string("emails/cv_pdf_email.html", context)
-            text_content = render_to_string("emails/cv_pdf_email.txt", context)
-        except Exception as e:
-            logger.error(f"Failed to render email templates: {str(e)}")
-            # Fallback to simple text
-            html_content = f"""
-            <html>
-            <body>
-                <h2>CV: {cv.full_name}</h2>
-                <p>Please find attached the CV for {cv.full_name}.</p>
-                <p>Best regards,<br>{sender_name or 'CV Management System'}</p>
-            </body>
-            </html>
-            """
-            text_content = f"CV: {cv.full_name}\n\nPlease find attached the CV for {cv.full_name}.\n\nBest regards,\n{sender_name or 'CV Management System'}"
-
-        # Create email
-        subject = f"CV: {cv.full_name}"
-        from_email = settings.EMAIL_FROM or settings.EMAIL_HOST_USER
 
-        email = EmailMessage(
-            subject=subject,
-            body=html_content,
-            from_email=from_email,
-            to=[recipient_email],
-        )
-        email.content_subtype = "html"  # Set email as HTML
+def bulk_progress(statuses):
+    """Summarize per-recipient statuses of a bulk email."""
+    counts = {"sent": 0, "failed": 0, "pending": 0}
+    for status in statuses.values():
+        counts[status["status"]] += 1
+    return {"total": len(statuses), **counts, "recipients": statuses}
 
-        # Attach PDF
-        filename = f"{cv.full_name.replace(' ', '_')}_CV.pdf"
-        email.attach(filename, pdf_data, "application/pdf")
 
-        # Send email
-        try:
-            email.send()
-            logger.info(
-                f"CV PDF email sent successfully to {recipient_email} for CV {cv_id}"
+def _bulk_deliveries(task_id, cv, recipients, language):
+    """
+    Return the ``EmailDelivery`` of each recipient of a bulk send.
+
+    The rows are linked to the task by ``batch_id`` and created on its first
+    attempt; retries reuse them.
+    """
+    if task_id:
+        deliveries = {
+            delivery.recipient: delivery
+            for delivery in EmailDelivery.objects.filter(batch_id=task_id)
+        }
+        if deliveries:
+            return deliveries
+
+    return {
+        delivery.recipient: delivery
+        for delivery in EmailDelivery.objects.bulk_create(
+            EmailDelivery(
+                batch_id=task_id, cv=cv, recipient=recipient, language=language or ""
             )
-            return {
-                "success": True,
-                "message": f"CV sent successfully to {recipient_email}",
-                "cv_name": cv.full_name,
-                "recipient": recipient_email,
-                "filename": filename,
-            }
-        except Exception as e:
-            logger.error(f"Failed to send email to {recipient_email}: {str(e)}")
-            raise self.retry(exc=e, countdown=60)
+            for recipient in dict.fromkeys(recipients)
+        )
+    }
+
+
+def _fail_bulk_deliveries(deliveries, error):
+    """Mark every delivery of a bulk send that ended before sending as failed."""
+    now = timezone.now()
+    EmailDelivery.objects.filter(
+        pk__in=[delivery.pk for delivery in deliveries.values()]
+    ).update(
+        state=EmailDelivery.STATE_FAILED, error=error, finished_at=now, updated_at=now
+    )
+
+
+@shared_task(bind=True, max_retries=2, default_retry_delay=60)
+def send_cv_pdf_bulk_email(self, cv_id, recipients, sender_name=None, language=None):
+    """
+    Send one CV PDF to many recipients using Celery.
+
+    The CV is loaded, its PDF rendered and the email templates rendered once;
+    each message only substitutes its recipient's address. Messages are sent
+    in batches of ``EMAIL_BULK_BATCH_SIZE`` over one SMTP connection per
+    batch, and per-recipient status is published as ``PROGRESS`` task state
+    after every batch. A failed recipient does not stop the others. Each
+    recipient's outcome is recorded in its own ``EmailDelivery`` row, linked
+    to the task by ``batch_id``.
+
+    Args:
+        cv_id (int): ID of the CV to send
+        recipients (list): Email addresses to send the CV to
+        sender_name (str, optional): Name of the person sending the email
+        language (str, optional): Language to translate the attached CV into
+
+    Returns:
+        dict: Totals and a ``recipients`` map of address to status
+    """
+    try:
+        cv = CV.objects.prefetch_related("skills", "projects", "contacts").get(pk=cv_id)
+    except CV.DoesNotExist:
+        logger.error(f"CV with ID {cv_id} does not exist")
+        return {"success": False, "error": f"CV with ID {cv_id} not found"}
+
+    from .pdf import CVData
+    from .views import get_cv_pdf
+
+    data = CVData.from_cv(cv)
+    # One delivery record per recipient, as for single sends
+    deliveries = _bulk_deliveries(self.request.id, cv, recipients, language)
 
+    translation = None
+    if language:
+        try:
+            translation = _email_translation(cv_id, data, language)
+        except ValueError as e:
+            logger.error(f"Failed to translate CV {cv_id} to {language}: {str(e)}")
+            error = f"Failed to translate CV to {language}: {str(e)}"
+            _fail_bulk_deliveries(deliveries, error)
+            return {"success": False, "error": error}
+
+    # Nothing has been sent yet, so a failed render can safely be retried
+    try:
+        pdf_data = get_cv_pdf(
+            data,
+            mode=getattr(settings, "PDF_EMAIL_MODE", None),
+            translation=translation,
+        )
     except Exception as e:
+        logger.error(f"Failed to generate PDF for CV {cv_id}: {str(e)}")
         if self.request.retries >= self.max_retries:
-            logger.error(
-                f"Failed to send CV PDF email after {self.max_retries} retries: {str(e)}"
-            )
-            return {
-                "success": False,
-                "error": f"Failed to send email after {self.max_retries} attempts: {str(e)}",
-            }
+            _fail_bulk_deliveries(deliveries, str(e))
+        raise self.retry(exc=e)
+
+    subject = _cv_email_subject(cv, language)
+    filename = _cv_email_filename(cv, language)
+    # One stored file and link serve every recipient of a large PDF
+    download = _pdf_download(cv_id, pdf_data, filename)
+    html_content, _ = _render_cv_email(cv, sender_name, RECIPIENT_PLACEHOLDER, download)
+    from_email = settings.EMAIL_FROM or settings.EMAIL_HOST_USER
+
+    statuses = {recipient: {"status": "pending"} for recipient in recipients}
+    batch_size = getattr(settings, "EMAIL_BULK_BATCH_SIZE", 20)
+    connection = get_connection()
+
+    for start in range(0, len(recipients), batch_size):
+        batch = recipients[start : start + batch_size]
+        try:
+            connection.open()
+        except Exception as e:
+            logger.error(f"Failed to connect to the mail server: {str(e)}")
+            for recipient in batch:
+                statuses[recipient] = {"status": "failed", "error": str(e)}
+                deliveries[recipient].mark(EmailDelivery.STATE_FAILED, error=str(e))
         else:
-            logger.warning(
-                f"Retrying CV PDF email task (attempt {self.request.retries + 1}): {str(e)}"
-            )
-            raise self.retry(exc=e, countdown=60)
+            try:
+                for recipient in batch:
+                    retry_after = _recipient_retry_after(recipient)
+                    if retry_after:
+                        statuses[recipient] = {
+                            "status": "failed",
+                            "error": f"Rate limited, retry in {retry_after}s",
+                            "retry_after": retry_after,
+                        }
+                        deliveries[recipient].mark(
+                            EmailDelivery.STATE_FAILED,
+                            error=statuses[recipient]["error"],
+                        )
+                        continue
+                    email = EmailMessage(
+                        subject=subject,
+                        body=html_content.replace(
+                            RECIPIENT_PLACEHOLDER, escape(recipient)
+                        ),
+                        from_email=from_email,
+                        to=[recipient],
+                        connection=connection,
+                    )
+                    email.content_subtype = "html"
+                    if download is None:
+                        email.attach(filename, pdf_data, "application/pdf")
+                    delivery = deliveries[recipient]
+                    delivery.mark(EmailDelivery.STATE_SENDING, attempts=1)
+                    try:
+                        email.send()
+                    except Exception as e:
+                        logger.error(f"Failed to send email to {recipient}: {str(e)}")
+                        statuses[recipient] = {"status": "failed", "error": str(e)}
+                        delivery.mark(EmailDelivery.STATE_FAILED, error=str(e))
+                    else:
+                        statuses[recipient] = {"status": "sent"}
+                        delivery.mark(
+                            EmailDelivery.STATE_SENT,
+                            message_size=len(email.message().as_bytes()),
+                        )
+            finally:
+                connection.close()
+
+        if not self.request.called_directly:
+            self.update_state(state="PROGRESS", meta=bulk_progress(statuses))
+
+    progress = bulk_progress(statuses)
+    logger.info(
+        f"Bulk CV email for CV {cv_id}: {progress['sent']} sent, "
+        f"{progress['failed']} failed"
+    )
+    return {
+        "success": progress["failed"] == 0,
+        "cv_name": cv.full_name,
+        "filename": filename,
+        **progress,
+    }
 
 
 @shared_task(bind=True, max_retries=2, default_retry_delay=30)
@@ -151,6 +629,19 @@ def translate_cv_content(self, cv_id, target_language):
             logger.error(f"CV with ID {cv_id} does not exist")
             return {"success": False, "error": f"CV with ID {cv_id} not found"}
 
+        # Reuse a stored translation of this exact CV version
+        cached_translation = get_cached_translation(cv, target_language)
+        if cached_translation is not None:
+            logger.info(f"Using stored {target_language} translation of CV {cv_id}")
+            return {
+                "success": True,
+                "cv_id": cv_id,
+                "target_language": target_language,
+                "translated_data": cached_translation,
+                "cv_name": cv.full_name,
+                "cached": True,
+            }
+
         # Check if OpenAI API key is configured
         openai_api_key = getattr(settings, "OPENAI_API_KEY", None)
         if not openai_api_key:
@@ -161,7 +652,8 @@ def translate_cv_content(self, cv_id, target_language):
         try:
             import openai
 
-            client = openai.OpenAI(api_key=openai_api_key)
+            # Retries are done by translate_cv, with jittered backoff
+            client = openai.OpenAI(api_key=openai_api_key, max_retries=0)
         except ImportError:
             logger.error("OpenAI library not installed")
             return {
@@ -169,252 +661,30 @@ def translate_cv_content(self, cv_id, target_language):
                 "error": "Translation service dependencies not available",
             }
 
-        # Define technical terms to avoid translating
-        technical_terms = {
-            "Python",
-            "Django",
-            "JavaScript",
-            "React",
-            "Vue",
-            "Angular",
-            "Node.js",
-            "PostgreSQL",
-            "MySQL",
-            "MongoDB",
-            "Redis",
-            "Docker",
-            "Kubernetes",
-            "AWS",
-            "Azure",
-            "GCP",
-            "Git",
-            "GitHub",
-            "GitLab",
-            "CI/CD",
-            "API",
-            "REST",
-            "GraphQL",
-            "HTML",
-            "CSS",
-            "SCSS",
-            "TypeScript",
-            "Java",
-            "C++",
-            "C#",
-            "PHP",
-            "Ruby",
-            "Go",
-            "Rust",
-            "Swift",
-            "Kotlin",
-            "Flask",
-            "FastAPI",
-            "Express",
-            "Spring",
-            "Laravel",
-            "Symfony",
-            "TensorFlow",
-            "PyTorch",
-            "scikit-learn",
-            "NumPy",
-            "Pandas",
-            "Jupyter",
-            "Anaconda",
-            "Linux",
-            "Ubuntu",
-            "CentOS",
-            "Windows",
-            "macOS",
-            "iOS",
-            "Android",
-            "Unity",
-            "Unreal",
-            "Blender",
-            "Photoshop",
-            "Illustrator",
-            "Figma",
-            "Sketch",
-            "Adobe",
-            "Webpack",
-            "Babel",
-            "npm",
-            "yarn",
-            "pip",
-            "composer",
-            "Terraform",
-            "Ansible",
-            "Jenkins",
-            "Nginx",
-            "Apache",
-            "Elasticsearch",
-            "Kafka",
-            "RabbitMQ",
-            "Celery",
-            "Gunicorn",
-        }
-
-        def protect_technical_terms(text):
-            """Wrap technical terms to prevent translation."""
-            if not text:
-                return text, {}
-
-            protected_text = text
-            term_map = {}
-
-            # Sort terms by length (longest first) to avoid partial matches
-            sorted_terms = sorted(technical_terms, key=len, reverse=True)
-
-            for i, term in enumerate(sorted_terms):
-                # Case-insensitive search with word boundaries
-                pattern = r"\b" + re.escape(term) + r"\b"
-                matches = re.finditer(pattern, protected_text, re.IGNORECASE)
-
-                for match in matches:
-                    original_term = match.group()
-                    placeholder = f"TECH_TERM_{i}"
-                    term_map[placeholder] = original_term
-                    protected_text = protected_text.replace(
-                        original_term, placeholder, 1
-                    )
-
-            return protected_text, term_map
-
-        def restore_technical_terms(text, term_map):
-            """Restore technical terms after translation."""
-            if not text or not term_map:
-                return text
-
-            restored_text = text
-            for placeholder, original_term in term_map.items():
-                restored_text = restored_text.replace(placeholder, original_term)
-
-            return restored_text
-
-        # Prepare content for translation
-        translation_data = {}
-
-        # 1. Translate biography
-        if cv.bio:
-            try:
-                protected_bio, bio_term_map = protect_technical_terms(cv.bio)
-
-                bio_response = client.chat.completions.create(
-                    model="gpt-3.5-turbo",
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": f"You are a professional translator. Translate the following professional biography to {target_language}. Maintain professional tone and keep any placeholders (TECH_TERM_X) unchanged. Preserve paragraph structure.",
-                        },
-                        {"role": "user", "content": protected_bio},
-                    ],
-                    max_tokens=1000,
-                    temperature=0.3,
-                )
-
-                translated_bio = bio_response.choices[0].message.content.strip()
-                translation_data["bio"] = restore_technical_terms(
-                    translated_bio, bio_term_map
-                )
-
-            except Exception as e:
-                logger.warning(f"Failed to translate biography: {str(e)}")
-                translation_data["bio"] = cv.bio  # Keep original if translation fails
-        else:
-            # Include empty bio in result
-            translation_data["bio"] = cv.bio or ""
-
-        # 2. Translate projects
-        translation_data["projects"] = []
-        for project in cv.projects.all():
-            try:
-                project_data = {
-                    "id": project.id,
-                    "title": project.title,  # Keep title as is (usually technical)
-                    "description": project.description,
-                    "technologies": project.technologies,
-                    "url": project.url,
-                    "start_date": project.start_date,
-                    "end_date": project.end_date,
-                    "is_ongoing": project.is_ongoing,
-                }
-
-                # Translate description
-                if project.description:
-                    protected_desc, desc_term_map = protect_technical_terms(
-                        project.description
-                    )
-
-                    desc_response = client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": f"You are a professional translator. Translate the following project description to {target_language}. Maintain professional tone and keep any placeholders (TECH_TERM_X) unchanged.",
-                            },
-                            {"role": "user", "content": protected_desc},
-                        ],
-                        max_tokens=500,
-                        temperature=0.3,
-                    )
-
-                    translated_desc = desc_response.choices[0].message.content.strip()
-                    project_data["description"] = restore_technical_terms(
-                        translated_desc, desc_term_map
-                    )
-
-                translation_data["projects"].append(project_data)
-
-            except Exception as e:
-                logger.warning(f"Failed to translate project {project.id}: {str(e)}")
-                # Keep original data if translation fails
-                translation_data["projects"].append(
-                    {
-                        "id": project.id,
-                        "title": project.title,
-                        "description": project.description,
-                        "technologies": project.technologies,
-                        "url": project.url,
-                        "start_date": project.start_date,
-                        "end_date": project.end_date,
-                        "is_ongoing": project.is_ongoing,
-                    }
+        # Progress is reported from translation worker threads, where
+        # self.request (thread-local) has no task id
+        task_id = self.request.id
+
+        def publish_progress(translated_data, done, total):
+            # Lets status pollers render the fields translated so far
+            if task_id:
+                self.update_state(
+                    task_id=task_id,
+                    state="PROGRESS",
+                    meta={
+                        "target_language": target_language,
+                        "translated_data": translated_data,
+                        "done": done,
+                        "total": total,
+                    },
                 )
 
-        # 3. Skills - only translate non-technical skill names
-        translation_data["skills"] = []
-        for skill in cv.skills.all():
-            skill_data = {
-                "id": skill.id,
-                "name": skill.name,
-                "proficiency": skill.proficiency,
-            }
-
-            # Check if skill name is technical (skip translation)
-            if skill.name not in technical_terms:
-                try:
-                    skill_response = client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[
-                            {
-                                "role": "system",
-                                "content": f"You are a professional translator. Translate this skill name to {target_language}. If it's a technical term or proper noun, return it unchanged. Return only the translated text.",
-                            },
-                            {"role": "user", "content": skill.name},
-                        ],
-                        max_tokens=50,
-                        temperature=0.3,
-                    )
-
-                    translated_skill = skill_response.choices[0].message.content.strip()
-                    # Only use translation if it's different and not just the original
-                    if translated_skill.lower() != skill.name.lower():
-                        skill_data["name"] = translated_skill
-
-                except Exception as e:
-                    logger.warning(f"Failed to translate skill {skill.name}: {str(e)}")
-                    # Keep original if translation fails
+        translation_data = translate_cv(
+            client, cv, target_language, on_progress=publish_progress
+        )
 
-            translation_data["skills"].append(skill_data)
+        # Store the result for translated downloads, emails and repeat requests
+        translation_data = store_translation(cv, target_language, translation_data)
 
         logger.info(f"Successfully translated CV {cv_id} to {target_language}")
 
@@ -451,6 +721,45 @@ def translate_cv_content(self, cv_id, target_language):
             raise self.retry(exc=e, countdown=30)
 
 
+@shared_task(bind=True, max_retries=2, default_retry_delay=30)
+def prerender_cv_pdf(self, cv_id):
+    """
+    Render a CV's PDF into the PDF cache ahead of the next download.
+
+    Scheduled by the model signals whenever a CV or one of its skills,
+    projects or contacts changes. The cache writes files atomically, so a
+    concurrent download sees either the previous state or the finished PDF.
+
+    Args:
+        cv_id (int): ID of the CV to render
+
+    Returns:
+        dict: Render status information
+    """
+    try:
+        cv = CV.objects.prefetch_related("skills", "projects", "contacts").get(pk=cv_id)
+    except CV.DoesNotExist:
+        return {"success": False, "error": f"CV with ID {cv_id} not found"}
+
+    from .pdf import CVData
+    from .pdf_cache import cv_content_hash, get_pdf_cache
+    from .views import get_cv_pdf
+
+    data = CVData.from_cv(cv)
+    content_hash = cv_content_hash(data)
+    if get_pdf_cache().get_path(cv.pk, content_hash) is not None:
+        return {"success": True, "cv_id": cv_id, "rendered": False}
+
+    try:
+        pdf_data = get_cv_pdf(data, content_hash)
+    except Exception as e:
+        logger.error(f"Failed to pre-render PDF for CV {cv_id}: {str(e)}")
+        raise self.retry(exc=e)
+
+    logger.info(f"Pre-rendered PDF for CV {cv_id} ({len(pdf_data)} bytes)")
+    return {"success": True, "cv_id": cv_id, "rendered": True, "size": len(pdf_data)}
+
+
 @shared_task
 def cleanup_old_request_logs(days=30):
     """
@@ -479,6 +788,23 @@ def cleanup_old_request_logs(days=30):
         return {"success": False, "error": str(e)}
 
 
+@shared_task
+def cleanup_expired_pdf_links():
+    """
+    Delete linked CV PDFs whose download links have all expired.
+
+    Returns:
+        dict: Cleanup statistics
+    """
+    try:
+        deleted_count = cleanup_pdf_links()
+        logger.info(f"Cleaned up {deleted_count} expired linked PDFs")
+        return {"success": True, "deleted_count": deleted_count}
+    except Exception as e:
+        logger.error(f"Failed to cleanup linked PDFs: {str(e)}")
+        return {"success": False, "error": str(e)}
+
+
 @shared_task
 def test_celery_task():
     """
@@ -0,0 +1,325 @@
+"""
+Tests for the asyncio email worker.
+"""
+
+import asyncio
+import importlib.util
+import queue
+import threading
+import time
+from concurrent.futures import Executor, Future
+from datetime import datetime, timedelta, timezone
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+from django.core import mail
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase
+
+from main.async_email import REQUEUE, EmailQueueWorker
+from main.models import CV, EmailDelivery
+from main.tasks import send_cv_pdf_bulk_email, send_cv_pdf_email
+
+
+class TestThreadExecutor(Executor):
+    """
+    Run the worker's blocking work on the test thread.
+
+    The event loop runs in another thread, so database access stays inside
+    the test transaction.
+    """
+
+    def __init__(self):
+        self.jobs = queue.Queue()
+
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        self.jobs.put((future, fn, args, kwargs))
+        return future
+
+    def run(self, coroutine):
+        """Run ``coroutine`` on a new event loop and return its result."""
+        outcome = {}
+
+        def run_loop():
+            try:
+                outcome["result"] = asyncio.run(coroutine)
+            except Exception as e:
+                outcome["error"] = e
+
+        loop_thread = threading.Thread(target=run_loop)
+        loop_thread.start()
+        while loop_thread.is_alive() or not self.jobs.empty():
+            try:
+                future, fn, args, kwargs = self.jobs.get(timeout=0.01)
+            except queue.Empty:
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["result"]
+
+
+class FakeSender:
+    """Records messages instead of talking SMTP; fails the first ``failures``."""
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.messages = []
+
+    async def send(self, message):
+        if self.failures:
+            self.failures -= 1
+            raise OSError("connection refused")
+        self.messages.append(message)
+        return len(message.message().as_bytes())
+
+    async def close(self):
+        pass
+
+
+@patch(
+    "main.views.generate_cv_pdf_buffer",
+    side_effect=lambda *args, **kwargs: BytesIO(b"%PDF-async"),
+)
+class EmailQueueWorkerTest(TestCase):
+    """Test task messages handled by the worker."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Async", lastname="Sender", email="async@example.com", bio="Bio"
+        )
+        self.kwargs = {"cv_id": self.cv.pk, "recipient_email": "hr@example.com"}
+
+    def handle(self, sender, task=send_cv_pdf_email, retries=0, kwargs=None):
+        executor = TestThreadExecutor()
+        worker = EmailQueueWorker(sender, concurrency=10, executor=executor)
+        return executor.run(
+            worker.handle(task.name, "task-1", retries, [], kwargs or self.kwargs)
+        )
+
+    def test_send(self, mock_generate):
+        sender = FakeSender()
+
+        result = self.handle(sender)
+
+        self.assertTrue(result["success"])
+        self.assertEqual(sender.messages[0].to, ["hr@example.com"])
+        self.assertEqual(sender.messages[0].attachments[0][1], b"%PDF-async")
+        self.assertEqual(mail.outbox, [])
+        delivery = EmailDelivery.objects.get(task_id="task-1")
+        self.assertEqual(delivery.state, EmailDelivery.STATE_SENT)
+        self.assertGreater(delivery.message_size, 0)
+
+    @patch("main.tasks.send_cv_pdf_email.apply_async")
+    def test_failed_send_is_requeued(self, mock_apply_async, mock_generate):
+        self.handle(FakeSender(failures=1))
+
+        mock_apply_async.assert_called_once_with(
+            args=[], kwargs=self.kwargs, task_id="task-1", countdown=60, retries=1
+        )
+        delivery = EmailDelivery.objects.get(task_id="task-1")
+        self.assertEqual(delivery.state, EmailDelivery.STATE_RETRYING)
+
+    @patch("main.tasks.send_cv_pdf_email.apply_async")
+    def test_last_attempt_fails(self, mock_apply_async, mock_generate):
+        result = self.handle(
+            FakeSender(failures=1), retries=send_cv_pdf_email.max_retries
+        )
+
+        self.assertFalse(result["success"])
+        mock_apply_async.assert_not_called()
+        delivery = EmailDelivery.objects.get(task_id="task-1")
+        self.assertEqual(delivery.state, EmailDelivery.STATE_FAILED)
+
+    def test_other_tasks_run_as_celery_would(self, mock_generate):
+        sender = FakeSender()
+
+        self.handle(
+            sender,
+            task=send_cv_pdf_bulk_email,
+            kwargs={"cv_id": self.cv.pk, "recipients": ["a@example.com"]},
+        )
+
+        self.assertEqual(sender.messages, [])
+        self.assertEqual(len(mail.outbox), 1)
+
+
+def message_time(seconds):
+    """Return an ISO task header time ``seconds`` from now."""
+    return (datetime.now(timezone.utc) + timedelta(seconds=seconds)).isoformat()
+
+
+@patch(
+    "main.views.generate_cv_pdf_buffer",
+    side_effect=lambda *args, **kwargs: BytesIO(b"%PDF-async"),
+)
+class EmailQueueScheduleTest(TestCase):
+    """Test that message eta and expires headers are honoured."""
+
+    def setUp(self):
+        cv = CV.objects.create(
+            firstname="Async", lastname="Later", email="later@example.com", bio="Bio"
+        )
+        self.kwargs = {"cv_id": cv.pk, "recipient_email": "hr@example.com"}
+
+    def handle_message(self, sender, worker=None, **headers):
+        executor = TestThreadExecutor()
+        worker = worker or EmailQueueWorker(sender, concurrency=10, executor=executor)
+        worker.executor = executor
+        headers = {"task": send_cv_pdf_email.name, "id": "task-1", **headers}
+        return executor.run(worker.handle_message(headers, [], self.kwargs))
+
+    def test_message_waits_for_eta(self, mock_generate):
+        sender = FakeSender()
+
+        start = time.monotonic()
+        self.handle_message(sender, eta=message_time(0.3))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.25)
+        self.assertEqual(len(sender.messages), 1)
+
+    def test_expired_message_is_discarded(self, mock_generate):
+        sender = FakeSender()
+
+        result = self.handle_message(sender, expires=message_time(-1))
+
+        self.assertIsNone(result)
+        self.assertEqual(sender.messages, [])
+        self.assertFalse(EmailDelivery.objects.exists())
+
+    def test_waiting_message_is_requeued_on_stop(self, mock_generate):
+        sender = FakeSender()
+        worker = EmailQueueWorker(sender, concurrency=10)
+        worker.stop()
+
+        result = self.handle_message(sender, worker=worker, eta=message_time(60))
+
+        self.assertIs(result, REQUEUE)
+        self.assertEqual(sender.messages, [])
+
+    @patch("main.tasks.send_cv_pdf_bulk_email.apply_async")
+    @patch("main.views.get_cv_pdf", side_effect=OSError("disk full"))
+    def test_other_task_retries_are_published(
+        self, mock_get_cv_pdf, mock_apply_async, mock_generate
+    ):
+        executor = TestThreadExecutor()
+        worker = EmailQueueWorker(FakeSender(), concurrency=10, executor=executor)
+
+        executor.run(
+            worker.handle(
+                send_cv_pdf_bulk_email.name,
+                "task-2",
+                0,
+                [],
+                {"cv_id": self.kwargs["cv_id"], "recipients": ["a@example.com"]},
+            )
+        )
+
+        # Published for later, not run again inline
+        self.assertEqual(mock_get_cv_pdf.call_count, 1)
+        mock_apply_async.assert_called_once()
+        self.assertEqual(mock_apply_async.call_args.kwargs["countdown"], 60)
+        self.assertEqual(mock_apply_async.call_args.kwargs["retries"], 1)
+
+
+class FakeMessage:
+    def __init__(self, **headers):
+        self.headers = {"task": "main.tasks.other", "id": "task-3", **headers}
+        self.delivery_info = {}
+        self.outcome = None
+
+    def ack(self):
+        self.outcome = "ack"
+
+    def requeue(self):
+        self.outcome = "requeue"
+
+
+class FakeConsumer:
+    def __init__(self):
+        self.prefetch = []
+
+    def qos(self, prefetch_count):
+        self.prefetch.append(prefetch_count)
+
+
+class EmailQueueConsumerTest(SimpleTestCase):
+    """Test how the consumer thread holds, acknowledges and requeues messages."""
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(target=self.loop.run_forever)
+        loop_thread.start()
+
+        def stop_loop():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            loop_thread.join()
+            self.loop.close()
+
+        self.addCleanup(stop_loop)
+        self.worker = EmailQueueWorker(FakeSender(), concurrency=2)
+        self.worker._consumer = FakeConsumer()
+
+    def drain(self, in_flight):
+        deadline = time.monotonic() + 5
+        while in_flight and time.monotonic() < deadline:
+            self.worker._ack_finished(in_flight)
+            time.sleep(0.01)
+
+    def test_expired_message_is_acknowledged(self):
+        message = FakeMessage(expires=message_time(-1))
+        in_flight = set()
+
+        self.worker._received(self.loop, in_flight, [[], {}, {}], message)
+        self.drain(in_flight)
+
+        self.assertEqual(message.outcome, "ack")
+        self.assertEqual(self.worker._consumer.prefetch, [])
+
+    def test_held_message_raises_prefetch_until_requeued(self):
+        message = FakeMessage(eta=message_time(60))
+        in_flight = set()
+
+        self.worker._received(self.loop, in_flight, [[], {}, {}], message)
+        self.assertEqual(self.worker._consumer.prefetch, [3])
+
+        self.worker.stop()
+        self.drain(in_flight)
+
+        self.assertEqual(message.outcome, "requeue")
+        self.assertEqual(self.worker._consumer.prefetch, [3, 2])
+
+
+class EmailWorkerCommandTest(SimpleTestCase):
+    """Test the run_email_worker and benchmark_email_worker commands."""
+
+    def test_worker_needs_aiosmtplib(self):
+        if importlib.util.find_spec("aiosmtplib") is not None:
+            self.skipTest("aiosmtplib is installed")
+
+        with self.assertRaises(CommandError):
+            call_command("run_email_worker", stdout=StringIO())
+
+    def test_benchmark(self):
+        if None in (
+            importlib.util.find_spec("aiosmtpd"),
+            importlib.util.find_spec("aiosmtplib"),
+        ):
+            with self.assertRaises(CommandError):
+                call_command("benchmark_email_worker", messages=3, stdout=StringIO())
+            return
+
+        out = StringIO()
+        call_command(
+            "benchmark_email_worker",
+            messages=6,
+            concurrency=3,
+            latency_ms=1,
+            stdout=out,
+        )
+        self.assertIn("12 delivered", out.getvalue())
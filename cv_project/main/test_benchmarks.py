@@ -0,0 +1,99 @@
+"""
+Tests for the PDF benchmark suite.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from main.benchmarks import (
+    compare_pdf_benchmarks,
+    count_pdf_pages,
+    run_pdf_benchmark,
+    synthetic_cv_data,
+)
+from main.pdf import PDFGenerator
+
+
+class PDFBenchmarkTest(TestCase):
+    """Test measurement and baseline comparison."""
+
+    def test_run_pdf_benchmark(self):
+        results = run_pdf_benchmark(
+            lambda data: PDFGenerator(data).generate(), [0, 2], [100], repeat=1
+        )
+
+        self.assertEqual(
+            [result["case"] for result in results],
+            ["items=0,bio=100", "items=2,bio=100"],
+        )
+        for result in results:
+            self.assertGreater(result["wall_time_ms"], 0)
+            self.assertGreater(result["peak_memory_kb"], 0)
+            self.assertGreaterEqual(result["pages"], 1)
+            self.assertGreater(result["bytes"], 0)
+
+    def test_page_count_grows_with_content(self):
+        small = (
+            PDFGenerator(synthetic_cv_data(skills=0, projects=0, bio_chars=100))
+            .generate()
+            .getvalue()
+        )
+        large = PDFGenerator(synthetic_cv_data(projects=40)).generate().getvalue()
+
+        self.assertEqual(count_pdf_pages(small), 1)
+        self.assertGreater(count_pdf_pages(large), 1)
+
+    def test_compare_flags_regressions(self):
+        baseline = [{"case": "a", "wall_time_ms": 10.0, "peak_memory_kb": 100.0}]
+        current = [{"case": "a", "wall_time_ms": 13.0, "peak_memory_kb": 105.0}]
+
+        regressions = compare_pdf_benchmarks(current, baseline, threshold=0.2)
+
+        self.assertEqual(len(regressions), 1)
+        self.assertEqual(regressions[0]["metric"], "wall_time_ms")
+        self.assertEqual(compare_pdf_benchmarks(current, baseline, threshold=0.5), [])
+
+
+class BenchmarkPDFCommandTest(TestCase):
+    """Test the benchmark_pdf management command."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp_dir, ignore_errors=True)
+
+    def test_output_and_compare(self):
+        output = os.path.join(self.tmp_dir, "results.json")
+        call_command(
+            "benchmark_pdf",
+            items="0",
+            bios="100",
+            repeat=1,
+            output=output,
+            stdout=StringIO(),
+        )
+        with open(output) as results_file:
+            report = json.load(results_file)
+        self.assertEqual(report["results"][0]["case"], "items=0,bio=100")
+
+        # A baseline that is far faster than reality must be flagged
+        report["results"][0]["wall_time_ms"] = 0.001
+        baseline = os.path.join(self.tmp_dir, "baseline.json")
+        with open(baseline, "w") as baseline_file:
+            json.dump(report, baseline_file)
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "benchmark_pdf",
+                items="0",
+                bios="100",
+                repeat=1,
+                compare=baseline,
+                stdout=StringIO(),
+            )
@@ -0,0 +1,201 @@
+"""
+Tests for sending one CV to many recipients.
+"""
+
+import json
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from celery.exceptions import Retry
+from django.core import mail
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from main.models import CV, EmailDelivery, Skill
+from main.tasks import send_cv_pdf_bulk_email
+from main.views import parse_recipients
+
+RECIPIENTS = [f"recruiter{index}@example.com" for index in range(5)]
+
+
+@patch("main.views.generate_cv_pdf_buffer")
+class BulkEmailTaskTest(TestCase):
+    """Test the bulk email task."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Bulk", lastname="Sender", email="bulk@example.com", bio="Bio"
+        )
+        Skill.objects.create(cv=self.cv, name="Python", proficiency="expert")
+
+    def test_renders_once_and_sends_to_everyone(self, mock_generate):
+        mock_generate.return_value = BytesIO(b"%PDF-bulk")
+
+        with patch(
+            "main.tasks.render_to_string", wraps=render_to_string
+        ) as mock_render:
+            result = send_cv_pdf_bulk_email(self.cv.pk, RECIPIENTS, "Jane")
+
+        self.assertTrue(result["success"])
+        self.assertEqual((result["sent"], result["failed"]), (5, 0))
+        self.assertEqual(mock_generate.call_count, 1)
+        # One HTML and one plain text render for all recipients
+        self.assertEqual(mock_render.call_count, 2)
+
+        self.assertEqual(len(mail.outbox), 5)
+        for message, recipient in zip(mail.outbox, RECIPIENTS):
+            self.assertEqual(message.to, [recipient])
+            self.assertIn(recipient, message.body)
+            self.assertEqual(message.attachments[0][1], b"%PDF-bulk")
+
+    @override_settings(EMAIL_BULK_BATCH_SIZE=2)
+    @patch("main.tasks.get_connection")
+    def test_batches_share_a_connection(self, mock_get_connection, mock_generate):
+        mock_generate.return_value = BytesIO(b"%PDF-bulk")
+        connection = mock_get_connection.return_value
+        connection.send_messages.return_value = 1
+
+        send_cv_pdf_bulk_email(self.cv.pk, RECIPIENTS)
+
+        self.assertEqual(connection.open.call_count, 3)
+        self.assertEqual(connection.close.call_count, 3)
+        self.assertEqual(connection.send_messages.call_count, 5)
+
+    @patch("main.tasks.get_connection")
+    def test_failed_recipient_does_not_stop_others(
+        self, mock_get_connection, mock_generate
+    ):
+        mock_generate.return_value = BytesIO(b"%PDF-bulk")
+
+        def send_messages(messages):
+            if messages[0].to == [RECIPIENTS[1]]:
+                raise OSError("mailbox unavailable")
+            return 1
+
+        mock_get_connection.return_value.send_messages.side_effect = send_messages
+
+        result = send_cv_pdf_bulk_email(self.cv.pk, RECIPIENTS)
+
+        self.assertFalse(result["success"])
+        self.assertEqual((result["sent"], result["failed"]), (4, 1))
+        self.assertEqual(
+            result["recipients"][RECIPIENTS[1]],
+            {"status": "failed", "error": "mailbox unavailable"},
+        )
+
+        deliveries = {
+            delivery.recipient: delivery for delivery in self.cv.email_deliveries.all()
+        }
+        self.assertEqual(set(deliveries), set(RECIPIENTS))
+        self.assertEqual(deliveries[RECIPIENTS[1]].state, EmailDelivery.STATE_FAILED)
+        self.assertEqual(deliveries[RECIPIENTS[1]].error, "mailbox unavailable")
+        self.assertEqual(
+            [deliveries[recipient].state for recipient in RECIPIENTS[2:]],
+            [EmailDelivery.STATE_SENT] * 3,
+        )
+
+    @override_settings(EMAIL_BULK_BATCH_SIZE=2)
+    def test_progress_is_reported_per_batch(self, mock_generate):
+        mock_generate.return_value = BytesIO(b"%PDF-bulk")
+
+        with patch.object(send_cv_pdf_bulk_email, "update_state") as mock_update:
+            send_cv_pdf_bulk_email.delay(cv_id=self.cv.pk, recipients=RECIPIENTS)
+
+        self.assertEqual(mock_update.call_count, 3)
+        first = mock_update.call_args_list[0].kwargs
+        self.assertEqual(first["state"], "PROGRESS")
+        self.assertEqual(
+            (first["meta"]["sent"], first["meta"]["pending"], first["meta"]["total"]),
+            (2, 3, 5),
+        )
+
+    @patch("celery.result.AsyncResult")
+    def test_status_is_read_from_deliveries(self, mock_async_result, mock_generate):
+        mock_generate.side_effect = [RuntimeError("render failed"), BytesIO(b"%PDF")]
+        status_url = reverse("check_task_status", kwargs={"task_id": "bulk-1"})
+
+        with self.assertRaises(Retry):
+            send_cv_pdf_bulk_email.apply(
+                args=(self.cv.pk, RECIPIENTS), task_id="bulk-1"
+            )
+        self.assertEqual(self.client.get(status_url).json()["state"], "PENDING")
+
+        EmailDelivery.objects.filter(recipient=RECIPIENTS[0]).update(
+            state=EmailDelivery.STATE_SENT
+        )
+        data = self.client.get(status_url).json()
+        self.assertEqual(data["state"], "PROGRESS")
+        self.assertEqual(
+            (data["progress"]["sent"], data["progress"]["pending"]), (1, 4)
+        )
+
+        send_cv_pdf_bulk_email.apply(
+            args=(self.cv.pk, RECIPIENTS), task_id="bulk-1", retries=1
+        )
+        data = self.client.get(status_url).json()
+        self.assertEqual(data["state"], "SUCCESS")
+        self.assertEqual(data["result"]["sent"], 5)
+        self.assertEqual(EmailDelivery.objects.filter(batch_id="bulk-1").count(), 5)
+        mock_async_result.assert_not_called()
+
+    def test_missing_cv(self, mock_generate):
+        result = send_cv_pdf_bulk_email(9999, RECIPIENTS)
+
+        self.assertFalse(result["success"])
+        mock_generate.assert_not_called()
+
+
+class BulkEmailViewTest(TestCase):
+    """Test the bulk email view and its progress reporting."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Bulk", lastname="View", email="view@example.com", bio="Bio"
+        )
+        self.url = reverse("cv_email_bulk", kwargs={"pk": self.cv.pk})
+
+    def post(self, data):
+        return self.client.post(
+            self.url, data=json.dumps(data), content_type="application/json"
+        )
+
+    def test_parse_recipients(self):
+        self.assertEqual(
+            parse_recipients("a@example.com, b@example.com;\nA@example.com"),
+            ["a@example.com", "b@example.com"],
+        )
+
+    @patch("main.tasks.send_cv_pdf_bulk_email.delay")
+    def test_queues_unique_recipients(self, mock_delay):
+        mock_delay.return_value = MagicMock(id="bulk-task")
+
+        response = self.post({"recipients": RECIPIENTS + [RECIPIENTS[0].upper()]})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["total"], 5)
+        self.assertEqual(mock_delay.call_args.kwargs["recipients"], RECIPIENTS)
+
+    def test_rejects_invalid_addresses(self):
+        response = self.post({"recipients": ["good@example.com", "not-an-email"]})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["invalid"], ["not-an-email"])
+
+    def test_requires_recipients(self):
+        self.assertEqual(self.post({"recipients": []}).status_code, 400)
+
+    @override_settings(EMAIL_BULK_MAX_RECIPIENTS=3)
+    def test_limits_recipients(self):
+        self.assertEqual(self.post({"recipients": RECIPIENTS}).status_code, 400)
+
+    @patch("celery.result.AsyncResult")
+    def test_status_includes_progress(self, mock_async_result):
+        progress = {"total": 5, "sent": 2, "failed": 0, "pending": 3, "recipients": {}}
+        mock_async_result.return_value = MagicMock(state="PROGRESS", info=progress)
+
+        response = self.client.get(
+            reverse("check_task_status", kwargs={"task_id": "bulk-task"})
+        )
+
+        self.assertEqual(response.json()["progress"], progress)
@@ -522,12 +522,12 @@ class TaskConfigurationTest(TestCase):
 
         task_routes = celery_app.conf.task_routes
         # Fixed: Check for actual routing configuration
-        self.assertIn("send_cv_pdf_email", task_routes)
-        self.assertEqual(task_routes["send_cv_pdf_email"]["queue"], "emails")
+        self.assertIn("main.tasks.send_cv_pdf_email", task_routes)
+        self.assertEqual(task_routes["main.tasks.send_cv_pdf_email"]["queue"], "emails")
 
-        self.assertIn("cleanup_old_request_logs", task_routes)
+        self.assertIn("main.tasks.cleanup_old_request_logs", task_routes)
         self.assertEqual(
-            task_routes["cleanup_old_request_logs"]["queue"], "maintenance"
+            task_routes["main.tasks.cleanup_old_request_logs"]["queue"], "maintenance"
         )
 
     def test_beat_schedule_configuration(self):
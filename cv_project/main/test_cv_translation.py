@@ -0,0 +1,194 @@
+"""
+Tests for stored per-field CV translations and incremental re-translation.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from main.models import CV, CVTranslation, Skill
+from main.tasks import translate_cv_content
+
+
+def echo_response(**kwargs):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "kw " + kwargs["messages"][1]["content"]
+    return response
+
+
+@override_settings(OPENAI_API_KEY="test-api-key")
+@patch("openai.OpenAI")
+class IncrementalTranslationTest(TestCase):
+    """Test that only changed fields are re-translated."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Stored",
+            lastname="Fields",
+            email="stored@example.com",
+            bio="Team player.",
+        )
+        self.leadership = Skill.objects.create(cv=self.cv, name="Leadership")
+        Skill.objects.create(cv=self.cv, name="Mentoring")
+
+    def translate(self, mock_openai_class):
+        create = mock_openai_class.return_value.chat.completions.create
+        create.reset_mock()
+        create.side_effect = echo_response
+        result = translate_cv_content(self.cv.pk, "Cornish")
+        return result, create.call_count
+
+    def test_fields_are_stored(self, mock_openai_class):
+        _, calls = self.translate(mock_openai_class)
+
+        self.assertEqual(calls, 3)
+        rows = {row.field: row.text for row in self.cv.translations.all()}
+        self.assertEqual(rows["bio"], "kw Team player.")
+        self.assertEqual(rows[f"skill:{self.leadership.pk}"], "kw Leadership")
+        self.assertEqual(
+            set(self.cv.translations.values_list("language", flat=True)), {"cornish"}
+        )
+
+    def test_unchanged_cv_is_not_translated_again(self, mock_openai_class):
+        self.translate(mock_openai_class)
+
+        result, calls = self.translate(mock_openai_class)
+
+        self.assertEqual(calls, 0)
+        self.assertTrue(result["cached"])
+        self.assertEqual(result["translated_data"]["bio"], "kw Team player.")
+
+    def test_only_edited_field_is_sent(self, mock_openai_class):
+        self.translate(mock_openai_class)
+        self.cv.bio = "Keen team player."
+        self.cv.save()
+
+        result, calls = self.translate(mock_openai_class)
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(result["translated_data"]["bio"], "kw Keen team player.")
+        self.assertIn(
+            "kw Leadership",
+            [skill["name"] for skill in result["translated_data"]["skills"]],
+        )
+
+    def test_deleted_fields_are_removed(self, mock_openai_class):
+        self.translate(mock_openai_class)
+        field = f"skill:{self.leadership.pk}"
+        self.leadership.delete()
+        self.cv.bio = "Keen team player."
+        self.cv.save()
+
+        _, calls = self.translate(mock_openai_class)
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(self.cv.translations.count(), 2)
+        self.assertFalse(self.cv.translations.filter(field=field).exists())
+
+    def test_failed_field_is_retried_next_time(self, mock_openai_class):
+        create = mock_openai_class.return_value.chat.completions.create
+
+        def fail_bio(**kwargs):
+            if kwargs["messages"][1]["content"] == "Team player.":
+                raise ValueError("content filter")
+            return echo_response(**kwargs)
+
+        create.side_effect = fail_bio
+        translate_cv_content(self.cv.pk, "Cornish")
+        self.assertFalse(self.cv.translations.filter(field="bio").exists())
+
+        _, calls = self.translate(mock_openai_class)
+
+        self.assertEqual(calls, 1)
+        self.assertTrue(self.cv.translations.filter(field="bio").exists())
+
+
+class StoredTranslationViewTest(TestCase):
+    """Test that views read complete stored translations directly."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Stored",
+            lastname="Views",
+            email="views@example.com",
+            bio="Team player.",
+        )
+        skill = Skill.objects.create(cv=self.cv, name="Leadership")
+        translate = override_settings(OPENAI_API_KEY="test-api-key")
+        translate.enable()
+        self.addCleanup(translate.disable)
+        with patch("openai.OpenAI") as mock_openai_class:
+            create = mock_openai_class.return_value.chat.completions.create
+            create.side_effect = echo_response
+            translate_cv_content(self.cv.pk, "Breton")
+        self.skill_field = f"skill:{skill.pk}"
+
+    @patch("celery.result.AsyncResult")
+    def test_status_reads_stored_translation(self, mock_async_result):
+        response = self.client.get(
+            reverse("check_translation_status", kwargs={"task_id": "task-1"}),
+            {"cv": self.cv.pk, "language": "breton"},
+        )
+
+        data = response.json()
+        self.assertEqual(data["state"], "SUCCESS")
+        self.assertEqual(data["translated_data"]["bio"], "kw Team player.")
+        mock_async_result.assert_not_called()
+
+    @patch("main.tasks.translate_cv_content.delay")
+    def test_translate_view_answers_from_storage(self, mock_delay):
+        response = self.client.post(
+            reverse("cv_translate", kwargs={"pk": self.cv.pk}),
+            data=json.dumps({"target_language": "breton"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.json()["translated_data"]["bio"], "kw Team player.")
+        mock_delay.assert_not_called()
+
+    @override_settings(OPENAI_API_KEY="")
+    def test_stored_translation_needs_no_api_key(self):
+        url = reverse("cv_translate", kwargs={"pk": self.cv.pk})
+
+        response = self.client.post(
+            url,
+            data=json.dumps({"target_language": "breton"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.json()["translated_data"]["bio"], "kw Team player.")
+
+        self.cv.bio = "Changed."
+        self.cv.save()
+        response = self.client.post(
+            url,
+            data=json.dumps({"target_language": "breton"}),
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 503)
+
+    @patch("main.tasks.translate_cv_content.delay")
+    def test_edited_cv_is_queued(self, mock_delay):
+        mock_delay.return_value = MagicMock(id="task-1")
+        self.cv.bio = "Changed."
+        self.cv.save()
+
+        response = self.client.post(
+            reverse("cv_translate", kwargs={"pk": self.cv.pk}),
+            data=json.dumps({"target_language": "breton"}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.json()["task_id"], "task-1")
+
+    def test_detail_page_embeds_stored_translations(self):
+        CVTranslation.objects.filter(field=self.skill_field).update(text="kw Lead")
+
+        response = self.client.get(reverse("cv_detail", kwargs={"pk": self.cv.pk}))
+
+        translations = response.context["stored_translations"]
+        self.assertEqual(list(translations), ["breton"])
+        self.assertEqual(translations["breton"]["skills"][0]["name"], "kw Lead")
+        self.assertContains(response, 'id="storedTranslations"')
@@ -0,0 +1,170 @@
+"""
+Tests for the pooled SMTP email backend.
+"""
+
+import importlib.util
+import smtplib
+from io import StringIO
+from unittest.mock import MagicMock, patch
+
+from django.core.mail import EmailMessage, get_connection
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, override_settings
+
+from main.email_backends import get_smtp_pool
+
+POOL_SETTINGS = {
+    "MAX_IDLE": 2,
+    "IDLE_TIMEOUT": 60,
+    "MAX_MESSAGES": 3,
+    "HEALTH_CHECK_AFTER": 5,
+}
+
+
+def fake_smtp(*args, **kwargs):
+    connection = MagicMock()
+    connection.noop.return_value = (250, b"OK")
+    return connection
+
+
+@override_settings(
+    EMAIL_BACKEND="main.email_backends.PooledEmailBackend",
+    EMAIL_USE_TLS=True,
+)
+@patch("smtplib.SMTP", side_effect=fake_smtp)
+class PooledEmailBackendTest(SimpleTestCase):
+    """Test connection reuse, expiry, health checks and reconnects."""
+
+    def setUp(self):
+        # A fresh pool per test
+        pool_settings = override_settings(EMAIL_POOL=POOL_SETTINGS)
+        pool_settings.enable()
+        self.addCleanup(pool_settings.disable)
+
+    def send(self, count=1):
+        for index in range(count):
+            EmailMessage(
+                subject=f"CV {index}",
+                body="Body",
+                from_email="cv@example.com",
+                to=["hr@example.com"],
+            ).send()
+
+    def test_connection_is_reused(self, mock_smtp):
+        self.send(2)
+
+        self.assertEqual(mock_smtp.call_count, 1)
+        connection = get_smtp_pool()._idle[get_connection().pool_key][0].connection
+        self.assertEqual(connection.sendmail.call_count, 2)
+        connection.starttls.assert_called_once()
+        connection.quit.assert_not_called()
+
+    def test_max_messages_retires_connection(self, mock_smtp):
+        self.send(4)
+
+        self.assertEqual(mock_smtp.call_count, 2)
+        self.assertEqual(get_smtp_pool().stats()["retired"], 1)
+
+    def test_idle_connection_expires(self, mock_smtp):
+        self.send()
+        pooled = get_smtp_pool()._idle[get_connection().pool_key][0]
+        pooled.last_used -= 120
+
+        self.send()
+
+        self.assertEqual(mock_smtp.call_count, 2)
+        pooled.connection.quit.assert_called_once()
+        self.assertEqual(get_smtp_pool().stats()["expired"], 1)
+
+    def test_unhealthy_connection_is_replaced(self, mock_smtp):
+        self.send()
+        pooled = get_smtp_pool()._idle[get_connection().pool_key][0]
+        pooled.last_used -= 10
+        pooled.connection.noop.side_effect = smtplib.SMTPServerDisconnected()
+
+        self.send()
+
+        self.assertEqual(mock_smtp.call_count, 2)
+        self.assertEqual(get_smtp_pool().stats()["unhealthy"], 1)
+
+    def test_dropped_connection_is_retried(self, mock_smtp):
+        self.send()
+        pooled = get_smtp_pool()._idle[get_connection().pool_key][0]
+        pooled.connection.sendmail.side_effect = smtplib.SMTPServerDisconnected()
+
+        self.send()
+
+        self.assertEqual(mock_smtp.call_count, 2)
+        fresh = get_smtp_pool()._idle[get_connection().pool_key][0]
+        fresh.connection.sendmail.assert_called_once()
+
+    def test_new_connection_failure_is_raised(self, mock_smtp):
+        connection = fake_smtp()
+        connection.sendmail.side_effect = smtplib.SMTPServerDisconnected()
+        mock_smtp.side_effect = [connection]
+
+        with self.assertRaises(smtplib.SMTPServerDisconnected):
+            self.send()
+
+        self.assertEqual(get_smtp_pool().stats()["idle"], 0)
+
+    def test_rejected_message_keeps_connection(self, mock_smtp):
+        connection = fake_smtp()
+        connection.sendmail.side_effect = [
+            smtplib.SMTPRecipientsRefused({}),
+            {},
+        ]
+        mock_smtp.side_effect = [connection]
+
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            self.send()
+        self.send()
+
+        self.assertEqual(mock_smtp.call_count, 1)
+
+    def test_timeout_discards_connection(self, mock_smtp):
+        connection = fake_smtp()
+        connection.sendmail.side_effect = TimeoutError("timed out")
+        mock_smtp.side_effect = [connection, fake_smtp()]
+
+        with self.assertRaises(TimeoutError):
+            self.send()
+        self.send()
+
+        self.assertEqual(mock_smtp.call_count, 2)
+        self.assertEqual(get_smtp_pool().stats()["retired"], 1)
+
+    def test_idle_connections_are_capped(self, mock_smtp):
+        connections = [get_connection() for _ in range(3)]
+        for connection in connections:
+            connection.open()
+        for connection in connections:
+            connection.close()
+
+        self.assertEqual(get_smtp_pool().stats()["idle"], 2)
+        self.assertEqual(mock_smtp.call_count, 3)
+
+    def test_clear_quits_idle_connections(self, mock_smtp):
+        self.send()
+        connection = get_smtp_pool()._idle[get_connection().pool_key][0].connection
+
+        get_smtp_pool().clear()
+
+        connection.quit.assert_called_once()
+        self.assertEqual(get_smtp_pool().stats()["idle"], 0)
+
+
+class BenchmarkEmailPoolCommandTest(SimpleTestCase):
+    """Test the benchmark_email_pool management command."""
+
+    def test_benchmark(self):
+        if importlib.util.find_spec("aiosmtpd") is None:
+            with self.assertRaises(CommandError):
+                call_command("benchmark_email_pool", messages=3, stdout=StringIO())
+            return
+
+        out = StringIO()
+        call_command("benchmark_email_pool", messages=3, stdout=out)
+        # Both the per-send and the pooled run deliver every message
+        self.assertIn("6 delivered", out.getvalue())
@@ -0,0 +1,154 @@
+"""
+Tests for recorded email deliveries and the status endpoint reading them.
+"""
+
+import json
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from celery.exceptions import Retry
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from main.models import CV, EmailDelivery
+from main.tasks import send_cv_pdf_email
+
+STATUS_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "email-delivery-tests",
+    }
+}
+
+
+@patch(
+    "main.views.generate_cv_pdf_buffer",
+    side_effect=lambda *args, **kwargs: BytesIO(b"%PDF-delivery"),
+)
+class EmailDeliveryTaskTest(TestCase):
+    """Test the delivery rows written by the email task."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Tracked",
+            lastname="Email",
+            email="tracked@example.com",
+            bio="Bio",
+        )
+
+    def test_sent_delivery(self, mock_generate):
+        send_cv_pdf_email.apply(
+            kwargs={"cv_id": self.cv.pk, "recipient_email": "hr@example.com"},
+            task_id="task-1",
+        )
+
+        delivery = EmailDelivery.objects.get(task_id="task-1")
+        self.assertEqual(delivery.state, EmailDelivery.STATE_SENT)
+        self.assertEqual(delivery.cv, self.cv)
+        self.assertEqual(delivery.attempts, 1)
+        self.assertGreater(delivery.message_size, len(b"%PDF-delivery"))
+        self.assertIsNotNone(delivery.duration_ms)
+        self.assertEqual(list(self.cv.email_deliveries.all()), [delivery])
+
+    @patch("main.tasks.EmailMessage.send", side_effect=OSError("connection refused"))
+    def test_retries_and_failure(self, mock_send, mock_generate):
+        kwargs = {"cv_id": self.cv.pk, "recipient_email": "hr@example.com"}
+
+        with self.assertRaises(Retry):
+            send_cv_pdf_email.apply(kwargs=kwargs, task_id="task-1")
+        delivery = EmailDelivery.objects.get(task_id="task-1")
+        self.assertEqual(delivery.state, EmailDelivery.STATE_RETRYING)
+        self.assertEqual(delivery.error, "connection refused")
+
+        send_cv_pdf_email.apply(
+            kwargs=kwargs, task_id="task-1", retries=send_cv_pdf_email.max_retries
+        )
+        delivery.refresh_from_db()
+        self.assertEqual(delivery.state, EmailDelivery.STATE_FAILED)
+        self.assertEqual(delivery.attempts, send_cv_pdf_email.max_retries + 1)
+        self.assertIsNotNone(delivery.finished_at)
+
+    def test_delivery_recorded_before_task(self, mock_generate):
+        queued = EmailDelivery.objects.create(
+            task_id="task-1", cv=self.cv, recipient="hr@example.com"
+        )
+
+        send_cv_pdf_email.apply(
+            kwargs={"cv_id": self.cv.pk, "recipient_email": "hr@example.com"},
+            task_id="task-1",
+        )
+
+        delivery = EmailDelivery.objects.get()
+        self.assertEqual(delivery.pk, queued.pk)
+        self.assertEqual(delivery.state, EmailDelivery.STATE_SENT)
+
+    def test_missing_cv(self, mock_generate):
+        send_cv_pdf_email(9999, "hr@example.com")
+
+        delivery = EmailDelivery.objects.get()
+        self.assertIsNone(delivery.cv)
+        self.assertEqual(delivery.state, EmailDelivery.STATE_FAILED)
+
+
+@patch("celery.result.AsyncResult")
+class EmailDeliveryStatusTest(TestCase):
+    """Test that email status is read from the delivery table."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Status", lastname="Poll", email="status@example.com", bio="Bio"
+        )
+
+    def status(self, task_id):
+        return self.client.get(
+            reverse("check_task_status", kwargs={"task_id": task_id})
+        )
+
+    @patch("main.tasks.send_cv_pdf_email.delay")
+    def test_queued_email_is_pending(self, mock_delay, mock_async_result):
+        mock_delay.return_value = MagicMock(id="task-1")
+        self.client.post(
+            reverse("cv_email", kwargs={"pk": self.cv.pk}),
+            data=json.dumps({"email": "hr@example.com"}),
+            content_type="application/json",
+        )
+
+        data = self.status("task-1").json()
+
+        self.assertEqual(data["state"], "PENDING")
+        self.assertEqual(data["delivery"]["recipient"], "hr@example.com")
+        mock_async_result.assert_not_called()
+
+    def test_failed_delivery(self, mock_async_result):
+        EmailDelivery.objects.create(
+            cv=self.cv,
+            task_id="task-1",
+            recipient="hr@example.com",
+            state=EmailDelivery.STATE_FAILED,
+            error="mailbox unavailable",
+        )
+
+        data = self.status("task-1").json()
+
+        self.assertEqual(data["state"], "FAILURE")
+        self.assertEqual(data["error"], "mailbox unavailable")
+        mock_async_result.assert_not_called()
+
+    @override_settings(CACHES=STATUS_CACHES)
+    def test_status_is_cached(self, mock_async_result):
+        EmailDelivery.objects.create(
+            cv=self.cv,
+            task_id="task-1",
+            recipient="hr@example.com",
+            state=EmailDelivery.STATE_SENT,
+        )
+        self.assertEqual(self.status("task-1").json()["state"], "SUCCESS")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.status("task-1").json()["state"], "SUCCESS")
+
+    def test_unknown_task_uses_result_backend(self, mock_async_result):
+        mock_async_result.return_value = MagicMock(state="PENDING")
+
+        self.assertEqual(self.status("bulk-task").json()["state"], "PENDING")
+        mock_async_result.assert_called_once()
@@ -0,0 +1,132 @@
+"""
+Tests for the two-stage (build, then send) CV email pipeline.
+"""
+
+from io import BytesIO
+from unittest.mock import patch
+
+from celery.exceptions import Retry
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail import EmailMessage
+from django.template.loader import render_to_string
+from django.test import TestCase, override_settings
+
+from main.models import CV
+from main.tasks import email_delivery_key, send_cv_pdf_email
+
+PIPELINE_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "email-pipeline-tests",
+    }
+}
+
+send_email = EmailMessage.send
+
+
+def failing_send(failures):
+    """Return an ``EmailMessage.send`` replacement failing ``failures`` times."""
+    calls = []
+
+    def send(message, *args, **kwargs):
+        calls.append(message)
+        if len(calls) <= failures:
+            raise OSError("connection refused")
+        return send_email(message, *args, **kwargs)
+
+    return send
+
+
+@override_settings(CACHES=PIPELINE_CACHES)
+@patch(
+    "main.views.generate_cv_pdf_buffer",
+    side_effect=lambda *args, **kwargs: BytesIO(b"%PDF-pipeline"),
+)
+class EmailPipelineTest(TestCase):
+    """Test artifact reuse across retries and duplicate suppression."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Retry", lastname="Safe", email="retry@example.com", bio="Bio"
+        )
+        self.kwargs = {"cv_id": self.cv.pk, "recipient_email": "hr@example.com"}
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_delivery_key(self, mock_generate):
+        self.assertEqual(
+            email_delivery_key(1, "HR@example.com "),
+            email_delivery_key(1, "hr@example.com"),
+        )
+        self.assertNotEqual(
+            email_delivery_key(1, "hr@example.com"),
+            email_delivery_key(1, "hr@example.com", "Breton"),
+        )
+
+    def test_retry_only_resends(self, mock_generate):
+        with patch("main.tasks.EmailMessage.send", failing_send(1)), patch(
+            "main.tasks.render_to_string", wraps=render_to_string
+        ) as mock_render:
+            with self.assertRaises(Retry):
+                send_cv_pdf_email.apply(kwargs=self.kwargs, task_id="task-1")
+            result = send_cv_pdf_email.apply(
+                kwargs=self.kwargs, task_id="task-1", retries=1
+            ).get()
+
+        self.assertTrue(result["success"])
+        self.assertEqual(mock_generate.call_count, 1)
+        self.assertEqual(mock_render.call_count, 2)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].attachments[0][1], b"%PDF-pipeline")
+
+    def test_duplicate_submission_collapses(self, mock_generate):
+        first = send_cv_pdf_email.apply(kwargs=self.kwargs, task_id="task-1").get()
+        second = send_cv_pdf_email.apply(kwargs=self.kwargs, task_id="task-2").get()
+
+        self.assertTrue(first["success"])
+        self.assertTrue(second["duplicate"])
+        self.assertEqual(len(mail.outbox), 1)
+
+        # Another recipient is a separate delivery
+        send_cv_pdf_email(self.cv.pk, "cto@example.com")
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_failed_delivery_can_be_resubmitted(self, mock_generate):
+        with patch("main.tasks.EmailMessage.send", failing_send(1)):
+            result = send_cv_pdf_email.apply(
+                kwargs=self.kwargs,
+                task_id="task-1",
+                retries=send_cv_pdf_email.max_retries,
+            ).get()
+
+        self.assertFalse(result["success"])
+        self.assertIn("connection refused", result["error"])
+
+        result = send_cv_pdf_email.apply(kwargs=self.kwargs, task_id="task-2").get()
+        self.assertTrue(result["success"])
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_resubmission_after_failure_rebuilds_email(self, mock_generate):
+        with patch("main.tasks.EmailMessage.send", failing_send(1)):
+            send_cv_pdf_email.apply(
+                kwargs={**self.kwargs, "sender_name": "Old Sender"},
+                task_id="task-1",
+                retries=send_cv_pdf_email.max_retries,
+            )
+
+        result = send_cv_pdf_email.apply(
+            kwargs={**self.kwargs, "sender_name": "New Sender"}, task_id="task-2"
+        ).get()
+
+        self.assertTrue(result["success"])
+        self.assertEqual(mock_generate.call_count, 2)
+        self.assertIn("New Sender", mail.outbox[0].body)
+        self.assertNotIn("Old Sender", mail.outbox[0].body)
+
+    def test_missing_cv_is_not_retried(self, mock_generate):
+        result = send_cv_pdf_email(9999, "hr@example.com")
+
+        self.assertFalse(result["success"])
+        mock_generate.assert_not_called()
@@ -0,0 +1,183 @@
+"""
+Tests for context processor and template render instrumentation.
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.template import Context, Template
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from main.context_processors import app_context
+from main.instrumentation import (
+    instrument_context_processor,
+    instrument_template_render,
+    measure,
+    render_metrics,
+)
+from main.models import CV
+
+PROFILING_MIDDLEWARE = [
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "main.instrumentation.RenderProfilingMiddleware",
+]
+
+
+class RenderMetricsTest(TestCase):
+    """Test the render metrics aggregation."""
+
+    def setUp(self):
+        render_metrics.reset()
+        self.factory = RequestFactory()
+        CV.objects.create(
+            firstname="Render",
+            lastname="Metrics",
+            email="render@example.com",
+            bio="Instrumentation test biography",
+        )
+
+    def test_measure_records_duration_and_queries(self):
+        """Test that a measured block records its queries."""
+        with measure("context_processors", "test.block"):
+            CV.objects.count()
+            CV.objects.exists()
+
+        entry = render_metrics.snapshot()["context_processors"]["test.block"]
+        self.assertEqual(entry["calls"], 1)
+        self.assertEqual(entry["queries"], 2)
+        self.assertGreaterEqual(entry["total_ms"], 0)
+
+    def test_nested_measure_self_time(self):
+        """Test that nested blocks are excluded from the parent's self time."""
+        with measure("templates", "outer.html"):
+            with measure("templates", "inner.html"):
+                CV.objects.count()
+
+        snapshot = render_metrics.snapshot()["templates"]
+        self.assertEqual(snapshot["inner.html"]["queries"], 1)
+        self.assertLessEqual(
+            snapshot["outer.html"]["self_ms"], snapshot["outer.html"]["total_ms"]
+        )
+
+    def test_instrumented_context_processor(self):
+        """Test that wrapped processors keep their output and are measured."""
+        wrapped = instrument_context_processor(app_context)
+        request = self.factory.get("/")
+
+        context = wrapped(request)
+
+        self.assertEqual(context["app_info"]["stats"]["total_cvs"], 1)
+        name = "main.context_processors.app_context"
+        entry = render_metrics.snapshot()["context_processors"][name]
+        self.assertEqual(entry["calls"], 1)
+        self.assertGreater(entry["queries"], 0)
+        self.assertIs(instrument_context_processor(wrapped), wrapped)
+
+    def test_instrumented_template_render(self):
+        """Test that template renders are recorded by template name."""
+        template = Template("Hello {{ name }}")
+        template.name = "greeting.html"
+
+        with patch.object(
+            Template, "_render", instrument_template_render(Template._render)
+        ):
+            output = template.render(Context({"name": "World"}))
+
+        self.assertEqual(output, "Hello World")
+        self.assertIn("greeting.html", render_metrics.snapshot()["templates"])
+
+    def test_configured_processors_are_instrumented(self):
+        """Test that page views record every configured context processor."""
+        self.client.get(reverse("cv_list"))
+
+        recorded = render_metrics.snapshot()["context_processors"]
+        for name in ("settings_context", "request_context", "app_context"):
+            self.assertIn(f"main.context_processors.{name}", recorded)
+
+    def test_prometheus_label_escaping(self):
+        """Test that quotes, backslashes and newlines in names are escaped."""
+        render_metrics.record("templates", 'a\\b"c\nd.html', 1.0, 0)
+
+        self.assertIn(
+            'cv_template_render_calls_total{template="a\\\\b\\"c\\nd.html"} 1',
+            render_metrics.as_prometheus().splitlines(),
+        )
+
+
+class RenderProfilingMiddlewareTest(TestCase):
+    """Test the per-request profiling middleware and metrics endpoint."""
+
+    def setUp(self):
+        render_metrics.reset()
+        self.cv = CV.objects.create(
+            firstname="Panel",
+            lastname="User",
+            email="panel@example.com",
+            bio="Debug panel biography",
+        )
+
+    @override_settings(MIDDLEWARE=PROFILING_MIDDLEWARE, RENDER_DEBUG_PANEL=False)
+    def test_server_timing_header(self):
+        """Test that profiled pages carry a Server-Timing header."""
+        response = self.client.get(reverse("cv_detail", kwargs={"pk": self.cv.pk}))
+
+        self.assertIn("ctxproc;dur=", response["Server-Timing"])
+        self.assertNotContains(response, "render-debug-panel")
+
+    @override_settings(MIDDLEWARE=PROFILING_MIDDLEWARE, RENDER_DEBUG_PANEL=True)
+    def test_debug_panel_injected(self):
+        """Test that the debug panel lists context processors."""
+        response = self.client.get(reverse("cv_detail", kwargs={"pk": self.cv.pk}))
+
+        self.assertContains(response, "render-debug-panel")
+        self.assertContains(response, "main.context_processors.app_context")
+
+    @override_settings(
+        MIDDLEWARE=PROFILING_MIDDLEWARE,
+        RENDER_DEBUG_PANEL=True,
+        INTERNAL_IPS=["127.0.0.1"],
+    )
+    def test_debug_panel_skips_json(self):
+        """Test that non-HTML responses are left untouched."""
+        response = self.client.get(reverse("render_metrics_api"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(b"render-debug-panel", response.content)
+
+    @override_settings(INTERNAL_IPS=["127.0.0.1"])
+    def test_metrics_api_json(self):
+        """Test the JSON metrics endpoint."""
+        self.client.get(reverse("cv_list"))
+        response = self.client.get(reverse("render_metrics_api"))
+
+        data = response.json()
+        self.assertIn("context_processors", data)
+        self.assertIn("templates", data)
+        self.assertIn(
+            "main.context_processors.settings_context", data["context_processors"]
+        )
+
+    @override_settings(INTERNAL_IPS=["127.0.0.1"])
+    def test_metrics_api_prometheus(self):
+        """Test the Prometheus metrics format."""
+        self.client.get(reverse("cv_list"))
+        response = self.client.get(
+            reverse("render_metrics_api"), {"format": "prometheus"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"cv_context_processor_calls_total", response.content)
+
+    # The cache session backend needs a real cache to log in
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies")
+    def test_metrics_api_requires_staff_or_internal_ip(self):
+        """Test that other clients cannot read the metrics."""
+        url = reverse("render_metrics_api")
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        staff = User.objects.create_user("metrics", is_staff=True)
+        self.client.force_login(staff)
+        self.assertEqual(self.client.get(url).status_code, 200)
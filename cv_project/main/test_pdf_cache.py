@@ -0,0 +1,440 @@
+"""
+Tests for the content-addressed CV PDF cache.
+"""
+
+import shutil
+import tempfile
+from datetime import date
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from main.models import CV, Contact, Project, Skill
+from main.pdf_cache import FileSystemPDFCache, cv_content_hash, get_pdf_cache
+from main.tasks import prerender_cv_pdf, send_cv_pdf_email
+from main.views import generate_cv_pdf_buffer, parse_byte_range
+
+
+class PDFCacheTestMixin:
+    """Point the PDF cache at a temporary directory for each test."""
+
+    def setUp(self):
+        super().setUp()
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+        settings_override = override_settings(
+            PDF_CACHE={
+                "BACKEND": "main.pdf_cache.FileSystemPDFCache",
+                "LOCATION": self.cache_dir,
+                "MAX_SIZE": 10 * 1024 * 1024,
+            }
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.cv = CV.objects.create(
+            firstname="Cache",
+            lastname="Test",
+            email="cache@example.com",
+            bio="Biography for cache testing",
+        )
+        self.skill = Skill.objects.create(
+            cv=self.cv, name="Python", proficiency="expert"
+        )
+        self.project = Project.objects.create(
+            cv=self.cv,
+            title="Cached Project",
+            description="Project description",
+            technologies="Python, Django",
+            start_date=date(2023, 1, 1),
+        )
+        self.contact = Contact.objects.create(
+            cv=self.cv,
+            contact_type="github",
+            value="cachetest",
+            url="https://github.com/cachetest",
+        )
+
+    def _reload_cv(self):
+        return CV.objects.prefetch_related("skills", "projects", "contacts").get(
+            pk=self.cv.pk
+        )
+
+
+class CVContentHashTest(PDFCacheTestMixin, TestCase):
+    """Test the CV content hash."""
+
+    def test_hash_is_stable(self):
+        """Test that an unchanged CV hashes to the same value."""
+        self.assertEqual(
+            cv_content_hash(self._reload_cv()), cv_content_hash(self._reload_cv())
+        )
+
+    def test_hash_changes_with_children(self):
+        """Test that editing a related row changes the hash."""
+        before = cv_content_hash(self._reload_cv())
+
+        self.skill.proficiency = "beginner"
+        self.skill.save()
+
+        self.assertNotEqual(before, cv_content_hash(self._reload_cv()))
+
+    def test_hash_with_prefetch_runs_no_queries(self):
+        """Test that hashing a prefetched CV does not hit the database."""
+        cv = self._reload_cv()
+        with self.assertNumQueries(0):
+            cv_content_hash(cv)
+
+
+class FileSystemPDFCacheTest(TestCase):
+    """Test the local disk backend."""
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.cache_dir, ignore_errors=True)
+
+    def test_set_and_get(self):
+        """Test storing and reading back a PDF."""
+        cache = FileSystemPDFCache(location=self.cache_dir)
+        cache.set(1, "abc", b"%PDF-data")
+
+        self.assertEqual(cache.get(1, "abc"), b"%PDF-data")
+        self.assertIsNone(cache.get(1, "missing"))
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 1})
+
+    def test_invalidate(self):
+        """Test that invalidation drops only the given CV."""
+        cache = FileSystemPDFCache(location=self.cache_dir)
+        cache.set(1, "abc", b"one")
+        cache.set(2, "def", b"two")
+
+        cache.invalidate(1)
+
+        self.assertIsNone(cache.get(1, "abc"))
+        self.assertEqual(cache.get(2, "def"), b"two")
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first."""
+        import os
+        import time
+
+        cache = FileSystemPDFCache(location=self.cache_dir, max_size=25)
+        cache.set(1, "old", b"x" * 10)
+        cache.set(2, "recent", b"y" * 10)
+
+        # Make the first entry look older, then touch it with a read
+        past = time.time() - 100
+        os.utime(cache.path(1, "old"), (past, past))
+        os.utime(cache.path(2, "recent"), (past + 10, past + 10))
+        cache.get(1, "old")
+
+        cache.set(3, "new", b"z" * 10)
+
+        self.assertIsNotNone(cache.get(1, "old"))
+        self.assertIsNone(cache.get(2, "recent"))
+        self.assertIsNotNone(cache.get(3, "new"))
+
+
+class PDFCacheIntegrationTest(PDFCacheTestMixin, TestCase):
+    """Test that downloads and emails reuse cached PDFs."""
+
+    def test_repeated_downloads_render_once(self):
+        """Test that an unchanged CV is rendered once, then served from disk."""
+        url = reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+
+        with patch(
+            "main.views.generate_cv_pdf_buffer", wraps=generate_cv_pdf_buffer
+        ) as mock_generate:
+            first = self.client.get(url)
+            second = self.client.get(url)
+
+        self.assertEqual(mock_generate.call_count, 1)
+        self.assertFalse(first.streaming)
+        self.assertTrue(second.streaming)
+        self.assertEqual(first.content, b"".join(second.streaming_content))
+        self.assertEqual(
+            second["Content-Disposition"], 'attachment; filename="Cache_Test_CV.pdf"'
+        )
+
+    def test_signals_invalidate_cache(self):
+        """Test that saving or deleting children triggers a re-render."""
+        url = reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+
+        with patch(
+            "main.views.generate_cv_pdf_buffer", wraps=generate_cv_pdf_buffer
+        ) as mock_generate:
+            self.client.get(url)
+            self.contact.delete()
+            self.client.get(url)
+            self.project.title = "Renamed Project"
+            self.project.save()
+            self.client.get(url)
+
+        self.assertEqual(mock_generate.call_count, 3)
+
+    def test_save_drops_cached_files(self):
+        """Test that a CV save removes its cached files from disk."""
+        cache = get_pdf_cache()
+        self.client.get(reverse("cv_pdf_download", kwargs={"pk": self.cv.pk}))
+        self.assertTrue(any(cache.location.glob(f"{self.cv.pk}/*.pdf")))
+
+        self.cv.bio = "Updated biography"
+        self.cv.save()
+
+        self.assertFalse(any(cache.location.glob(f"{self.cv.pk}/*.pdf")))
+
+    @patch("main.tasks.EmailMessage")
+    def test_email_reuses_download_pdf(self, mock_email_class):
+        """Test that the email task skips rendering after a download."""
+        download = self.client.get(
+            reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+        )
+
+        with patch("main.views.generate_cv_pdf_buffer") as mock_generate:
+            result = send_cv_pdf_email(
+                cv_id=self.cv.pk, recipient_email="recruiter@example.com"
+            )
+
+        self.assertTrue(result["success"])
+        mock_generate.assert_not_called()
+        attach_args = mock_email_class.return_value.attach.call_args[0]
+        self.assertEqual(attach_args[1], download.content)
+
+
+class PDFPrerenderTest(PDFCacheTestMixin, TestCase):
+    """Test background pre-rendering and file serving."""
+
+    def test_prerender_task_writes_file(self):
+        """Test that the task renders into the cache and skips when fresh."""
+        result = prerender_cv_pdf(self.cv.pk)
+        self.assertTrue(result["rendered"])
+
+        cache = get_pdf_cache()
+        path = cache.get_path(self.cv.pk, cv_content_hash(self._reload_cv()))
+        self.assertIsNotNone(path)
+        self.assertTrue(path.read_bytes().startswith(b"%PDF"))
+
+        self.assertFalse(prerender_cv_pdf(self.cv.pk)["rendered"])
+
+    def test_prerender_task_missing_cv(self):
+        """Test that the task tolerates deleted CVs."""
+        result = prerender_cv_pdf(9999)
+        self.assertFalse(result["success"])
+
+    @override_settings(PDF_PRERENDER_ON_CHANGE=True)
+    def test_change_schedules_prerender(self):
+        """Test that edits re-render the PDF so downloads skip ReportLab."""
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.skill.proficiency = "advanced"
+            self.skill.save()
+        self.assertEqual(len(callbacks), 1)
+
+        with patch("main.views.generate_cv_pdf_buffer") as mock_generate:
+            response = self.client.get(
+                reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+            )
+
+        mock_generate.assert_not_called()
+        self.assertTrue(response.streaming)
+
+    @override_settings(PDF_PRERENDER_ON_CHANGE=True)
+    def test_cv_delete_does_not_schedule(self):
+        """Test that deleting a CV does not queue a render for it."""
+        bare_cv = CV.objects.create(
+            firstname="Bare", lastname="CV", email="bare@example.com", bio="Bio"
+        )
+
+        with patch("main.signals.schedule_pdf_prerender") as mock_schedule:
+            bare_cv.delete()
+
+        mock_schedule.assert_not_called()
+
+    @override_settings(PDF_PRERENDER_ON_CHANGE=True)
+    def test_cv_delete_skips_child_signals(self):
+        """Test that a CV's cascade does not touch the CV once per child."""
+        cv_id = self.cv.pk
+        with patch("main.signals.get_pdf_cache") as mock_get_cache, patch(
+            "main.signals.schedule_pdf_prerender"
+        ) as mock_schedule, CaptureQueriesContext(connection) as queries:
+            self.cv.delete()
+
+        mock_get_cache.return_value.invalidate.assert_called_once_with(cv_id)
+        mock_schedule.assert_not_called()
+        self.assertFalse(
+            [query for query in queries if query["sql"].startswith('UPDATE "main_cv"')]
+        )
+
+    @override_settings(PDF_PRERENDER_ON_CHANGE=True)
+    def test_loaddata_is_ignored(self):
+        """Test that fixture rows neither invalidate nor schedule renders."""
+        with patch("main.signals.get_pdf_cache") as mock_get_cache, patch(
+            "main.signals.schedule_pdf_prerender"
+        ) as mock_schedule:
+            call_command("loaddata", "initial_data", verbosity=0)
+
+        mock_get_cache.assert_not_called()
+        mock_schedule.assert_not_called()
+
+    @override_settings(PDF_SENDFILE_BACKEND="nginx", PDF_SENDFILE_URL="/protected/pdf/")
+    def test_nginx_sendfile(self):
+        """Test that pre-rendered files are handed to nginx."""
+        prerender_cv_pdf(self.cv.pk)
+
+        response = self.client.get(
+            reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+        )
+
+        content_hash = cv_content_hash(self._reload_cv())
+        self.assertEqual(
+            response["X-Accel-Redirect"],
+            f"/protected/pdf/{self.cv.pk}/{content_hash}.pdf",
+        )
+        self.assertEqual(response.content, b"")
+
+    @override_settings(PDF_SENDFILE_BACKEND="apache")
+    def test_apache_sendfile(self):
+        """Test that pre-rendered files are handed to mod_xsendfile."""
+        prerender_cv_pdf(self.cv.pk)
+
+        response = self.client.get(
+            reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+        )
+
+        self.assertTrue(response["X-Sendfile"].startswith(self.cache_dir))
+
+
+class ParseByteRangeTest(TestCase):
+    """Test ``Range`` header parsing."""
+
+    def test_ranges(self):
+        self.assertEqual(parse_byte_range("bytes=0-9", 100), (0, 9))
+        self.assertEqual(parse_byte_range("bytes=90-", 100), (90, 99))
+        self.assertEqual(parse_byte_range("bytes=-10", 100), (90, 99))
+        self.assertEqual(parse_byte_range("bytes=50-500", 100), (50, 99))
+
+    def test_ignored_headers(self):
+        for header in (None, "", "items=0-1", "bytes=0-1,5-6", "bytes=9-1", "bytes=a-"):
+            with self.subTest(header=header):
+                self.assertIsNone(parse_byte_range(header, 100))
+
+    def test_unsatisfiable(self):
+        for header in ("bytes=100-", "bytes=-0"):
+            with self.subTest(header=header):
+                with self.assertRaises(ValueError):
+                    parse_byte_range(header, 100)
+
+
+class PDFConditionalDownloadTest(PDFCacheTestMixin, TestCase):
+    """Test validators, 304 answers and byte ranges on PDF downloads."""
+
+    def setUp(self):
+        super().setUp()
+        self.url = reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+
+    def test_validators(self):
+        """Test that downloads carry ETag, Last-Modified and Accept-Ranges."""
+        response = self.client.get(self.url)
+
+        content_hash = cv_content_hash(self._reload_cv())
+        self.assertEqual(response["ETag"], f'"{content_hash}"')
+        self.assertIn("Last-Modified", response)
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_if_none_match_skips_rendering(self):
+        """Test that a matching ETag answers 304 without rendering."""
+        etag = self.client.get(self.url)["ETag"]
+        get_pdf_cache().invalidate(self.cv.pk)
+
+        with patch("main.views.generate_cv_pdf_buffer") as mock_generate:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        mock_generate.assert_not_called()
+
+    def test_if_modified_since(self):
+        """Test that an up-to-date client copy answers 304."""
+        last_modified = self.client.get(self.url)["Last-Modified"]
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_child_change_updates_validators(self):
+        """Test that editing or deleting a related row refreshes validators."""
+        first = self.client.get(self.url)
+
+        self.skill.name = "Go"
+        self.skill.save()
+        second = self.client.get(self.url, HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second["ETag"], first["ETag"])
+
+        before_delete = CV.objects.get(pk=self.cv.pk).updated_at
+        self.contact.delete()
+        self.assertGreater(CV.objects.get(pk=self.cv.pk).updated_at, before_delete)
+
+    def test_range_on_rendered_pdf(self):
+        """Test a byte range served straight after rendering."""
+        full = self.client.get(self.url).content
+        get_pdf_cache().invalidate(self.cv.pk)
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=0-99")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, full[:100])
+        self.assertEqual(response["Content-Range"], f"bytes 0-99/{len(full)}")
+
+    def test_range_on_cached_file(self):
+        """Test a resumed download of a pre-rendered file."""
+        full = self.client.get(self.url).content
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=100-")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, full[100:])
+        self.assertEqual(response["Accept-Ranges"], "bytes")
+
+    def test_file_removed_after_lookup(self):
+        """Test that a cached file deleted after the lookup is rendered again."""
+        full = self.client.get(self.url).content
+        pdf_cache = get_pdf_cache()
+        get_path = pdf_cache.get_path
+
+        def get_removed_path(*args):
+            path = get_path(*args)
+            path.unlink()
+            return path
+
+        with patch.object(pdf_cache, "get_path", side_effect=get_removed_path):
+            response = self.client.get(self.url)
+            ranged = self.client.get(self.url, HTTP_RANGE="bytes=100-")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, full)
+        self.assertEqual(ranged.status_code, 206)
+        self.assertEqual(ranged.content, full[100:])
+
+    def test_unsatisfiable_range(self):
+        """Test that a range past the end answers 416."""
+        size = len(self.client.get(self.url).content)
+
+        response = self.client.get(self.url, HTTP_RANGE=f"bytes={size}-")
+
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], f"bytes */{size}")
+
+    def test_stale_if_range_returns_full_document(self):
+        """Test that a range for an outdated copy returns the whole PDF."""
+        self.client.get(self.url)
+
+        response = self.client.get(
+            self.url, HTTP_RANGE="bytes=0-99", HTTP_IF_RANGE='"outdated"'
+        )
+
+        self.assertEqual(response.status_code, 200)
@@ -0,0 +1,216 @@
+"""
+Tests for the bulk CV PDF export.
+"""
+
+import io
+import os
+import shutil
+import tempfile
+import zipfile
+from concurrent.futures import Future
+from datetime import datetime, timezone
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from main.models import CV
+from main.pdf_export import filter_cvs, iter_cv_pdfs, stream_zip
+
+
+class PDFExportTestMixin:
+    """Create a handful of CVs to export."""
+
+    def setUp(self):
+        super().setUp()
+        self.cvs = [
+            CV.objects.create(
+                firstname=f"Export{index}",
+                lastname="User",
+                email=f"export{index}@example.com",
+                bio="Python developer" if index % 2 else "Designer",
+            )
+            for index in range(4)
+        ]
+        CV.objects.filter(pk=self.cvs[0].pk).update(
+            created_at=datetime(2023, 1, 15, tzinfo=timezone.utc)
+        )
+
+
+class FilterCVsTest(PDFExportTestMixin, TestCase):
+    """Test the export selection filters."""
+
+    def test_filter_by_ids(self):
+        queryset = filter_cvs(ids=[self.cvs[1].pk, self.cvs[2].pk])
+        self.assertEqual(set(queryset), {self.cvs[1], self.cvs[2]})
+
+    def test_filter_by_query(self):
+        queryset = filter_cvs(q="python")
+        self.assertEqual(set(queryset), {self.cvs[1], self.cvs[3]})
+
+    def test_filter_by_created_range(self):
+        queryset = filter_cvs(created_from="2023-01-01", created_to="2023-01-15")
+        self.assertEqual(list(queryset), [self.cvs[0]])
+
+    def test_invalid_date(self):
+        with self.assertRaises(ValueError):
+            filter_cvs(created_from="last week")
+
+
+class StreamZipTest(TestCase):
+    """Test the streaming ZIP writer."""
+
+    def test_archive_is_valid(self):
+        entries = [("a.pdf", b"%PDF-a"), ("b.pdf", b"%PDF-b")]
+        archive = zipfile.ZipFile(BytesIO(b"".join(stream_zip(entries))))
+
+        self.assertEqual(archive.namelist(), ["a.pdf", "b.pdf"])
+        self.assertEqual(archive.read("b.pdf"), b"%PDF-b")
+
+    def test_failed_entries_are_listed(self):
+        entries = [("a.pdf", b"%PDF-a"), ("b.pdf", None)]
+        archive = zipfile.ZipFile(BytesIO(b"".join(stream_zip(entries))))
+
+        self.assertEqual(archive.namelist(), ["a.pdf", "errors.txt"])
+        self.assertIn(b"b.pdf", archive.read("errors.txt"))
+
+    def test_chunks_follow_entries(self):
+        """Test that each member is emitted before the next one is requested."""
+        consumed = []
+
+        def entries():
+            for name in ("a.pdf", "b.pdf", "c.pdf"):
+                consumed.append(name)
+                yield name, b"%PDF-" + name.encode()
+
+        chunks = stream_zip(entries())
+        next(chunks)
+        self.assertEqual(consumed, ["a.pdf"])
+
+
+# The cache session backend needs a real cache to log in
+@override_settings(SESSION_ENGINE="django.contrib.sessions.backends.signed_cookies")
+class PDFExportViewTest(PDFExportTestMixin, TestCase):
+    """Test the streamed ZIP export endpoint."""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(User.objects.create_user("exporter", is_staff=True))
+
+    def _archive(self, response):
+        return zipfile.ZipFile(BytesIO(b"".join(response.streaming_content)))
+
+    def test_export_all(self):
+        response = self.client.get(
+            reverse("cv_pdf_export"), {"created_from": "2000-01-01"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        archive = self._archive(response)
+        self.assertEqual(len(archive.namelist()), 4)
+        for name in archive.namelist():
+            self.assertTrue(archive.read(name).startswith(b"%PDF"))
+
+    def test_export_filtered_by_ids(self):
+        ids = f"{self.cvs[0].pk},{self.cvs[2].pk}"
+        response = self.client.get(reverse("cv_pdf_export"), {"ids": ids})
+
+        self.assertEqual(
+            sorted(self._archive(response).namelist()),
+            sorted(
+                [
+                    f"Export0_User_CV_{self.cvs[0].pk}.pdf",
+                    f"Export2_User_CV_{self.cvs[2].pk}.pdf",
+                ]
+            ),
+        )
+
+    def test_filter_is_required(self):
+        response = self.client.get(reverse("cv_pdf_export"))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Select CVs", response.json()["error"])
+
+    @override_settings(PDF_EXPORT_MAX_CVS=3)
+    def test_too_many_cvs(self):
+        response = self.client.get(reverse("cv_pdf_export"), {"q": "User"})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(reverse("cv_pdf_export"), {"q": "Python"})
+        self.assertEqual(response.status_code, 200)
+
+    def test_staff_only(self):
+        self.client.logout()
+        response = self.client.get(reverse("cv_pdf_export"), {"q": "User"})
+        self.assertEqual(response.status_code, 403)
+
+    def test_invalid_filter(self):
+        response = self.client.get(reverse("cv_pdf_export"), {"created_to": "tomorrow"})
+        self.assertEqual(response.status_code, 400)
+
+    @patch("main.views.generate_cv_pdf_buffer")
+    def test_render_failure_does_not_abort_export(self, mock_generate):
+        mock_generate.side_effect = [
+            BytesIO(b"%PDF-1"),
+            RuntimeError("boom"),
+            BytesIO(b"%PDF-3"),
+            BytesIO(b"%PDF-4"),
+        ]
+        response = self.client.get(reverse("cv_pdf_export"), {"q": "User"})
+
+        archive = self._archive(response)
+        self.assertEqual(len(archive.namelist()), 4)
+        self.assertIn("errors.txt", archive.namelist())
+
+
+class IterCVPDFsPoolTest(PDFExportTestMixin, TestCase):
+    """Test that cache misses are submitted to the render pool."""
+
+    @patch("main.pdf_export.get_pdf_render_service")
+    def test_bounded_submissions(self, mock_get_service):
+        """Test that no more than ``max_in_flight`` renders are outstanding."""
+        outstanding = []
+        counts = {"in_flight": 0}
+
+        class PendingFuture(Future):
+            # Stays pending until the exporter waits for it
+            def result(self, timeout=None):
+                if not self.done():
+                    counts["in_flight"] -= 1
+                    self.set_result(b"%PDF-pool")
+                return super().result(timeout)
+
+        def submit(data, **options):
+            counts["in_flight"] += 1
+            outstanding.append(counts["in_flight"])
+            return PendingFuture()
+
+        service = MagicMock(timeout=5)
+        service.submit.side_effect = submit
+        mock_get_service.return_value = service
+
+        results = list(iter_cv_pdfs(filter_cvs(), max_in_flight=2))
+
+        self.assertEqual(service.submit.call_count, 4)
+        self.assertLessEqual(max(outstanding), 2)
+        self.assertEqual([pdf for _, pdf in results], [b"%PDF-pool"] * 4)
+
+
+class ExportCVPDFsCommandTest(PDFExportTestMixin, TestCase):
+    """Test the export management command."""
+
+    def test_writes_archive(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir, ignore_errors=True)
+        path = os.path.join(tmp_dir, "cvs.zip")
+        out = io.StringIO()
+
+        call_command("export_cv_pdfs", path, query="python", stdout=out)
+
+        self.assertEqual(len(zipfile.ZipFile(path).namelist()), 2)
+        self.assertIn("Exported 2 CV PDFs", out.getvalue())
@@ -0,0 +1,120 @@
+"""
+Tests for emailing large CV PDFs as signed download links.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+from io import BytesIO
+from pathlib import Path
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+from django.core import mail
+from django.test import TestCase, override_settings
+
+from main.models import CV
+from main.pdf_links import cleanup_pdf_links, make_pdf_link, store_linked_pdf
+from main.tasks import send_cv_pdf_bulk_email, send_cv_pdf_email
+
+LARGE_PDF = b"%PDF-" + b"0" * 2048
+
+
+class PDFLinkTestMixin:
+    def setUp(self):
+        super().setUp()
+        self.location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.location, ignore_errors=True)
+        links = override_settings(
+            EMAIL_PDF_LINKS={
+                "THRESHOLD": 1024,
+                "MAX_AGE": 3600,
+                "LOCATION": self.location,
+            },
+            SITE_URL="https://cv.example.com/",
+        )
+        links.enable()
+        self.addCleanup(links.disable)
+
+    def link_path(self, url):
+        self.assertTrue(url.startswith("https://cv.example.com/cv/pdf/"))
+        return urlparse(url).path
+
+
+@patch("main.views.generate_cv_pdf_buffer")
+class PDFLinkEmailTest(PDFLinkTestMixin, TestCase):
+    """Test that large PDFs are linked and small ones still attached."""
+
+    def setUp(self):
+        super().setUp()
+        self.cv = CV.objects.create(
+            firstname="Large", lastname="Document", email="large@example.com", bio="Bio"
+        )
+
+    def test_large_pdf_is_linked(self, mock_generate):
+        mock_generate.return_value = BytesIO(LARGE_PDF)
+
+        result = send_cv_pdf_email(self.cv.pk, "hr@example.com")
+
+        self.assertTrue(result["success"])
+        message = mail.outbox[0]
+        self.assertEqual(message.attachments, [])
+        url = message.body.split('<a href="')[1].split('"')[0]
+
+        response = self.client.get(self.link_path(url))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), LARGE_PDF)
+        self.assertIn("Large_Document_CV.pdf", response["Content-Disposition"])
+
+    def test_small_pdf_is_attached(self, mock_generate):
+        mock_generate.return_value = BytesIO(b"%PDF-small")
+
+        send_cv_pdf_email(self.cv.pk, "hr@example.com")
+
+        self.assertEqual(mail.outbox[0].attachments[0][1], b"%PDF-small")
+        self.assertEqual(os.listdir(self.location), [])
+
+    def test_bulk_send_stores_one_file(self, mock_generate):
+        mock_generate.return_value = BytesIO(LARGE_PDF)
+
+        send_cv_pdf_bulk_email(self.cv.pk, ["a@example.com", "b@example.com"])
+
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertTrue(all(not message.attachments for message in mail.outbox))
+        self.assertEqual(len(list(Path(self.location).glob("*/*.pdf"))), 1)
+
+
+class PDFLinkViewTest(PDFLinkTestMixin, TestCase):
+    """Test the signed download view."""
+
+    def setUp(self):
+        super().setUp()
+        name = store_linked_pdf(1, LARGE_PDF)
+        url, _ = make_pdf_link(name, "Jane_CV.pdf")
+        self.path = self.link_path(url)
+
+    def test_range_request(self):
+        response = self.client.get(self.path, HTTP_RANGE="bytes=0-4")
+
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response.content, b"%PDF-")
+
+    def test_expired_link(self):
+        with patch("django.core.signing.time.time", return_value=time.time() + 7200):
+            response = self.client.get(self.path)
+
+        self.assertEqual(response.status_code, 410)
+
+    def test_tampered_link(self):
+        response = self.client.get(self.path.replace("/cv/pdf/", "/cv/pdf/x"))
+
+        self.assertEqual(response.status_code, 404)
+
+    def test_cleaned_up_file(self):
+        for path in Path(self.location).glob("*/*.pdf"):
+            old = time.time() - 3 * 3600
+            os.utime(path, (old, old))
+
+        self.assertEqual(cleanup_pdf_links(), 1)
+        self.assertEqual(self.client.get(self.path).status_code, 410)
@@ -0,0 +1,227 @@
+"""
+Tests for the PDF snapshot data and the process-pool rendering service.
+"""
+
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase
+from django.urls import reverse
+
+from main.benchmarks import synthetic_cv_data
+from main.models import CV, Contact, Project, Skill
+from main.pdf import CVData, PDFGenerator, render_cv_pdf_data
+from main.pdf_service import (
+    PDFRenderError,
+    PDFRenderQueueFull,
+    PDFRenderService,
+    PDFRenderTimeout,
+)
+from main.tasks import send_cv_pdf_email
+from main.views import generate_cv_pdf_buffer
+
+
+class CVDataTest(TestCase):
+    """Test the serializable CV snapshot."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Snap",
+            lastname="Shot",
+            email="snap@example.com",
+            bio="Snapshot biography",
+        )
+        Skill.objects.create(cv=self.cv, name="Python", proficiency="expert")
+        Project.objects.create(
+            cv=self.cv,
+            title="Snapshot Project",
+            description="Description",
+            technologies="Python, Django",
+            start_date=date(2023, 1, 1),
+            end_date=date(2023, 6, 1),
+        )
+        Contact.objects.create(
+            cv=self.cv,
+            contact_type="github",
+            value="snap",
+            url="https://github.com/snap",
+        )
+
+    def test_from_cv(self):
+        """Test that the snapshot captures display values."""
+        data = CVData.from_cv(self.cv)
+
+        self.assertEqual(data.full_name, "Snap Shot")
+        self.assertEqual(data.skills[0].proficiency_display, "Expert")
+        self.assertEqual(data.contacts[0].contact_type_display, "GitHub")
+        self.assertFalse(data.projects[0].is_ongoing)
+        self.assertEqual(data.projects[0].technologies_list, ["Python", "Django"])
+
+    def test_dict_round_trip(self):
+        """Test that serialization preserves the snapshot."""
+        data = CVData.from_cv(self.cv)
+        self.assertEqual(CVData.from_dict(data.to_dict()), data)
+
+    def test_render_from_dict(self):
+        """Test rendering from plain serialized data."""
+        pdf = render_cv_pdf_data(CVData.from_cv(self.cv).to_dict())
+        self.assertTrue(pdf.startswith(b"%PDF"))
+
+
+class PDFQueryCountTest(TestCase):
+    """Test that the PDF path builds from a single prefetched snapshot."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Query",
+            lastname="Count",
+            email="query@example.com",
+            bio="Query count biography",
+        )
+        for index, contact_type in enumerate(["github", "linkedin", "website"]):
+            Skill.objects.create(
+                cv=self.cv, name=f"Skill {index}", proficiency="advanced"
+            )
+            Project.objects.create(
+                cv=self.cv,
+                title=f"Project {index}",
+                description="Description",
+                technologies="Python",
+                start_date=date(2023, 1, 1),
+            )
+            Contact.objects.create(
+                cv=self.cv,
+                contact_type=contact_type,
+                value=f"query{index}",
+                url=f"https://example.com/{index}",
+            )
+
+    def test_layout_runs_no_queries(self):
+        """Test that rendering a prefetched CV does not hit the database."""
+        cv = CV.objects.prefetch_related("skills", "projects", "contacts").get(
+            pk=self.cv.pk
+        )
+        with self.assertNumQueries(0):
+            PDFGenerator(CVData.from_cv(cv)).generate()
+
+    def test_download_view_query_count(self):
+        """Test that a PDF download costs one CV query plus three prefetches."""
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content.startswith(b"%PDF"))
+
+    def test_email_task_query_count(self):
+        """Test that the email task renders PDF and templates from one fetch."""
+        # Four for the CV, three to create and finish its EmailDelivery row
+        with self.assertNumQueries(7):
+            result = send_cv_pdf_email(self.cv.pk, "recipient@example.com")
+
+        self.assertTrue(result["success"])
+
+
+class PDFRenderServiceTest(TestCase):
+    """Test the bounded process pool."""
+
+    def test_render_in_worker_process(self):
+        """Test that a worker process returns PDF bytes."""
+        service = PDFRenderService(processes=1, timeout=60)
+        self.addCleanup(service.shutdown)
+
+        pdf = service.render(synthetic_cv_data().to_dict())
+
+        self.assertTrue(pdf.startswith(b"%PDF"))
+
+    def test_queue_full(self):
+        """Test that submissions fail fast when every slot is taken."""
+        service = PDFRenderService(processes=1, max_queue=0, queue_timeout=0.01)
+        self.addCleanup(service.shutdown)
+        service._slots.acquire()
+
+        with self.assertRaises(PDFRenderQueueFull):
+            service.submit(synthetic_cv_data().to_dict())
+
+    def test_timeout_recycles_pool(self):
+        """Test that a job exceeding its timeout raises and resets the pool."""
+        service = PDFRenderService(processes=1, timeout=0.001)
+        self.addCleanup(service.shutdown)
+
+        with self.assertRaises(PDFRenderTimeout):
+            service.render(synthetic_cv_data(skills=200, projects=100).to_dict())
+
+        self.assertIsNone(service._executor)
+
+    def test_broken_pool_is_retried_once(self):
+        """Test that a job lost with a recycled pool runs again, then fails."""
+        service = PDFRenderService(processes=1)
+        broken = Future()
+        broken.set_exception(BrokenProcessPool("pool was terminated"))
+        rendered = Future()
+        rendered.set_result(b"%PDF-retried")
+        executor = MagicMock()
+
+        with patch.object(service, "_get_executor", return_value=executor):
+            executor.submit.side_effect = [broken, rendered]
+            self.assertEqual(service.render({}), b"%PDF-retried")
+
+            executor.submit.side_effect = [broken, broken]
+            with self.assertRaises(PDFRenderError):
+                service.render({})
+
+    def test_dead_worker_replaces_pool(self):
+        """Test that rendering recovers after a worker process is killed."""
+        service = PDFRenderService(processes=1, timeout=60)
+        self.addCleanup(service.shutdown)
+        data = synthetic_cv_data().to_dict()
+        service.render(data)
+
+        for process in list(service._executor._processes.values()):
+            process.kill()
+            process.join()
+
+        self.assertTrue(service.render(data).startswith(b"%PDF"))
+
+
+class PDFRenderServiceIntegrationTest(TestCase):
+    """Test that views hand serialized CVs to the service."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Pool",
+            lastname="User",
+            email="pool@example.com",
+            bio="Pool biography",
+        )
+
+    @patch("main.views.get_pdf_render_service")
+    def test_generate_submits_serialized_data(self, mock_get_service):
+        """Test that the helper submits plain data when the pool is enabled."""
+        service = MagicMock()
+        service.render.return_value = b"%PDF-from-pool"
+        mock_get_service.return_value = service
+
+        buffer = generate_cv_pdf_buffer(self.cv)
+
+        self.assertEqual(buffer.getvalue(), b"%PDF-from-pool")
+        submitted = service.render.call_args[0][0]
+        self.assertIsInstance(submitted, dict)
+        self.assertEqual(submitted["firstname"], "Pool")
+
+    @patch("main.views.get_pdf_render_service")
+    def test_download_busy_returns_503(self, mock_get_service):
+        """Test that a saturated pool yields 503 with Retry-After."""
+        service = MagicMock()
+        service.render.side_effect = PDFRenderQueueFull("full")
+        mock_get_service.return_value = service
+
+        response = self.client.get(
+            reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+        )
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "5")
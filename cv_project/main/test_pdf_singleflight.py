@@ -0,0 +1,141 @@
+"""
+Tests for single-flight deduplication of PDF renders.
+"""
+
+import threading
+import time
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from main.benchmarks import synthetic_cv_data
+from main.pdf_singleflight import SingleFlight
+from main.views import get_cv_pdf
+
+
+def run_concurrently(count, fn):
+    """Call ``fn`` from ``count`` threads and return results in order."""
+    results = [None] * count
+    errors = [None] * count
+
+    def call(index):
+        try:
+            results[index] = fn()
+        except Exception as e:
+            errors[index] = e
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    return results, errors
+
+
+class SingleFlightTest(SimpleTestCase):
+    """Test in-process and cross-node deduplication."""
+
+    def test_concurrent_calls_share_one_result(self):
+        group = SingleFlight(timeout=5)
+        calls = []
+
+        def render():
+            calls.append(1)
+            time.sleep(0.2)
+            return b"%PDF"
+
+        results, errors = run_concurrently(8, lambda: group.do("cv:1", render))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, [b"%PDF"] * 8)
+        self.assertEqual(group.stats(), {"leaders": 1, "waiters": 7, "timeouts": 0})
+
+    def test_sequential_calls_run_again(self):
+        group = SingleFlight(timeout=5)
+        render = MagicMock(return_value=b"%PDF")
+
+        group.do("cv:1", render)
+        group.do("cv:1", render)
+
+        self.assertEqual(render.call_count, 2)
+
+    def test_waiters_get_leader_error(self):
+        group = SingleFlight(timeout=5)
+
+        def render():
+            time.sleep(0.2)
+            raise RuntimeError("render failed")
+
+        results, errors = run_concurrently(3, lambda: group.do("cv:1", render))
+
+        self.assertTrue(all(isinstance(e, RuntimeError) for e in errors))
+
+    def test_waiter_timeout_renders_itself(self):
+        group = SingleFlight(timeout=0.1)
+        release = threading.Event()
+        leader = threading.Thread(
+            target=group.do, args=("cv:1", lambda: release.wait(5) and b"slow")
+        )
+        leader.start()
+        time.sleep(0.05)
+
+        result = group.do("cv:1", lambda: b"fallback")
+        release.set()
+        leader.join()
+
+        self.assertEqual(result, b"fallback")
+        self.assertEqual(group.stats()["timeouts"], 1)
+
+    def test_distributed_lock_reuses_stored_result(self):
+        lock = MagicMock()
+        lock.acquire.return_value = True
+        cache = MagicMock()
+        cache.lock.return_value = lock
+        render = MagicMock(return_value=b"%PDF-mine")
+
+        group = SingleFlight(timeout=5, lock_cache="default")
+        with patch("main.pdf_singleflight.caches", {"default": cache}):
+            result = group.do("cv:1", render, lookup=lambda: b"%PDF-other")
+
+        self.assertEqual(result, b"%PDF-other")
+        render.assert_not_called()
+        lock.release.assert_called_once()
+
+    def test_distributed_lock_timeout_renders(self):
+        lock = MagicMock()
+        lock.acquire.return_value = False
+        cache = MagicMock()
+        cache.lock.return_value = lock
+
+        group = SingleFlight(timeout=5, lock_cache="default")
+        with patch("main.pdf_singleflight.caches", {"default": cache}):
+            result = group.do("cv:1", lambda: b"%PDF", lookup=lambda: None)
+
+        self.assertEqual(result, b"%PDF")
+        lock.release.assert_not_called()
+
+    def test_cache_without_lock_support(self):
+        group = SingleFlight(timeout=5, lock_cache="default")
+
+        self.assertEqual(group.do("cv:1", lambda: b"%PDF"), b"%PDF")
+
+
+class GetCVPDFSingleFlightTest(SimpleTestCase):
+    """Test that concurrent cache misses render a CV once."""
+
+    @override_settings(PDF_SINGLE_FLIGHT={"TIMEOUT": 5})
+    @patch("main.views.generate_cv_pdf_buffer")
+    def test_concurrent_misses_render_once(self, mock_generate):
+        def slow_render(*args, **kwargs):
+            time.sleep(0.2)
+            return BytesIO(b"%PDF-shared")
+
+        mock_generate.side_effect = slow_render
+        data = synthetic_cv_data(skills=1, projects=1)
+
+        results, errors = run_concurrently(6, lambda: get_cv_pdf(data))
+
+        self.assertEqual(errors, [None] * 6)
+        self.assertEqual(results, [b"%PDF-shared"] * 6)
+        self.assertEqual(mock_generate.call_count, 1)
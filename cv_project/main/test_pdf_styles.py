@@ -0,0 +1,141 @@
+"""
+Tests for the shared PDF theme registry and output modes.
+"""
+
+import dataclasses
+import os
+from io import BytesIO, StringIO
+from unittest.mock import patch
+
+import reportlab
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from reportlab.platypus import SimpleDocTemplate
+
+from main.benchmarks import synthetic_cv_data
+from main.models import CV
+from main.pdf import PDF_MODE_COMPACT, PDF_MODE_FAST, PDFGenerator
+from main.pdf_cache import cv_content_hash, pdf_render_options
+from main.pdf_styles import THEME_PALETTES, get_theme
+from main.tasks import send_cv_pdf_email
+
+VERA_PATH = os.path.join(os.path.dirname(reportlab.__file__), "fonts", "Vera.ttf")
+
+
+class PDFThemeRegistryTest(TestCase):
+    """Test that themes are built once and shared."""
+
+    def test_theme_is_shared_between_generators(self):
+        """Test that two renders use the very same style objects."""
+        data = synthetic_cv_data(skills=2, projects=1)
+        first = PDFGenerator(data)
+        second = PDFGenerator(data)
+
+        self.assertIs(first.styles, second.styles)
+        self.assertIs(first.theme.skills_table_style, second.theme.skills_table_style)
+
+    def test_generator_does_not_rebuild_styles(self):
+        """Test that rendering does not touch the base stylesheet."""
+        get_theme()
+        with patch("main.pdf_styles.getSampleStyleSheet") as mock_stylesheet:
+            PDFGenerator(synthetic_cv_data(skills=2, projects=1)).generate()
+
+        mock_stylesheet.assert_not_called()
+
+    def test_styles_are_read_only(self):
+        """Test that the shared style mapping cannot be modified."""
+        with self.assertRaises(TypeError):
+            get_theme().styles["title"] = None
+
+    def test_named_themes(self):
+        """Test that every built-in theme renders a PDF."""
+        data = synthetic_cv_data(skills=3, projects=2, contacts=2)
+        for name in THEME_PALETTES:
+            with self.subTest(theme=name):
+                theme = get_theme(name)
+                self.assertEqual(theme.name, name)
+                pdf = PDFGenerator(data, theme=name).generate().getvalue()
+                self.assertTrue(pdf.startswith(b"%PDF"))
+
+    def test_unknown_theme(self):
+        """Test that an unknown theme name is rejected."""
+        with self.assertRaises(ValueError):
+            get_theme("does-not-exist")
+
+    def test_theme_changes_content_hash(self):
+        """Test that switching theme yields a different PDF cache key."""
+        cv = CV.objects.create(
+            firstname="Theme", lastname="Hash", email="theme@example.com", bio="Bio"
+        )
+        default_hash = cv_content_hash(cv)
+        with override_settings(PDF_THEME="monochrome"):
+            self.assertNotEqual(cv_content_hash(cv), default_hash)
+
+    def test_benchmark_command(self):
+        """Test that the style benchmark command runs."""
+        out = StringIO()
+        call_command("benchmark_pdf_styles", iterations=2, stdout=out)
+        self.assertIn("Saved per PDF", out.getvalue())
+
+
+class PDFOutputModeTest(TestCase):
+    """Test compact and fast output modes and Unicode font embedding."""
+
+    def setUp(self):
+        self.data = synthetic_cv_data(skills=10, projects=5, contacts=3)
+
+    def _render(self, data=None, **options):
+        return PDFGenerator(data or self.data, **options).generate().getvalue()
+
+    def test_compact_is_smaller(self):
+        compact = self._render(mode=PDF_MODE_COMPACT)
+        fast = self._render(mode=PDF_MODE_FAST)
+
+        self.assertLess(len(compact), len(fast) / 2)
+
+    def test_compact_is_reportlab_default_output(self):
+        def default_compression(*args, pageCompression, **kwargs):
+            return SimpleDocTemplate(*args, **kwargs)
+
+        with patch("main.pdf.SimpleDocTemplate", side_effect=default_compression):
+            default = self._render()
+
+        self.assertEqual(self._render(mode=PDF_MODE_COMPACT), default)
+
+    def test_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            PDFGenerator(self.data, mode="tiny")
+
+    def test_mode_changes_content_hash(self):
+        self.assertNotEqual(
+            cv_content_hash(self.data, pdf_render_options(PDF_MODE_COMPACT)),
+            cv_content_hash(self.data, pdf_render_options(PDF_MODE_FAST)),
+        )
+
+    @override_settings(PDF_EMAIL_MODE=PDF_MODE_FAST)
+    @patch("main.tasks.EmailMessage")
+    @patch("main.views.generate_cv_pdf_buffer")
+    def test_email_uses_email_mode(self, mock_generate, mock_email_class):
+        mock_generate.return_value = BytesIO(b"%PDF-fast")
+        cv = CV.objects.create(
+            firstname="Mode", lastname="Mail", email="mode@example.com", bio="Bio"
+        )
+
+        send_cv_pdf_email(cv_id=cv.pk, recipient_email="recruiter@example.com")
+
+        self.assertEqual(mock_generate.call_args.kwargs["mode"], PDF_MODE_FAST)
+
+    def test_unicode_font_embedded_only_when_needed(self):
+        latin = self._render(unicode_font=(VERA_PATH, None))
+        self.assertNotIn(b"/FontFile2", latin)
+
+        translated = dataclasses.replace(self.data, bio="Zsolt Kővári életrajza")
+        pdf = self._render(translated, unicode_font=(VERA_PATH, None))
+        self.assertIn(b"/FontFile2", pdf)
+        # Only the used glyphs are embedded, not the whole font file
+        self.assertLess(len(pdf), os.path.getsize(VERA_PATH))
+
+    def test_benchmark_command(self):
+        out = StringIO()
+        call_command("benchmark_pdf_modes", repeat=1, stdout=out)
+        self.assertIn("compact", out.getvalue())
@@ -0,0 +1,207 @@
+"""
+Tests for per-recipient and per-client email rate limiting.
+"""
+
+import json
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from django.core import mail
+from django.test import RequestFactory, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from main.models import CV
+from main.rate_limit import (
+    TokenBucket,
+    client_ip,
+    get_email_rate_limiter,
+    parse_rate,
+)
+from main.tasks import send_cv_pdf_bulk_email, send_cv_pdf_email
+
+RATE_LIMITS = {
+    "RECIPIENT": {"RATE": "1/h", "BURST": 2},
+    "SENDER": {"RATE": "1/h", "BURST": 3},
+}
+
+
+class TokenBucketTest(SimpleTestCase):
+    """Test the token bucket without Redis."""
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate("30/m"), 0.5)
+        self.assertEqual(parse_rate("7200/hour"), 2)
+        with self.assertRaises(ValueError):
+            parse_rate("often")
+
+    @patch("main.rate_limit.time.time")
+    def test_burst_then_refill(self, mock_time):
+        mock_time.return_value = 1000.0
+        bucket = TokenBucket("test", "2/m", burst=2)
+
+        self.assertEqual(bucket.take("a"), (True, 0))
+        self.assertEqual(bucket.take("a"), (True, 0))
+        self.assertEqual(bucket.take("a"), (False, 30))
+        # Other keys have their own bucket
+        self.assertEqual(bucket.take("b"), (True, 0))
+
+        mock_time.return_value = 1015.0
+        self.assertEqual(bucket.take("a"), (False, 15))
+        mock_time.return_value = 1030.0
+        self.assertEqual(bucket.take("a"), (True, 0))
+
+    def test_check_does_not_take(self):
+        bucket = TokenBucket("test", "1/h", burst=1)
+
+        self.assertTrue(bucket.take("a", tokens=0)[0])
+        self.assertTrue(bucket.take("a")[0])
+        self.assertFalse(bucket.take("a", tokens=0)[0])
+
+    def test_redis_script_is_used(self):
+        script = MagicMock(return_value=[0, "12.5"])
+        cache = MagicMock()
+        cache.client.get_client.return_value.register_script.return_value = script
+        cache.make_key.side_effect = lambda key: f"cv_project:1:{key}"
+
+        with patch("main.rate_limit.caches") as mock_caches:
+            mock_caches.__getitem__.return_value = cache
+            result = TokenBucket("recipient", "5/h", burst=3).take("hr@example.com")
+
+        self.assertEqual(result, (False, 13))
+        self.assertEqual(
+            script.call_args.kwargs["keys"],
+            ["cv_project:1:ratelimit:recipient:hr@example.com"],
+        )
+
+    def test_redis_errors_allow_sending(self):
+        cache = MagicMock()
+        script = cache.client.get_client.return_value.register_script.return_value
+        script.side_effect = ConnectionError("redis down")
+
+        with patch("main.rate_limit.caches") as mock_caches:
+            mock_caches.__getitem__.return_value = cache
+            self.assertEqual(TokenBucket("test", "1/h").take("a"), (True, 0))
+
+    @override_settings(EMAIL_RATE_LIMITS={"RECIPIENT": None, "SENDER": None})
+    def test_disabled_scope(self):
+        self.assertIsNone(get_email_rate_limiter("RECIPIENT"))
+
+
+class ClientIPTest(SimpleTestCase):
+    """Test which address identifies the client behind proxies."""
+
+    def client_ip(self, remote_addr, forwarded=None):
+        extra = {"REMOTE_ADDR": remote_addr}
+        if forwarded is not None:
+            extra["HTTP_X_FORWARDED_FOR"] = forwarded
+        return client_ip(RequestFactory().get("/", **extra))
+
+    def test_forwarded_header_ignored_without_trusted_proxies(self):
+        self.assertEqual(self.client_ip("198.51.100.2", "203.0.113.7"), "198.51.100.2")
+
+    @override_settings(RATE_LIMIT_TRUSTED_PROXIES=["10.0.0.0/8", "192.0.2.1"])
+    def test_right_most_untrusted_hop(self):
+        # The spoofed left-most entry is not taken at face value
+        self.assertEqual(
+            self.client_ip("10.0.0.5", "1.1.1.1, 203.0.113.7, 192.0.2.1"),
+            "203.0.113.7",
+        )
+        self.assertEqual(self.client_ip("10.0.0.5", "10.1.1.1"), "10.1.1.1")
+        self.assertEqual(self.client_ip("10.0.0.5"), "10.0.0.5")
+        # An untrusted peer cannot choose its own address
+        self.assertEqual(self.client_ip("198.51.100.2", "10.1.1.1"), "198.51.100.2")
+
+
+@patch("main.views.generate_cv_pdf_buffer")
+class EmailRateLimitTest(TestCase):
+    """Test 429 responses from the email views and refusals in the tasks."""
+
+    def setUp(self):
+        # Fresh buckets per test
+        rate_limits = override_settings(EMAIL_RATE_LIMITS=RATE_LIMITS)
+        rate_limits.enable()
+        self.addCleanup(rate_limits.disable)
+        self.cv = CV.objects.create(
+            firstname="Rate", lastname="Limited", email="rate@example.com", bio="Bio"
+        )
+
+    def post(self, name, data, **extra):
+        return self.client.post(
+            reverse(name, kwargs={"pk": self.cv.pk}),
+            data=json.dumps(data),
+            content_type="application/json",
+            **extra,
+        )
+
+    def test_recipient_limit_returns_429(self, mock_generate):
+        mock_generate.side_effect = lambda *args, **kwargs: BytesIO(b"%PDF")
+
+        for _ in range(2):
+            response = self.post("cv_email", {"email": "hr@example.com"})
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 2)
+
+        response = self.post("cv_email", {"email": "HR@example.com"})
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "3600")
+        self.assertEqual(response.json()["retry_after"], 3600)
+        # Another recipient is not affected
+        self.assertEqual(
+            self.post("cv_email", {"email": "cto@example.com"}).status_code, 200
+        )
+
+    @override_settings(RATE_LIMIT_TRUSTED_PROXIES=["127.0.0.1"])
+    @patch("main.tasks.send_cv_pdf_email.delay")
+    def test_sender_limit_is_per_client(self, mock_delay, mock_generate):
+        mock_delay.return_value = MagicMock(id="task")
+
+        for index in range(3):
+            response = self.post("cv_email", {"email": f"hr{index}@example.com"})
+            self.assertEqual(response.status_code, 200)
+
+        response = self.post("cv_email", {"email": "hr9@example.com"})
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(mock_delay.call_count, 3)
+
+        response = self.post(
+            "cv_email",
+            {"email": "hr9@example.com"},
+            HTTP_X_FORWARDED_FOR="203.0.113.7",
+        )
+        self.assertEqual(response.status_code, 200)
+
+    @patch("main.tasks.send_cv_pdf_bulk_email.delay")
+    def test_bulk_request_uses_sender_limit(self, mock_delay, mock_generate):
+        mock_delay.return_value = MagicMock(id="task")
+        data = {"recipients": ["a@example.com", "b@example.com"]}
+
+        for _ in range(3):
+            self.assertEqual(self.post("cv_email_bulk", data).status_code, 200)
+
+        self.assertEqual(self.post("cv_email_bulk", data).status_code, 429)
+
+    def test_task_refuses_limited_recipient(self, mock_generate):
+        mock_generate.side_effect = lambda *args, **kwargs: BytesIO(b"%PDF")
+
+        results = [
+            send_cv_pdf_email(self.cv.pk, "hr@example.com", "Jane") for _ in range(3)
+        ]
+
+        self.assertEqual([result["success"] for result in results], [True, True, False])
+        self.assertEqual(results[2]["retry_after"], 3600)
+        self.assertEqual(mock_generate.call_count, 2)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_bulk_task_skips_limited_recipients(self, mock_generate):
+        mock_generate.side_effect = lambda *args, **kwargs: BytesIO(b"%PDF")
+        send_cv_pdf_email(self.cv.pk, "hr@example.com")
+        send_cv_pdf_email(self.cv.pk, "hr@example.com")
+
+        result = send_cv_pdf_bulk_email(
+            self.cv.pk, ["hr@example.com", "cto@example.com"]
+        )
+
+        self.assertEqual((result["sent"], result["failed"]), (1, 1))
+        self.assertEqual(result["recipients"]["hr@example.com"]["retry_after"], 3600)
+        self.assertEqual(mail.outbox[-1].to, ["cto@example.com"])
@@ -0,0 +1,94 @@
+"""
+Tests for single-pass technical-term protection.
+"""
+
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, override_settings
+
+from main.translation import (
+    TermProtector,
+    get_term_protector,
+    protect_technical_terms,
+    restore_technical_terms,
+)
+
+
+class TermProtectorTest(SimpleTestCase):
+    """Test protecting and restoring technical terms."""
+
+    def test_round_trip(self):
+        text = "Built APIs with Django and python; deployed Django on AWS."
+
+        protected, term_map = protect_technical_terms(text)
+
+        self.assertEqual(
+            protected,
+            "Built APIs with TECH_TERM_0 and TECH_TERM_1; "
+            "deployed TECH_TERM_0 on TECH_TERM_2.",
+        )
+        self.assertEqual(
+            term_map,
+            {"TECH_TERM_0": "Django", "TECH_TERM_1": "python", "TECH_TERM_2": "AWS"},
+        )
+        self.assertEqual(restore_technical_terms(protected, term_map), text)
+
+    def test_longest_term_wins(self):
+        protected, term_map = protect_technical_terms("JavaScript, then Java.")
+
+        self.assertEqual(protected, "TECH_TERM_0, then TECH_TERM_1.")
+        self.assertEqual(term_map["TECH_TERM_0"], "JavaScript")
+
+    def test_symbols_and_word_boundaries(self):
+        protected, term_map = protect_technical_terms(
+            "C++ and C# with Node.js, not Gopher or Django2."
+        )
+
+        self.assertEqual(
+            sorted(term_map.values()), ["C#", "C++", "Node.js"], msg=protected
+        )
+
+    def test_many_placeholders_restore_exactly(self):
+        terms = [f"Tool{i}" for i in range(12)]
+        protector = TermProtector(terms)
+        text = " ".join(terms)
+
+        protected, term_map = protector.protect(text)
+
+        self.assertIn("TECH_TERM_11", protected)
+        # TECH_TERM_1 must not be replaced inside TECH_TERM_10 and TECH_TERM_11
+        self.assertEqual(protector.restore(protected, term_map), text)
+
+    def test_empty(self):
+        self.assertEqual(protect_technical_terms(""), ("", {}))
+        self.assertEqual(TermProtector([]).protect("Python"), ("Python", {}))
+
+    def test_extra_terms_setting(self):
+        with override_settings(TRANSLATION_EXTRA_TECHNICAL_TERMS=["htmx"]):
+            self.assertIn("htmx", get_term_protector().terms)
+            _, term_map = protect_technical_terms("Frontend in HTMX.")
+            self.assertEqual(term_map, {"TECH_TERM_0": "HTMX"})
+
+        self.assertEqual(protect_technical_terms("Frontend in HTMX.")[1], {})
+
+
+class BenchmarkTermProtectionCommandTest(SimpleTestCase):
+    """Test the benchmark_term_protection command."""
+
+    def test_benchmark(self):
+        out = StringIO()
+        err = StringIO()
+
+        call_command(
+            "benchmark_term_protection",
+            terms=300,
+            chars=2000,
+            iterations=1,
+            stdout=out,
+            stderr=err,
+        )
+
+        self.assertIn("300 terms, 2000-char bio", out.getvalue())
+        self.assertIn("Protection speedup", out.getvalue())
+        self.assertEqual(err.getvalue(), "")
@@ -0,0 +1,169 @@
+"""
+Tests for stored translations and translated CV PDFs.
+"""
+
+import json
+from datetime import date
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from main.models import CV, Project, Skill
+from main.pdf import CVData, PDFGenerator
+from main.tasks import send_cv_pdf_email, translate_cv_content
+from main.translation import cv_source_hash, get_cached_translation, store_translation
+
+TRANSLATION_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "translated-pdf-tests",
+    }
+}
+
+
+def openai_response(content):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    return response
+
+
+@override_settings(CACHES=TRANSLATION_CACHES, OPENAI_API_KEY="test-api-key")
+class TranslatedPDFTest(TestCase):
+    """Test that translations are stored per CV version and rendered."""
+
+    def setUp(self):
+        cache.clear()
+        self.cv = CV.objects.create(
+            firstname="Jane",
+            lastname="Smith",
+            email="jane@example.com",
+            bio="Software engineer.",
+        )
+        self.skill = Skill.objects.create(
+            cv=self.cv, name="Leadership", proficiency="advanced"
+        )
+        self.project = Project.objects.create(
+            cv=self.cv,
+            title="Web Application",
+            description="Built a web application.",
+            technologies="Django",
+            start_date=date(2023, 6, 1),
+        )
+        self.translation = {
+            "bio": "Ensenjor software.",
+            "skills": [{"id": self.skill.pk, "name": "Hembrynkys"}],
+            "projects": [
+                {"id": self.project.pk, "description": "Drehevys towlen gwias."}
+            ],
+        }
+
+    def test_translated_snapshot(self):
+        data = CVData.from_cv(self.cv).translated(self.translation)
+
+        self.assertEqual(data.bio, "Ensenjor software.")
+        self.assertEqual(data.skills[0].name, "Hembrynkys")
+        self.assertEqual(data.projects[0].title, "Web Application")
+        self.assertEqual(data.projects[0].description, "Drehevys towlen gwias.")
+
+    def test_generator_renders_translation(self):
+        generator = PDFGenerator(self.cv, translation=self.translation)
+
+        self.assertEqual(generator.data.bio, "Ensenjor software.")
+        self.assertTrue(generator.generate().getvalue().startswith(b"%PDF"))
+
+    def test_source_hash_ignores_saves_without_changes(self):
+        before = cv_source_hash(self.cv)
+        self.cv.save()
+        self.assertEqual(cv_source_hash(self.cv), before)
+
+        self.cv.bio = "Senior software engineer."
+        self.cv.save()
+        self.assertNotEqual(cv_source_hash(self.cv), before)
+
+    @patch("openai.OpenAI")
+    def test_task_reuses_stored_translation(self, mock_openai_class):
+        mock_client = mock_openai_class.return_value
+        mock_client.chat.completions.create.side_effect = [
+            openai_response("Ensenjor software."),
+            openai_response("Drehevys towlen gwias."),
+            openai_response("Hembrynkys"),
+        ]
+
+        first = translate_cv_content(self.cv.pk, "Cornish")
+        second = translate_cv_content(self.cv.pk, "Cornish")
+
+        self.assertTrue(second["success"])
+        self.assertTrue(second["cached"])
+        self.assertEqual(second["translated_data"], first["translated_data"])
+        self.assertEqual(mock_client.chat.completions.create.call_count, 3)
+        self.assertIsNone(get_cached_translation(self.cv, "Manx"))
+
+    def test_download_queues_missing_translation(self):
+        url = reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+        with patch("main.tasks.translate_cv_content.delay") as mock_delay:
+            mock_delay.return_value.id = "translate-task"
+            response = self.client.get(url, {"lang": "cornish"})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["task_id"], "translate-task")
+        self.assertIn("Retry-After", response)
+        mock_delay.assert_called_once_with(cv_id=self.cv.pk, target_language="Cornish")
+
+    def test_download_unsupported_language(self):
+        url = reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+        response = self.client.get(url, {"lang": "klingon"})
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_download_stored_translation(self):
+        store_translation(self.cv, "Cornish", self.translation)
+        url = reverse("cv_pdf_download", kwargs={"pk": self.cv.pk})
+
+        with patch("main.views.generate_cv_pdf_buffer") as mock_generate:
+            mock_generate.return_value = BytesIO(b"%PDF-cornish")
+            translated = self.client.get(url, {"lang": "cornish"})
+            mock_generate.return_value = BytesIO(b"%PDF-original")
+            original = self.client.get(url)
+
+        self.assertEqual(translated.status_code, 200)
+        self.assertEqual(translated.content, b"%PDF-cornish")
+        self.assertIn("Jane_Smith_CV_cornish.pdf", translated["Content-Disposition"])
+        self.assertEqual(
+            mock_generate.call_args_list[0].kwargs["translation"], self.translation
+        )
+        # Each language is a separate cache entry with its own validator
+        self.assertNotEqual(translated["ETag"], original["ETag"])
+
+    @patch("main.tasks.EmailMessage")
+    @patch("main.views.generate_cv_pdf_buffer")
+    def test_email_attaches_translated_pdf(self, mock_generate, mock_email_class):
+        mock_generate.return_value = BytesIO(b"%PDF-cornish")
+        store_translation(self.cv, "Cornish", self.translation)
+
+        result = send_cv_pdf_email(
+            cv_id=self.cv.pk, recipient_email="hr@example.com", language="Cornish"
+        )
+
+        self.assertTrue(result["success"])
+        self.assertEqual(result["filename"], "Jane_Smith_CV_cornish.pdf")
+        self.assertEqual(
+            mock_generate.call_args.kwargs["translation"], self.translation
+        )
+        self.assertIn("(Cornish)", mock_email_class.call_args.kwargs["subject"])
+
+    def test_email_view_passes_language(self):
+        url = reverse("cv_email", kwargs={"pk": self.cv.pk})
+        data = {"email": "hr@example.com", "language": "cornish"}
+
+        with patch("main.tasks.send_cv_pdf_email.delay") as mock_delay:
+            mock_delay.return_value.id = "email-task"
+            response = self.client.post(
+                url, data=json.dumps(data), content_type="application/json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_delay.call_args.kwargs["language"], "Cornish")
@@ -0,0 +1,136 @@
+"""
+Tests for batch (one JSON request per CV) translation.
+"""
+
+import json
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from django.test import TestCase, override_settings
+
+from main.models import CV, Project, Skill
+from main.tasks import translate_cv_content
+from main.translation import (
+    protect_technical_terms,
+    split_batches,
+    translation_units,
+)
+
+
+def openai_response(content):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = content
+    return response
+
+
+def batch_response(translations):
+    return openai_response(json.dumps({"translations": translations}))
+
+
+@override_settings(OPENAI_API_KEY="test-api-key", TRANSLATION_MODE="batch")
+@patch("openai.OpenAI")
+class BatchTranslationTest(TestCase):
+    """Test translating a CV in one structured request."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Batch",
+            lastname="Translator",
+            email="batch@example.com",
+            bio="Engineer working with Python.",
+        )
+        self.first = Project.objects.create(
+            cv=self.cv,
+            title="Shop",
+            description="Built a shop with Django.",
+            technologies="Django",
+            start_date=date(2024, 1, 1),
+        )
+        self.second = Project.objects.create(
+            cv=self.cv,
+            title="Blog",
+            description="Wrote a blog.",
+            technologies="Hugo",
+            start_date=date(2023, 1, 1),
+        )
+        self.leadership = Skill.objects.create(cv=self.cv, name="Leadership")
+        Skill.objects.create(cv=self.cv, name="Python")
+        self.python = protect_technical_terms("Python")[0]
+        self.django = protect_technical_terms("Django")[0]
+
+    def test_one_request(self, mock_openai_class):
+        create = mock_openai_class.return_value.chat.completions.create
+        create.return_value = batch_response(
+            {
+                "bio": f"Ingeniero que trabaja con {self.python}.",
+                f"project:{self.first.pk}": f"Construyó una tienda con {self.django}.",
+                f"project:{self.second.pk}": "Escribió un blog.",
+                f"skill:{self.leadership.pk}": "Liderazgo",
+            }
+        )
+
+        data = translate_cv_content(self.cv.pk, "Spanish")["translated_data"]
+
+        self.assertEqual(create.call_count, 1)
+        self.assertEqual(
+            create.call_args.kwargs["response_format"], {"type": "json_object"}
+        )
+        self.assertEqual(data["bio"], "Ingeniero que trabaja con Python.")
+        self.assertEqual(
+            [project["description"] for project in data["projects"]],
+            ["Construyó una tienda con Django.", "Escribió un blog."],
+        )
+        self.assertEqual(
+            sorted(skill["name"] for skill in data["skills"]), ["Liderazgo", "Python"]
+        )
+
+    def test_invalid_fields_fall_back(self, mock_openai_class):
+        create = mock_openai_class.return_value.chat.completions.create
+        create.side_effect = [
+            batch_response(
+                {
+                    "bio": f"Ingeniero que trabaja con {self.python}.",
+                    # Lost its placeholder; the skill is missing
+                    f"project:{self.first.pk}": "Construyó una tienda.",
+                    f"project:{self.second.pk}": "Escribió un blog.",
+                }
+            ),
+            openai_response(f"Construyó una tienda con {self.django}."),
+            openai_response("Liderazgo"),
+        ]
+
+        data = translate_cv_content(self.cv.pk, "Spanish")["translated_data"]
+
+        self.assertEqual(create.call_count, 3)
+        self.assertEqual(
+            data["projects"][0]["description"], "Construyó una tienda con Django."
+        )
+        self.assertIn("Liderazgo", [skill["name"] for skill in data["skills"]])
+
+    def test_malformed_reply_falls_back_per_field(self, mock_openai_class):
+        create = mock_openai_class.return_value.chat.completions.create
+        create.side_effect = [openai_response("not json")] + [
+            openai_response("Traducido") for _ in range(4)
+        ]
+
+        data = translate_cv_content(self.cv.pk, "Spanish")["translated_data"]
+
+        self.assertEqual(create.call_count, 5)
+        self.assertEqual(data["bio"], "Traducido")
+
+    @override_settings(TRANSLATION_BATCH_MAX_TOKENS=20)
+    def test_large_cv_is_split(self, mock_openai_class):
+        units = translation_units(self.cv)
+        batches = split_batches(units, 20)
+        self.assertGreater(len(batches), 1)
+        self.assertEqual([unit for batch in batches for unit in batch], units)
+
+        create = mock_openai_class.return_value.chat.completions.create
+        create.side_effect = [
+            batch_response({unit.id: unit.text for unit in batch}) for batch in batches
+        ]
+
+        translate_cv_content(self.cv.pk, "Spanish")
+
+        self.assertEqual(create.call_count, len(batches))
@@ -0,0 +1,129 @@
+"""
+Tests for concurrent per-field translation and OpenAI retry backoff.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from main.models import CV, Skill
+from main.tasks import translate_cv_content
+from main.translation import retry_delay
+
+
+class APIError(Exception):
+    """Stand-in for an ``openai.APIStatusError``."""
+
+    def __init__(self, status_code, headers=None):
+        super().__init__(f"Error code: {status_code}")
+        self.status_code = status_code
+        self.response = MagicMock(headers=headers or {})
+
+
+def echo_response(**kwargs):
+    """Answer a per-field request with its text, marked as translated."""
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "es " + kwargs["messages"][1]["content"]
+    return response
+
+
+@override_settings(
+    OPENAI_API_KEY="test-api-key",
+    TRANSLATION_MODE="per_field",
+    TRANSLATION_CONCURRENCY=8,
+)
+@patch("openai.OpenAI")
+class ConcurrentTranslationTest(TestCase):
+    """Test that per-field requests overlap and keep their fields."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Parallel",
+            lastname="Fields",
+            email="parallel@example.com",
+            bio="A biography.",
+        )
+        self.skills = ["Leadership", "Mentoring", "Planning", "Writing", "Sales"]
+        for name in self.skills:
+            Skill.objects.create(cv=self.cv, name=name)
+
+    def test_requests_overlap(self, mock_openai_class):
+        in_flight = []
+        lock = threading.Lock()
+
+        def slow_response(**kwargs):
+            with lock:
+                in_flight.append(threading.get_ident())
+            time.sleep(0.2)
+            return echo_response(**kwargs)
+
+        create = mock_openai_class.return_value.chat.completions.create
+        create.side_effect = slow_response
+
+        start = time.perf_counter()
+        data = translate_cv_content(self.cv.pk, "Spanish")["translated_data"]
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(create.call_count, 6)
+        self.assertLess(elapsed, 0.2 * 6 / 2)
+        self.assertGreater(len(set(in_flight)), 1)
+        self.assertEqual(data["bio"], "es A biography.")
+        self.assertEqual(
+            sorted(skill["name"] for skill in data["skills"]),
+            sorted("es " + name for name in self.skills),
+        )
+
+    @patch("main.translation.time.sleep")
+    def test_rate_limited_request_is_retried(self, mock_sleep, mock_openai_class):
+        failures = {"Leadership": [APIError(429, {"retry-after": "2"})]}
+
+        def flaky_response(**kwargs):
+            pending = failures.get(kwargs["messages"][1]["content"])
+            if pending:
+                raise pending.pop()
+            return echo_response(**kwargs)
+
+        create = mock_openai_class.return_value.chat.completions.create
+        create.side_effect = flaky_response
+
+        data = translate_cv_content(self.cv.pk, "Spanish")["translated_data"]
+
+        self.assertEqual(create.call_count, 7)
+        mock_sleep.assert_called_once_with(2.0)
+        self.assertIn("es Leadership", [skill["name"] for skill in data["skills"]])
+
+    @patch("main.translation.time.sleep")
+    def test_client_error_is_not_retried(self, mock_sleep, mock_openai_class):
+        def bad_request(**kwargs):
+            if kwargs["messages"][1]["content"] == "Leadership":
+                raise APIError(400)
+            return echo_response(**kwargs)
+
+        create = mock_openai_class.return_value.chat.completions.create
+        create.side_effect = bad_request
+
+        data = translate_cv_content(self.cv.pk, "Spanish")["translated_data"]
+
+        self.assertEqual(create.call_count, 6)
+        mock_sleep.assert_not_called()
+        # The failed field keeps its original text
+        self.assertIn("Leadership", [skill["name"] for skill in data["skills"]])
+
+
+class RetryDelayTest(SimpleTestCase):
+    """Test the backoff delays."""
+
+    @override_settings(
+        TRANSLATION_BACKOFF={"ATTEMPTS": 3, "BASE_DELAY": 1.0, "MAX_DELAY": 5.0}
+    )
+    def test_jittered_exponential_delay(self):
+        for attempt, cap in [(0, 1.0), (1, 2.0), (2, 4.0), (5, 5.0)]:
+            delays = {retry_delay(APIError(503), attempt) for _ in range(20)}
+            self.assertTrue(all(0 <= delay <= cap for delay in delays))
+            self.assertGreater(len(delays), 1)
+
+    def test_retry_after_header(self):
+        self.assertEqual(retry_delay(APIError(429, {"retry-after": "3"}), 0), 3.0)
@@ -0,0 +1,134 @@
+"""
+Tests for the translation memory shared between CV translations.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from main.models import CV, Skill
+from main.tasks import translate_cv_content
+from main.translation import (
+    TranslationMemory,
+    TranslationUnit,
+    get_translation_memory,
+)
+
+MEMORY_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "translation-memory-tests",
+    }
+}
+
+
+def echo_response(**kwargs):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "es " + kwargs["messages"][1]["content"]
+    return response
+
+
+@override_settings(CACHES=MEMORY_CACHES, OPENAI_API_KEY="test-api-key")
+@patch("openai.OpenAI")
+class TranslationMemoryTest(TestCase):
+    """Test that repeated field translations skip OpenAI."""
+
+    def setUp(self):
+        memory = override_settings(
+            TRANSLATION_MEMORY={"ENABLED": True, "LRU_SIZE": 100, "TIMEOUT": 60}
+        )
+        memory.enable()
+        self.addCleanup(memory.disable)
+        self.addCleanup(cache.clear)
+
+        self.first = self.create_cv("first@example.com")
+        self.second = self.create_cv("second@example.com")
+
+    def create_cv(self, email):
+        cv = CV.objects.create(
+            firstname="Memory", lastname="Test", email=email, bio="Team player."
+        )
+        Skill.objects.create(cv=cv, name="Leadership")
+        return cv
+
+    def translate(self, mock_openai_class, cv, language="Spanish"):
+        create = mock_openai_class.return_value.chat.completions.create
+        create.reset_mock()
+        create.side_effect = echo_response
+        data = translate_cv_content(cv.pk, language)["translated_data"]
+        return data, create.call_count
+
+    def test_identical_fields_are_translated_once(self, mock_openai_class):
+        _, calls = self.translate(mock_openai_class, self.first)
+        self.assertEqual(calls, 2)
+
+        data, calls = self.translate(mock_openai_class, self.second)
+
+        self.assertEqual(calls, 0)
+        self.assertEqual(data["bio"], "es Team player.")
+        self.assertEqual(data["skills"][0]["name"], "es Leadership")
+        stats = get_translation_memory().stats()
+        self.assertEqual(stats["lru_hits"], 2)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_shared_cache_tier(self, mock_openai_class):
+        self.translate(mock_openai_class, self.first)
+        # Another process: empty LRU, same cache
+        get_translation_memory().clear()
+
+        _, calls = self.translate(mock_openai_class, self.second)
+
+        self.assertEqual(calls, 0)
+        self.assertEqual(get_translation_memory().stats()["cache_hits"], 2)
+
+    def test_only_new_fields_are_sent(self, mock_openai_class):
+        self.translate(mock_openai_class, self.first)
+        Skill.objects.create(cv=self.second, name="Mentoring")
+
+        _, calls = self.translate(mock_openai_class, self.second)
+
+        self.assertEqual(calls, 1)
+
+    def test_language_is_part_of_the_key(self, mock_openai_class):
+        self.translate(mock_openai_class, self.first)
+
+        _, calls = self.translate(mock_openai_class, self.second, "Breton")
+
+        self.assertEqual(calls, 2)
+
+
+@override_settings(CACHES=MEMORY_CACHES)
+class TranslationMemoryKeyTest(TestCase):
+    """Test memory keys and the LRU bound."""
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_key(self):
+        memory = TranslationMemory()
+        skill = TranslationUnit("skill:1", "skill", "Project  Management ")
+
+        self.assertEqual(
+            memory.key(skill, "Spanish"),
+            memory.key(
+                TranslationUnit("skill:2", "skill", "Project Management"), "spanish"
+            ),
+        )
+        self.assertNotEqual(
+            memory.key(skill, "Spanish"),
+            memory.key(TranslationUnit("bio", "bio", "Project Management"), "Spanish"),
+        )
+        with patch("main.translation.PROMPT_VERSION", "2"):
+            changed = memory.key(skill, "Spanish")
+        self.assertNotEqual(changed, memory.key(skill, "Spanish"))
+
+    def test_lru_is_bounded(self):
+        memory = TranslationMemory(lru_size=2)
+        units = [TranslationUnit(f"skill:{i}", "skill", f"Skill {i}") for i in range(3)]
+        memory.set_many([(unit, "x") for unit in units], "Spanish")
+
+        # Only the LRU is left to answer
+        cache.clear()
+        self.assertEqual(set(memory.get_many(units, "Spanish")), {"skill:1", "skill:2"})
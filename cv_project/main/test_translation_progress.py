@@ -0,0 +1,194 @@
+"""
+Tests for translation progress reports and streamed fields.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from main.models import CV, Skill
+from main.pdf import CVData
+from main.tasks import translate_cv_content
+from main.translation import (
+    TranslationProgress,
+    TranslationUnit,
+    _without_partial_placeholder,
+    protect_technical_terms,
+)
+
+
+def echo_response(**kwargs):
+    response = MagicMock()
+    response.choices = [MagicMock()]
+    response.choices[0].message.content = "es " + kwargs["messages"][1]["content"]
+    return response
+
+
+def stream_chunks(text, size):
+    chunks = []
+    for start in range(0, len(text), size):
+        chunk = MagicMock()
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = text[start : start + size]
+        chunks.append(chunk)
+    return chunks
+
+
+@override_settings(OPENAI_API_KEY="test-api-key")
+@patch("openai.OpenAI")
+class TranslationProgressTest(TestCase):
+    """Test that the task publishes fields as they are translated."""
+
+    def setUp(self):
+        self.cv = CV.objects.create(
+            firstname="Progress",
+            lastname="Report",
+            email="progress@example.com",
+            bio="Team player.",
+        )
+        Skill.objects.create(cv=self.cv, name="Leadership")
+        Skill.objects.create(cv=self.cv, name="Mentoring")
+
+    @patch.object(translate_cv_content, "update_state")
+    def test_progress_is_published_per_field(self, mock_update_state, mock_openai):
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = echo_response
+
+        result = translate_cv_content.apply(args=(self.cv.pk, "Spanish"), task_id="t")
+
+        self.assertTrue(result.result["success"])
+        metas = [call.kwargs["meta"] for call in mock_update_state.call_args_list]
+        self.assertEqual(
+            [call.kwargs["state"] for call in mock_update_state.call_args_list],
+            ["PROGRESS"] * 4,
+        )
+        self.assertEqual([meta["done"] for meta in metas], [0, 1, 2, 3])
+        self.assertEqual({meta["total"] for meta in metas}, {3})
+        # The first field arrives while the others keep their original text
+        self.assertEqual(metas[1]["translated_data"]["bio"], "es Team player.")
+        self.assertEqual(
+            [skill["name"] for skill in metas[1]["translated_data"]["skills"]],
+            ["Leadership", "Mentoring"],
+        )
+
+    @override_settings(TRANSLATION_CONCURRENCY=4)
+    @patch.object(translate_cv_content, "update_state")
+    def test_progress_from_worker_threads(self, mock_update_state, mock_openai):
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = echo_response
+
+        translate_cv_content.apply(args=(self.cv.pk, "Spanish"), task_id="t")
+
+        calls = mock_update_state.call_args_list
+        self.assertEqual([call.kwargs["meta"]["done"] for call in calls], [0, 1, 2, 3])
+        self.assertEqual({call.kwargs["task_id"] for call in calls}, {"t"})
+
+    @patch.object(translate_cv_content, "update_state")
+    def test_direct_calls_do_not_publish(self, mock_update_state, mock_openai):
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = echo_response
+
+        translate_cv_content(self.cv.pk, "Spanish")
+
+        mock_update_state.assert_not_called()
+
+    @override_settings(TRANSLATION_MODE="batch", TRANSLATION_STREAM_MIN_CHARS=400)
+    @patch("main.translation.STREAM_REPORT_CHARS", 100)
+    @patch.object(translate_cv_content, "update_state")
+    def test_long_bio_is_streamed(self, mock_update_state, mock_openai):
+        self.cv.bio = "Built services with Python. " * 20
+        self.cv.save()
+        bio = protect_technical_terms(self.cv.bio)[0]
+        translated_bio = "es " + bio
+
+        def respond(**kwargs):
+            if kwargs.get("stream"):
+                return stream_chunks(translated_bio, 30)
+            response = MagicMock()
+            response.choices = [MagicMock()]
+            response.choices[0].message.content = (
+                '{"translations": {"skill:%d": "Liderazgo", "skill:%d": "Tutoría"}}'
+                % tuple(self.cv.skills.order_by("name").values_list("pk", flat=True))
+            )
+            return response
+
+        create = mock_openai.return_value.chat.completions.create
+        create.side_effect = respond
+
+        result = translate_cv_content.apply(args=(self.cv.pk, "Spanish"), task_id="t")
+
+        data = result.result["translated_data"]
+        self.assertEqual(data["bio"], "es " + self.cv.bio.strip())
+        self.assertEqual(create.call_count, 2)
+        self.assertNotIn("stream", create.call_args_list[0].kwargs)
+        partial_bios = [
+            call.kwargs["meta"]["translated_data"]["bio"]
+            for call in mock_update_state.call_args_list
+        ]
+        streamed = [
+            bio for bio in partial_bios if bio.startswith("es ") and bio != data["bio"]
+        ]
+        self.assertGreater(len(streamed), 1)
+        self.assertTrue(all("TECH_TERM" not in bio for bio in partial_bios))
+
+
+@patch("celery.result.AsyncResult")
+class TranslationStatusProgressTest(TestCase):
+    """Test that the status view returns partial translations."""
+
+    def test_progress_status(self, mock_async_result):
+        mock_async_result.return_value.state = "PROGRESS"
+        mock_async_result.return_value.info = {
+            "target_language": "Spanish",
+            "translated_data": {"bio": "es Bio", "projects": [], "skills": []},
+            "done": 1,
+            "total": 3,
+        }
+
+        response = self.client.get(
+            reverse("check_translation_status", kwargs={"task_id": "task-1"})
+        )
+
+        data = response.json()
+        self.assertEqual(data["state"], "PROGRESS")
+        self.assertEqual(data["translated_data"]["bio"], "es Bio")
+        self.assertEqual((data["done"], data["total"]), (1, 3))
+
+
+class PartialPlaceholderTest(SimpleTestCase):
+    """Test cleaning streamed text before it is shown."""
+
+    def test_cut_off_placeholders_are_dropped(self):
+        for text, expected in [
+            ("Con TECH_TERM_1", "Con "),
+            ("Con TECH_TE", "Con "),
+            ("Con T", "Con "),
+            ("Con TECH_TERM_1 y", "Con TECH_TERM_1 y"),
+        ]:
+            self.assertEqual(_without_partial_placeholder(text), expected)
+
+    def test_streaming_report(self):
+        data = CVData(
+            firstname="Stream",
+            lastname="Test",
+            email="stream@example.com",
+            phone="",
+            bio="Python",
+            updated_at=timezone.now(),
+            id=1,
+        )
+        unit = TranslationUnit("bio", "bio", "TECH_TERM_0", {"TECH_TERM_0": "Python"})
+        reports = []
+        progress = TranslationProgress(
+            data, [unit], {}, lambda *args: reports.append(args)
+        )
+
+        progress.streaming("bio", "Con TECH_TERM_0 y TECH_TE")
+        progress.completed({"bio": "Con TECH_TERM_0"})
+
+        self.assertEqual(reports[0][0]["bio"], "Con Python y")
+        self.assertEqual(reports[0][1:], (0, 1))
+        self.assertEqual(reports[1][0]["bio"], "Con Python")
+        self.assertEqual(reports[1][1:], (1, 1))
@@ -7,6 +7,7 @@ from datetime import date
 from datetime import datetime, timedelta
 
 from django.conf import settings
+from django.core.management import call_command
 from django.http import HttpResponse
 from django.template import Template
 from django.test import TestCase, Client, RequestFactory
@@ -173,6 +174,19 @@ class ContactModelTest(TestCase):
             )
 
 
+class InitialDataFixtureTest(TestCase):
+    """Test the sample data loaded by the setup instructions."""
+
+    def test_loaddata(self):
+        """Test that initial_data loads with every model's required fields."""
+        call_command("loaddata", "initial_data", verbosity=0)
+
+        cv = CV.objects.get(pk=1)
+        self.assertEqual(cv.skills.count(), 6)
+        self.assertEqual(cv.projects.count(), 3)
+        self.assertEqual(cv.contacts.count(), 3)
+
+
 class CVListViewTest(TestCase):
     """Test cases for CV list view."""
 
@@ -270,7 +284,8 @@ class CVDetailViewTest(TestCase):
 
     def test_cv_detail_view_query_optimization(self):
         """Test that CV detail view uses optimized queries."""
-        with self.assertNumQueries(6):
+        # One more query reads the stored translations
+        with self.assertNumQueries(7):
             response = self.client.get(reverse("cv_detail", kwargs={"pk": self.cv.pk}))
             # Access related objects to trigger queries
             cv = response.context["cv"]
@@ -0,0 +1,968 @@
+"""
+CV translation with OpenAI, and stored CV translations.
+
+``translate_cv`` sends the translatable text of a CV (biography, project
+descriptions and non-technical skill names) to OpenAI. With
+``TRANSLATION_MODE = "batch"`` the fields go out as one JSON document per
+request, split to stay under ``TRANSLATION_BATCH_MAX_TOKENS``, and only the
+fields missing or invalid in the reply are retried one request per field;
+``"per_field"`` makes one request per field. Requests run concurrently, up
+to ``TRANSLATION_CONCURRENCY`` at a time, and rate-limit (429), server
+(5xx) and connection errors are retried with jittered exponential backoff
+(``TRANSLATION_BACKOFF``). Fields found in the translation memory
+(``TRANSLATION_MEMORY``) are not sent at all. Callers can follow a
+translation field by field (``TranslationProgress``); fields longer than
+``TRANSLATION_STREAM_MIN_CHARS`` are then streamed from OpenAI.
+
+Translated fields are stored as ``CVTranslation`` rows together with a hash
+of their source text, so re-translating an edited CV only sends the fields
+that changed. Complete translations are also cached per CV version and
+language, so the translation task, translated PDF downloads and translated
+emails all reuse one set of OpenAI calls until the CV changes.
+"""
+
+import hashlib
+import json
+import logging
+import random
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+
+from .models import CVTranslation
+from .pdf import CVData
+
+logger = logging.getLogger(__name__)
+
+# Languages offered by the translation UI, keyed by their form value
+SUPPORTED_LANGUAGES = settings.TRANSLATION_SUPPORTED_LANGUAGES
+
+TRANSLATION_MODEL = "gpt-3.5-turbo"
+# Bump when the prompts change, so the translation memory stops reusing
+# translations made with the old ones
+PROMPT_VERSION = "1"
+
+# Technical terms to avoid translating; extend with
+# TRANSLATION_EXTRA_TECHNICAL_TERMS
+TECHNICAL_TERMS = frozenset(
+    {
+        "Python",
+        "Django",
+        "JavaScript",
+        "React",
+        "Vue",
+        "Angular",
+        "Node.js",
+        "PostgreSQL",
+        "MySQL",
+        "MongoDB",
+        "Redis",
+        "Docker",
+        "Kubernetes",
+        "AWS",
+        "Azure",
+        "GCP",
+        "Git",
+        "GitHub",
+        "GitLab",
+        "CI/CD",
+        "API",
+        "REST",
+        "GraphQL",
+        "HTML",
+        "CSS",
+        "SCSS",
+        "TypeScript",
+        "Java",
+        "C++",
+        "C#",
+        "PHP",
+        "Ruby",
+        "Go",
+        "Rust",
+        "Swift",
+        "Kotlin",
+        "Flask",
+        "FastAPI",
+        "Express",
+        "Spring",
+        "Laravel",
+        "Symfony",
+        "TensorFlow",
+        "PyTorch",
+        "scikit-learn",
+        "NumPy",
+        "Pandas",
+        "Jupyter",
+        "Anaconda",
+        "Linux",
+        "Ubuntu",
+        "CentOS",
+        "Windows",
+        "macOS",
+        "iOS",
+        "Android",
+        "Unity",
+        "Unreal",
+        "Blender",
+        "Photoshop",
+        "Illustrator",
+        "Figma",
+        "Sketch",
+        "Adobe",
+        "Webpack",
+        "Babel",
+        "npm",
+        "yarn",
+        "pip",
+        "composer",
+        "Terraform",
+        "Ansible",
+        "Jenkins",
+        "Nginx",
+        "Apache",
+        "Elasticsearch",
+        "Kafka",
+        "RabbitMQ",
+        "Celery",
+        "Gunicorn",
+    }
+)
+
+PLACEHOLDER_PREFIX = "TECH_TERM_"
+PLACEHOLDER_RE = re.compile(PLACEHOLDER_PREFIX + r"\d+")
+_TRAILING_PLACEHOLDER_RE = re.compile(PLACEHOLDER_PREFIX + r"\d*\Z")
+_WHITESPACE_RE = re.compile(r"[ \t]+")
+# Characters of a streamed field received between progress reports
+STREAM_REPORT_CHARS = 200
+
+# System prompt and response token limit per field kind
+FIELD_PROMPTS = {
+    "bio": (
+        "You are a professional translator. Translate the following professional biography to {language}. Maintain professional tone and keep any placeholders (TECH_TERM_X) unchanged. Preserve paragraph structure.",
+        1000,
+    ),
+    "project": (
+        "You are a professional translator. Translate the following project description to {language}. Maintain professional tone and keep any placeholders (TECH_TERM_X) unchanged.",
+        500,
+    ),
+    "skill": (
+        "You are a professional translator. Translate this skill name to {language}. If it's a technical term or proper noun, return it unchanged. Return only the translated text.",
+        50,
+    ),
+}
+
+BATCH_PROMPT = (
+    "You are a professional translator. The user sends a JSON object whose "
+    '"fields" map ids to CV text. Translate every value to {language}: "bio" '
+    'is a professional biography (preserve paragraph structure), "project:*" '
+    'are project descriptions and "skill:*" are skill names (return technical '
+    "terms and proper nouns unchanged). Maintain professional tone and keep "
+    "any placeholders (TECH_TERM_X) unchanged. Reply with a JSON object "
+    '{{"translations": {{<id>: <translated text>}}}} containing every id.'
+)
+
+
+class TermProtector:
+    """
+    Swaps technical terms for placeholders and back, in one pass each.
+
+    The terms are compiled once into a single regex whose alternation is
+    factored as a trie, so a scan costs about the same for 80 terms as for
+    5,000. Matching is case-insensitive and the longest term wins; each
+    distinct spelling in a text gets its own ``TECH_TERM_<n>`` placeholder.
+    """
+
+    def __init__(self, terms):
+        self.terms = frozenset(terms)
+        self.pattern = None
+        if self.terms:
+            self.pattern = re.compile(
+                r"(?<!\w)" + _trie_pattern(self.terms) + r"(?!\w)", re.IGNORECASE
+            )
+
+    def protect(self, text):
+        """Return ``text`` with terms replaced, and the placeholder map."""
+        if not text or self.pattern is None:
+            return text, {}
+
+        placeholders = {}
+
+        def replace(match):
+            term = match.group()
+            if term not in placeholders:
+                placeholders[term] = f"{PLACEHOLDER_PREFIX}{len(placeholders)}"
+            return placeholders[term]
+
+        protected_text = self.pattern.sub(replace, text)
+        return protected_text, {
+            placeholder: term for term, placeholder in placeholders.items()
+        }
+
+    @staticmethod
+    def restore(text, term_map):
+        """Put the terms of ``term_map`` back in place of their placeholders."""
+        if not text or not term_map:
+            return text
+        return PLACEHOLDER_RE.sub(
+            lambda match: term_map.get(match.group(), match.group()), text
+        )
+
+
+def _trie_pattern(terms):
+    """Return a regex matching any of ``terms``, with shared prefixes factored."""
+    trie = {}
+    for term in terms:
+        node = trie
+        for char in term.lower():
+            node = node.setdefault(char, {})
+        node[""] = {}
+    return _trie_node_pattern(trie)
+
+
+def _trie_node_pattern(node):
+    branches = [
+        re.escape(char) + _trie_node_pattern(child)
+        for char, child in sorted(node.items())
+        if char
+    ]
+    if not branches:
+        return ""
+    pattern = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+    if "" in node:
+        # A term ends here, but a longer one is tried first
+        pattern = f"(?:{pattern})?"
+    return pattern
+
+
+_protector = None
+_protector_lock = threading.Lock()
+
+
+def get_term_protector():
+    """
+    Return the process-wide ``TermProtector`` for ``TECHNICAL_TERMS`` and
+    ``TRANSLATION_EXTRA_TECHNICAL_TERMS``.
+    """
+    global _protector
+
+    if _protector is None:
+        with _protector_lock:
+            if _protector is None:
+                extra = getattr(settings, "TRANSLATION_EXTRA_TECHNICAL_TERMS", ())
+                _protector = TermProtector(TECHNICAL_TERMS.union(extra))
+    return _protector
+
+
+@receiver(setting_changed)
+def _reset_term_protector(setting, **kwargs):
+    """Recompile the terms when ``TRANSLATION_EXTRA_TECHNICAL_TERMS`` changes."""
+    global _protector
+
+    if setting == "TRANSLATION_EXTRA_TECHNICAL_TERMS":
+        _protector = None
+
+
+def protect_technical_terms(text):
+    """Wrap technical terms to prevent translation."""
+    return get_term_protector().protect(text)
+
+
+def restore_technical_terms(text, term_map):
+    """Restore technical terms after translation."""
+    return TermProtector.restore(text, term_map)
+
+
+def is_retryable(exc):
+    """Return whether an OpenAI error is worth retrying (429, 5xx, network)."""
+    status = getattr(exc, "status_code", None)
+    if status is not None:
+        return status == 429 or status >= 500
+    try:
+        import openai
+    except ImportError:
+        return False
+    return isinstance(exc, openai.APIConnectionError)
+
+
+def retry_delay(exc, attempt):
+    """
+    Return the seconds to wait before retry number ``attempt`` (from 0).
+
+    Honours the server's ``Retry-After`` header, otherwise waits a random
+    time up to an exponentially growing cap ("full jitter"), so concurrent
+    requests that failed together do not retry together.
+    """
+    config = getattr(settings, "TRANSLATION_BACKOFF", {})
+    max_delay = config.get("MAX_DELAY", 20.0)
+    response = getattr(exc, "response", None)
+    try:
+        retry_after = float(response.headers["retry-after"])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        pass
+    else:
+        return min(retry_after, max_delay)
+    return random.uniform(0, min(config.get("BASE_DELAY", 1.0) * 2**attempt, max_delay))
+
+
+def with_backoff(call):
+    """Return ``call()``, retrying retryable errors up to ``ATTEMPTS`` times."""
+    attempts = getattr(settings, "TRANSLATION_BACKOFF", {}).get("ATTEMPTS", 3)
+    for attempt in range(attempts):
+        try:
+            return call()
+        except Exception as e:
+            if attempt + 1 >= attempts or not is_retryable(e):
+                raise
+            delay = retry_delay(e, attempt)
+            logger.info(f"OpenAI request failed ({str(e)}), retrying in {delay:.1f}s")
+            time.sleep(delay)
+
+
+@dataclass(frozen=True)
+class TranslationUnit:
+    """
+    One CV field to translate.
+
+    ``id`` is ``"bio"``, ``"project:<pk>"`` or ``"skill:<pk>"``; ``text`` is
+    what is sent, with technical terms replaced by the placeholders in
+    ``term_map``.
+    """
+
+    id: str
+    kind: str
+    text: str
+    term_map: dict = field(default_factory=dict, compare=False)
+
+    def restore(self, translated):
+        return restore_technical_terms(translated.strip(), self.term_map)
+
+    @property
+    def source_hash(self):
+        """Hash of the source text, stored with the field's translation."""
+        source = json.dumps(
+            [self.kind, self.text, sorted(self.term_map.items())], ensure_ascii=False
+        )
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def translation_units(cv):
+    """Return the fields of a CV or snapshot that need translating, in CV order."""
+    data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+    units = []
+    if data.bio:
+        text, term_map = protect_technical_terms(data.bio)
+        units.append(TranslationUnit("bio", "bio", text, term_map))
+    for project in data.projects:
+        if project.description:
+            text, term_map = protect_technical_terms(project.description)
+            units.append(
+                TranslationUnit(f"project:{project.id}", "project", text, term_map)
+            )
+    for skill in data.skills:
+        # Technical skill names are kept as they are
+        if skill.name not in get_term_protector().terms:
+            units.append(TranslationUnit(f"skill:{skill.id}", "skill", skill.name))
+    return units
+
+
+def estimate_tokens(text):
+    """Estimate the tokens of ``text`` (about four characters per token)."""
+    return len(text) // 4 + 1
+
+
+def split_batches(units, max_tokens):
+    """Group ``units`` into batches of at most ``max_tokens`` estimated tokens."""
+    batches = []
+    batch = []
+    size = 0
+    for unit in units:
+        tokens = estimate_tokens(unit.text) + 8  # id and JSON punctuation
+        if batch and size + tokens > max_tokens:
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(unit)
+        size += tokens
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class TranslationMemory:
+    """
+    Raw translations of single fields, reused across CVs.
+
+    Entries are keyed by the normalized source text and its field kind, the
+    target language, ``TRANSLATION_MODEL`` and ``PROMPT_VERSION``, so common
+    skill names and repeated bios are translated once. An in-process LRU of
+    ``lru_size`` entries sits in front of the Django cache ``cache_alias``
+    (Redis in production), shared by all web and worker processes.
+    """
+
+    def __init__(self, lru_size=1024, cache_alias="default", timeout=None):
+        self.lru_size = lru_size
+        self.cache_alias = cache_alias
+        self.timeout = timeout
+        self._lru = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"lru_hits": 0, "cache_hits": 0, "misses": 0}
+
+    def key(self, unit, language):
+        text = _WHITESPACE_RE.sub(" ", unicodedata.normalize("NFC", unit.text))
+        source = "\0".join(
+            [
+                PROMPT_VERSION,
+                TRANSLATION_MODEL,
+                language_key(language),
+                unit.kind,
+                text.strip(),
+            ]
+        )
+        return f"tm:{hashlib.sha256(source.encode('utf-8')).hexdigest()}"
+
+    def get_many(self, units, language):
+        """Return the stored raw translations of ``units`` by unit id."""
+        keys = {unit.id: self.key(unit, language) for unit in units}
+        found = {}
+        with self._lock:
+            for unit_id, key in keys.items():
+                if key in self._lru:
+                    self._lru.move_to_end(key)
+                    found[unit_id] = self._lru[key]
+            self._stats["lru_hits"] += len(found)
+
+        missing = {key for unit_id, key in keys.items() if unit_id not in found}
+        stored = caches[self.cache_alias].get_many(missing) if missing else {}
+        with self._lock:
+            for unit_id, key in keys.items():
+                if unit_id not in found and key in stored:
+                    found[unit_id] = stored[key]
+                    self._remember(key, stored[key])
+                    self._stats["cache_hits"] += 1
+            self._stats["misses"] += len(keys) - len(found)
+        return found
+
+    def set_many(self, translations, language):
+        """Store ``(unit, raw translation)`` pairs."""
+        entries = {self.key(unit, language): text for unit, text in translations}
+        if not entries:
+            return
+        caches[self.cache_alias].set_many(entries, self.timeout)
+        with self._lock:
+            for key, text in entries.items():
+                self._remember(key, text)
+
+    def stats(self):
+        """Return hit and miss counters for this process."""
+        with self._lock:
+            stats = dict(self._stats)
+        lookups = stats["lru_hits"] + stats["cache_hits"] + stats["misses"]
+        hits = lookups - stats["misses"]
+        stats["hit_rate"] = hits / lookups if lookups else 0.0
+        return stats
+
+    def clear(self):
+        """Forget the in-process entries (the shared cache is kept)."""
+        with self._lock:
+            self._lru.clear()
+
+    def _remember(self, key, text):
+        self._lru[key] = text
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.lru_size:
+            self._lru.popitem(last=False)
+
+
+_memory = None
+_memory_lock = threading.Lock()
+
+
+def get_translation_memory():
+    """
+    Return the process-wide translation memory (see ``TRANSLATION_MEMORY``).
+
+    Returns ``None`` when the memory is disabled.
+    """
+    global _memory
+
+    config = getattr(settings, "TRANSLATION_MEMORY", {})
+    if not config.get("ENABLED", True):
+        return None
+    if _memory is None:
+        with _memory_lock:
+            if _memory is None:
+                _memory = TranslationMemory(
+                    lru_size=config.get("LRU_SIZE", 1024),
+                    cache_alias=config.get("CACHE", "default"),
+                    timeout=config.get("TIMEOUT", 30 * 24 * 3600),
+                )
+    return _memory
+
+
+@receiver(setting_changed)
+def _reset_translation_memory(setting, **kwargs):
+    """Drop the memory when ``TRANSLATION_MEMORY`` is overridden."""
+    global _memory
+
+    if setting == "TRANSLATION_MEMORY":
+        _memory = None
+
+
+def translate_field(client, unit, language, progress=None):
+    """
+    Translate one unit with its own request; return the raw translation.
+
+    With ``progress``, long fields (``TRANSLATION_STREAM_MIN_CHARS``) are
+    streamed and their partial text is reported as it arrives.
+    """
+    prompt, max_tokens = FIELD_PROMPTS[unit.kind]
+    stream = progress is not None and is_streamed(unit)
+    response = with_backoff(
+        lambda: client.chat.completions.create(
+            model=TRANSLATION_MODEL,
+            messages=[
+                {"role": "system", "content": prompt.format(language=language)},
+                {"role": "user", "content": unit.text},
+            ],
+            max_tokens=max_tokens,
+            temperature=0.3,
+            **({"stream": True} if stream else {}),
+        )
+    )
+    if not stream:
+        return response.choices[0].message.content.strip()
+
+    parts = []
+    reported = received = 0
+    for chunk in response:
+        content = chunk.choices[0].delta.content if chunk.choices else None
+        if content:
+            parts.append(content)
+            received += len(content)
+            if received - reported >= STREAM_REPORT_CHARS:
+                progress.streaming(unit.id, "".join(parts))
+                reported = received
+    return "".join(parts).strip()
+
+
+def is_streamed(unit):
+    """Whether ``unit`` is long enough to stream when progress is reported."""
+    return len(unit.text) >= getattr(settings, "TRANSLATION_STREAM_MIN_CHARS", 1500)
+
+
+def translate_batch(client, units, language):
+    """
+    Translate ``units`` with one JSON request.
+
+    Returns raw translations by unit id for the fields that came back valid:
+    a non-empty string keeping every placeholder of its source.
+    """
+    source_tokens = sum(estimate_tokens(unit.text) for unit in units)
+    try:
+        response = with_backoff(
+            lambda: client.chat.completions.create(
+                model=TRANSLATION_MODEL,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": BATCH_PROMPT.format(language=language),
+                    },
+                    {
+                        "role": "user",
+                        "content": json.dumps(
+                            {"fields": {unit.id: unit.text for unit in units}},
+                            ensure_ascii=False,
+                        ),
+                    },
+                ],
+                response_format={"type": "json_object"},
+                # Translations may run longer than their source
+                max_tokens=min(2 * source_tokens + 100 + 20 * len(units), 4096),
+                temperature=0.3,
+            )
+        )
+        translations = json.loads(response.choices[0].message.content)["translations"]
+        if not isinstance(translations, dict):
+            raise ValueError("translations is not an object")
+    except Exception as e:
+        logger.warning(f"Batch translation of {len(units)} fields failed: {str(e)}")
+        return {}
+
+    results = {}
+    for unit in units:
+        translated = translations.get(unit.id)
+        if (
+            isinstance(translated, str)
+            and translated.strip()
+            and set(PLACEHOLDER_RE.findall(unit.text))
+            <= set(PLACEHOLDER_RE.findall(translated))
+        ):
+            results[unit.id] = translated.strip()
+        else:
+            logger.warning(f"Batch translation returned no valid {unit.id}")
+    return results
+
+
+def translate_units(client, units, language, progress=None):
+    """
+    Translate ``units`` from the translation memory, asking OpenAI for the rest.
+
+    Returns restored translations by unit id; fields that could not be
+    translated are left out. Translated fields are reported to ``progress``
+    (a ``TranslationProgress``) as they complete.
+    """
+    memory = get_translation_memory()
+    raw = memory.get_many(units, language) if memory is not None else {}
+    if progress is not None and raw:
+        progress.completed(raw)
+    pending = [unit for unit in units if unit.id not in raw]
+    if pending:
+        requested = request_translations(client, pending, language, progress)
+        if memory is not None:
+            memory.set_many(
+                [
+                    (unit, requested[unit.id])
+                    for unit in pending
+                    if unit.id in requested
+                ],
+                language,
+            )
+        raw.update(requested)
+    if memory is not None and units:
+        logger.info(
+            f"Translation memory answered {len(units) - len(pending)} of "
+            f"{len(units)} fields ({language})"
+        )
+    return {unit.id: unit.restore(raw[unit.id]) for unit in units if unit.id in raw}
+
+
+def request_translations(client, units, language, progress=None):
+    """
+    Translate ``units`` with OpenAI as ``TRANSLATION_MODE`` says.
+
+    Returns raw translations by unit id, leaving out failed fields. When
+    progress is reported, long fields skip the batch requests so that they
+    can be streamed.
+    """
+    results = {}
+    if getattr(settings, "TRANSLATION_MODE", "batch") == "batch":
+        max_tokens = getattr(settings, "TRANSLATION_BATCH_MAX_TOKENS", 2000)
+        batches = split_batches(
+            [unit for unit in units if progress is None or not is_streamed(unit)],
+            max_tokens,
+        )
+
+        def translate_and_report(batch):
+            translated = translate_batch(client, batch, language)
+            if progress is not None and translated:
+                progress.completed(translated)
+            return translated
+
+        for translated in run_concurrently(translate_and_report, batches):
+            results.update(translated)
+
+    def translate_or_skip(unit):
+        try:
+            translated = translate_field(client, unit, language, progress)
+        except Exception as e:
+            logger.warning(f"Failed to translate {unit.id}: {str(e)}")
+            return None
+        if progress is not None:
+            progress.completed({unit.id: translated})
+        return translated
+
+    pending = [unit for unit in units if unit.id not in results]
+    for unit, translated in zip(pending, run_concurrently(translate_or_skip, pending)):
+        if translated is not None:
+            results[unit.id] = translated
+    return results
+
+
+def run_concurrently(func, items):
+    """
+    Return ``[func(item) for item in items]``, computed in threads.
+
+    At most ``TRANSLATION_CONCURRENCY`` calls run at once; results keep the
+    order of ``items``.
+    """
+    workers = min(getattr(settings, "TRANSLATION_CONCURRENCY", 8), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="translation"
+    ) as executor:
+        return list(executor.map(func, items))
+
+
+def translate_cv(client, cv, language, on_progress=None):
+    """
+    Translate ``cv`` into ``language`` and return its ``translated_data``.
+
+    Fields whose stored ``CVTranslation`` still matches their source text
+    are reused; only new and edited fields are translated, and stored.
+    Fields that could not be translated keep their original text.
+
+    ``on_progress(translated_data, done, total)`` is called, possibly from
+    worker threads, whenever fields are translated (see
+    ``TranslationProgress``).
+    """
+    data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+    units = translation_units(data)
+    translations = stored_field_translations(data.id, units, language)
+    pending = [unit for unit in units if unit.id not in translations]
+    progress = None
+    if on_progress is not None and pending:
+        progress = TranslationProgress(data, units, translations, on_progress)
+        progress.report()
+    translated = translate_units(client, pending, language, progress) if pending else {}
+    save_field_translations(data.id, units, language, translated)
+    translations.update(translated)
+    logger.info(
+        f"Translated {len(pending)} of {len(units)} fields of CV {data.id} "
+        f"to {language}"
+    )
+    return build_translated_data(data, translations)
+
+
+class TranslationProgress:
+    """
+    Collects field translations as they complete and reports partial CVs.
+
+    ``callback(translated_data, done, total)`` gets the JSON-ready
+    ``translated_data`` of every field finished so far, plus the partial
+    text of fields still streaming; other fields keep their original text.
+    Calls are serialized, so reports arrive in order.
+    """
+
+    def __init__(self, data, units, translations, callback):
+        self.data = data
+        self.units = {unit.id: unit for unit in units}
+        self.translations = dict(translations)
+        self.callback = callback
+        self._partial = {}
+        self._lock = threading.Lock()
+
+    def completed(self, raw_translations):
+        """Record finished fields, given their raw translations by unit id."""
+        with self._lock:
+            for unit_id, translated in raw_translations.items():
+                self.translations[unit_id] = self.units[unit_id].restore(translated)
+                self._partial.pop(unit_id, None)
+            self._report()
+
+    def streaming(self, unit_id, raw_text):
+        """Record the text received so far for a streamed field."""
+        with self._lock:
+            self._partial[unit_id] = self.units[unit_id].restore(
+                _without_partial_placeholder(raw_text)
+            )
+            self._report()
+
+    def report(self):
+        with self._lock:
+            self._report()
+
+    def _report(self):
+        translations = {**self._partial, **self.translations}
+        self.callback(
+            _json_normalized(build_translated_data(self.data, translations)),
+            len(self.translations),
+            len(self.units),
+        )
+
+
+def _without_partial_placeholder(text):
+    """Drop a placeholder cut off at the end of streamed text."""
+    # More digits may follow a complete-looking one
+    match = _TRAILING_PLACEHOLDER_RE.search(text)
+    if match:
+        return text[: match.start()]
+    for length in range(len(PLACEHOLDER_PREFIX) - 1, 0, -1):
+        if text.endswith(PLACEHOLDER_PREFIX[:length]):
+            return text[:-length]
+    return text
+
+
+def build_translated_data(data, translations):
+    """Return ``translated_data`` for a snapshot and translations by unit id."""
+    translation_data = {"bio": translations.get("bio", data.bio or "")}
+
+    translation_data["projects"] = []
+    for project in data.projects:
+        translation_data["projects"].append(
+            {
+                "id": project.id,
+                "title": project.title,  # Keep title as is (usually technical)
+                "description": translations.get(
+                    f"project:{project.id}", project.description
+                ),
+                "technologies": project.technologies,
+                "url": project.url,
+                "start_date": project.start_date,
+                "end_date": project.end_date,
+                "is_ongoing": project.is_ongoing,
+            }
+        )
+
+    translation_data["skills"] = []
+    for skill in data.skills:
+        name = translations.get(f"skill:{skill.id}", skill.name)
+        # Only use translation if it's different and not just the original
+        translation_data["skills"].append(
+            {
+                "id": skill.id,
+                "name": name if name.lower() != skill.name.lower() else skill.name,
+                "proficiency": skill.proficiency,
+            }
+        )
+
+    return translation_data
+
+
+def stored_field_translations(cv_id, units, language):
+    """Return stored translations still matching ``units``, by unit id."""
+    hashes = {unit.id: unit.source_hash for unit in units}
+    rows = CVTranslation.objects.filter(cv_id=cv_id, language=language_key(language))
+    return {
+        row.field: row.text
+        for row in rows.only("field", "source_hash", "text")
+        if hashes.get(row.field) == row.source_hash
+    }
+
+
+def save_field_translations(cv_id, units, language, translations):
+    """
+    Store ``translations`` (by unit id) of ``units`` as ``CVTranslation`` rows.
+
+    Rows of fields no longer in ``units`` (deleted projects and skills) are
+    removed.
+    """
+    language = language_key(language)
+    CVTranslation.objects.filter(cv_id=cv_id, language=language).exclude(
+        field__in=[unit.id for unit in units]
+    ).delete()
+    CVTranslation.objects.bulk_create(
+        [
+            CVTranslation(
+                cv_id=cv_id,
+                language=language,
+                field=unit.id,
+                source_hash=unit.source_hash,
+                text=translations[unit.id],
+            )
+            for unit in units
+            if unit.id in translations
+        ],
+        update_conflicts=True,
+        unique_fields=["cv", "language", "field"],
+        update_fields=["source_hash", "text", "updated_at"],
+    )
+
+
+def stored_translations(cv):
+    """
+    Return the complete, current stored translations of a CV by language key.
+
+    Languages missing a field, or holding a field translated from older
+    text, are left out until they are re-translated.
+    """
+    data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+    units = translation_units(data)
+    if data.id is None or not units:
+        return {}
+
+    hashes = {unit.id: unit.source_hash for unit in units}
+    by_language = {}
+    for row in CVTranslation.objects.filter(cv_id=data.id).only(
+        "language", "field", "source_hash", "text"
+    ):
+        if hashes.get(row.field) == row.source_hash:
+            by_language.setdefault(row.language, {})[row.field] = row.text
+    return {
+        language: _json_normalized(build_translated_data(data, translations))
+        for language, translations in by_language.items()
+        if len(translations) == len(units)
+    }
+
+
+def stored_translation(cv, language):
+    """Return the complete, current stored translation of a CV, or ``None``."""
+    data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+    units = translation_units(data)
+    if data.id is None or not units:
+        return None
+    translations = stored_field_translations(data.id, units, language)
+    if len(translations) < len(units):
+        return None
+    return _json_normalized(build_translated_data(data, translations))
+
+
+def _json_normalized(translation):
+    return json.loads(json.dumps(translation, cls=DjangoJSONEncoder))
+
+
+def language_key(language):
+    """Return the form value for a language code or display name."""
+    return language.strip().lower().replace(" ", "_")
+
+
+def cv_source_hash(cv):
+    """
+    Return a hash of the translatable state of a CV or ``CVData`` snapshot.
+
+    ``updated_at`` is left out, so saving a CV without changing its text
+    keeps its stored translations.
+    """
+    data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+    payload = data.to_dict()
+    payload.pop("updated_at")
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def translation_cache_key(source_hash, language):
+    return f"translation:{source_hash}:{language_key(language)}"
+
+
+def get_cached_translation(cv, language):
+    """
+    Return the stored ``translated_data`` for a CV version, or ``None``.
+
+    Falls back to the ``CVTranslation`` rows when the cache has expired.
+    """
+    key = translation_cache_key(cv_source_hash(cv), language)
+    translation = cache.get(key)
+    if translation is None:
+        translation = stored_translation(cv, language)
+        if translation is not None:
+            cache.set(
+                key,
+                translation,
+                getattr(settings, "TRANSLATION_CACHE_TIMEOUT", 7 * 24 * 3600),
+            )
+    return translation
+
+
+def store_translation(cv, language, translation):
+    """
+    Store ``translated_data`` for a CV version and return it JSON-normalized.
+
+    Dates become ISO strings, matching what Celery hands to result readers.
+    """
+    translation = _json_normalized(translation)
+    cache.set(
+        translation_cache_key(cv_source_hash(cv), language),
+        translation,
+        getattr(settings, "TRANSLATION_CACHE_TIMEOUT", 7 * 24 * 3600),
+    )
+    return translation
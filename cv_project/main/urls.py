@@ -9,7 +9,10 @@ urlpatterns = [
     path("", views.CVListView.as_view(), name="cv_list"),
     path("cv/<int:pk>/", views.CVDetailView.as_view(), name="cv_detail"),
     path("cv/<int:pk>/pdf/", views.cv_pdf_download, name="cv_pdf_download"),
+    path("cv/export/pdf/", views.cv_pdf_export, name="cv_pdf_export"),
+    path("cv/pdf/<str:token>/", views.cv_pdf_link, name="cv_pdf_link"),
     path("cv/<int:pk>/email/", views.email_cv_view, name="cv_email"),
+    path("cv/<int:pk>/email/bulk/", views.bulk_email_cv_view, name="cv_email_bulk"),
     path("cv/<int:pk>/translate/", views.translate_cv_view, name="cv_translate"),
     path(
         "task-status/<str:task_id>/",
@@ -25,4 +28,5 @@ urlpatterns = [
     path("logs/api/", views.request_logs_api, name="request_logs_api"),
     path("settings/", views.SettingsView.as_view(), name="settings"),
     path("api/settings/", views.settings_api, name="settings_api"),
+    path("metrics/render/", views.render_metrics_api, name="render_metrics_api"),
 ]
@@ -2,6 +2,8 @@
 Views for the CV management system.
 """
 import json
+import logging
+import os
 import platform
 import re
 import sys
@@ -10,18 +12,47 @@ from io import BytesIO
 
 import django
 from django.conf import settings
-from django.http import HttpResponse, JsonResponse
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import PermissionDenied
+from django.http import (
+    FileResponse,
+    Http404,
+    HttpResponse,
+    JsonResponse,
+    StreamingHttpResponse,
+)
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
 from django.views.decorators.http import require_http_methods
 from django.views.generic import ListView, DetailView, TemplateView
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
 
-from .models import CV, RequestLog
+from .models import CV, EmailDelivery, RequestLog
+from .pdf import CVData, PDFGenerator
+from .pdf_cache import (
+    cv_content_hash,
+    cv_last_modified,
+    get_pdf_cache,
+    pdf_render_options,
+)
+from .pdf_export import filter_cvs, iter_cv_pdfs, stream_zip
+from .pdf_links import pdf_link_max_age, resolve_pdf_link
+from .pdf_service import PDFRenderError, get_pdf_render_service
+from .pdf_singleflight import get_pdf_single_flight
+from .rate_limit import client_ip, get_email_rate_limiter
+from .translation import (
+    SUPPORTED_LANGUAGES,
+    get_cached_translation,
+    language_key,
+    stored_translation,
+    stored_translations,
+)
+
+logger = logging.getLogger(__name__)
+
+EMAIL_PATTERN = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
 
 
 class CVListView(ListView):
@@ -52,265 +83,343 @@ class CVDetailView(DetailView):
             "skills", "projects", "contacts"
         )
 
+    def get_context_data(self, **kwargs):
+        """Add the stored translations, shown without a translation task."""
+        context = super().get_context_data(**kwargs)
+        context["stored_translations"] = stored_translations(self.object)
+        return context
+
 
-class PDFGenerator:
+def generate_cv_pdf_buffer(cv, mode=None, translation=None):
     """
-    Centralized PDF generation class to avoid code duplication.
-    Handles all PDF styling and content generation.
+    Helper function to generate CV PDF and return as BytesIO buffer.
+    Used by both download view and Celery email task.
+
+    Renders in the PDF process pool when ``PDF_RENDER_POOL`` enables one,
+    otherwise in the current process. ``mode`` selects the output mode and
+    defaults to ``PDF_DOWNLOAD_MODE``; ``translation`` is an optional
+    ``translate_cv_content`` payload to render instead of the original text.
     """
+    options = pdf_render_options(mode, translation)
+    service = get_pdf_render_service()
+    if service is None:
+        return PDFGenerator(cv, **options).generate()
 
-    def __init__(self, cv):
-        self.cv = cv
-        self.buffer = BytesIO()
-        self.elements = []
-        self.styles = self._create_styles()
+    data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+    return BytesIO(service.render(data.to_dict(), **options))
 
-    def _create_styles(self):
-        """Create and return custom PDF styles."""
-        base_styles = getSampleStyleSheet()
 
-        return {
-            "title": ParagraphStyle(
-                "CustomTitle",
-                parent=base_styles["Heading1"],
-                fontSize=24,
-                spaceAfter=30,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor("#007bff"),
-            ),
-            "heading": ParagraphStyle(
-                "CustomHeading",
-                parent=base_styles["Heading2"],
-                fontSize=16,
-                spaceAfter=12,
-                spaceBefore=20,
-                textColor=colors.HexColor("#007bff"),
-                borderWidth=1,
-                borderColor=colors.HexColor("#007bff"),
-                borderPadding=5,
-                backColor=colors.HexColor("#f8f9fa"),
-            ),
-            "normal": ParagraphStyle(
-                "CustomNormal",
-                parent=base_styles["Normal"],
-                fontSize=11,
-                spaceAfter=12,
-                alignment=TA_JUSTIFY,
-            ),
-            "contact": ParagraphStyle(
-                "ContactStyle",
-                parent=base_styles["Normal"],
-                fontSize=10,
-                spaceAfter=6,
-                alignment=TA_CENTER,
-                textColor=colors.HexColor("#666666"),
-            ),
-        }
+def get_cv_pdf(cv, content_hash=None, mode=None, translation=None):
+    """
+    Return the PDF bytes for a CV, using the PDF cache when possible.
+
+    The cache is keyed by the CV content hash, so unchanged CVs skip
+    ``PDFGenerator.generate()`` entirely. ``cv`` may be a model instance or
+    a ``CVData`` snapshot; either way the hash and the rendered document
+    come from the same snapshot. Each ``translation`` is cached as a
+    separate variant of the CV. Concurrent cache misses for the same
+    content are rendered once (see ``main.pdf_singleflight``).
+    """
+    pdf_cache = get_pdf_cache()
+    data = cv if isinstance(cv, CVData) else CVData.from_cv(cv)
+    if content_hash is None:
+        content_hash = cv_content_hash(data, pdf_render_options(mode, translation))
+
+    pdf = pdf_cache.get(data.id, content_hash)
+    if pdf is None:
+
+        def render():
+            buffer = generate_cv_pdf_buffer(data, mode=mode, translation=translation)
+            pdf = buffer.getvalue()
+            buffer.close()
+            pdf_cache.set(data.id, content_hash, pdf)
+            return pdf
+
+        # Concurrent misses for the same content share a single render
+        pdf = get_pdf_single_flight().do(
+            f"{data.id}:{content_hash}",
+            render,
+            lookup=lambda: pdf_cache.get(data.id, content_hash),
+        )
 
-    def _add_header(self):
-        """Add CV title and contact information."""
-        # Title
-        title = Paragraph(self.cv.full_name, self.styles["title"])
-        self.elements.append(title)
-
-        # Contact info
-        contact_info = f"Email: {self.cv.email}"
-        if self.cv.phone:
-            contact_info += f" | Phone: {self.cv.phone}"
-        contact_para = Paragraph(contact_info, self.styles["contact"])
-        self.elements.append(contact_para)
-        self.elements.append(Spacer(1, 20))
-
-    def _add_biography(self):
-        """Add professional summary section."""
-        bio_heading = Paragraph("Professional Summary", self.styles["heading"])
-        self.elements.append(bio_heading)
-        bio_content = Paragraph(self.cv.bio, self.styles["normal"])
-        self.elements.append(bio_content)
-        self.elements.append(Spacer(1, 15))
-
-    def _add_skills(self):
-        """Add skills section with table layout."""
-        if not self.cv.skills.exists():
-            return
-
-        skills_heading = Paragraph("Core Skills", self.styles["heading"])
-        self.elements.append(skills_heading)
-
-        # Create skills table (2 columns)
-        skills_data = []
-        skills_row = []
-
-        for skill in self.cv.skills.all():
-            skill_text = f"{skill.name}\n{skill.get_proficiency_display()}"
-            skills_row.append(skill_text)
-
-            if len(skills_row) == 2:
-                skills_data.append(skills_row)
-                skills_row = []
-
-        # Add remaining skill if odd number
-        if skills_row:
-            skills_row.append("")
-            skills_data.append(skills_row)
-
-        if skills_data:
-            skills_table = Table(skills_data, colWidths=[3 * inch, 3 * inch])
-            skills_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#f8f9fa")),
-                        ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                        ("FONTNAME", (0, 0), (-1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 11),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 12),
-                        ("TOPPADDING", (0, 0), (-1, -1), 12),
-                        ("LEFTPADDING", (0, 0), (-1, -1), 10),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#e9ecef")),
-                    ]
-                )
-            )
-            self.elements.append(skills_table)
-            self.elements.append(Spacer(1, 15))
-
-    def _add_projects(self):
-        """Add projects section."""
-        if not self.cv.projects.exists():
-            return
-
-        projects_heading = Paragraph("Professional Projects", self.styles["heading"])
-        self.elements.append(projects_heading)
-
-        for project in self.cv.projects.all():
-            # Project title with ongoing indicator
-            project_title_text = f"<b>{project.title}</b>"
-            if project.is_ongoing:
-                project_title_text += " <font color='#28a745'>(Ongoing)</font>"
-
-            # Date range
-            date_range = f"{project.start_date.strftime('%b %Y')}"
-            if project.end_date:
-                date_range += f" - {project.end_date.strftime('%b %Y')}"
-            else:
-                date_range += " - Present"
+    return pdf
 
-            # Add project elements
-            self.elements.append(Paragraph(project_title_text, self.styles["normal"]))
-            self.elements.append(
-                Paragraph(
-                    f"<font color='#666666'>{date_range}</font>", self.styles["normal"]
-                )
-            )
-            self.elements.append(Paragraph(project.description, self.styles["normal"]))
 
-            # Technologies
-            if project.technologies_list:
-                tech_text = "<b>Technologies:</b> " + ", ".join(
-                    project.technologies_list
-                )
-                self.elements.append(Paragraph(tech_text, self.styles["normal"]))
-
-            # URL
-            if project.url:
-                url_text = f"<b>URL:</b> <font color='#007bff'>{project.url}</font>"
-                self.elements.append(Paragraph(url_text, self.styles["normal"]))
-
-            self.elements.append(Spacer(1, 12))
-
-    def _add_contacts(self):
-        """Add contact information section."""
-        if not self.cv.contacts.exists():
-            return
-
-        contacts_heading = Paragraph("Contact & Social Media", self.styles["heading"])
-        self.elements.append(contacts_heading)
-
-        contacts_data = []
-        for contact in self.cv.contacts.all():
-            contacts_data.append([contact.get_contact_type_display(), contact.url])
-
-        if contacts_data:
-            contacts_table = Table(contacts_data, colWidths=[2 * inch, 4 * inch])
-            contacts_table.setStyle(
-                TableStyle(
-                    [
-                        ("BACKGROUND", (0, 0), (-1, -1), colors.HexColor("#f8f9fa")),
-                        ("TEXTCOLOR", (0, 0), (-1, -1), colors.black),
-                        ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                        ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                        ("FONTNAME", (0, 0), (0, -1), "Helvetica-Bold"),
-                        ("FONTNAME", (1, 0), (1, -1), "Helvetica"),
-                        ("FONTSIZE", (0, 0), (-1, -1), 10),
-                        ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-                        ("TOPPADDING", (0, 0), (-1, -1), 8),
-                        ("LEFTPADDING", (0, 0), (-1, -1), 10),
-                        ("RIGHTPADDING", (0, 0), (-1, -1), 10),
-                        ("GRID", (0, 0), (-1, -1), 1, colors.HexColor("#e9ecef")),
-                        ("TEXTCOLOR", (1, 0), (1, -1), colors.HexColor("#007bff")),
-                    ]
-                )
-            )
-            self.elements.append(contacts_table)
-
-    def _add_footer(self):
-        """Add footer with generation date."""
-        self.elements.append(Spacer(1, 30))
-        footer_text = f"Generated on {self.cv.updated_at.strftime('%B %d, %Y')} | {self.cv.full_name} Professional CV"
-        footer_para = Paragraph(footer_text, self.styles["contact"])
-        self.elements.append(footer_para)
-
-    def generate(self):
-        """Generate the complete PDF and return the buffer."""
-        # Create PDF document
-        doc = SimpleDocTemplate(
-            self.buffer,
-            pagesize=A4,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=18,
-        )
+def parse_byte_range(header, size):
+    """
+    Parse a ``Range`` header against a body of ``size`` bytes.
 
-        # Add all sections
-        self._add_header()
-        self._add_biography()
-        self._add_skills()
-        self._add_projects()
-        self._add_contacts()
-        self._add_footer()
+    Returns an inclusive ``(start, end)`` pair, or ``None`` when the header
+    should be ignored (absent, malformed or asking for several ranges).
+    Raises ``ValueError`` when the range cannot be satisfied.
+    """
+    if not header or not header.startswith("bytes="):
+        return None
 
-        # Build PDF
-        doc.build(self.elements)
+    spec = header[len("bytes=") :].strip()
+    if "," in spec:
+        return None
 
-        return self.buffer
+    first, separator, last = spec.partition("-")
+    try:
+        first = int(first) if first.strip() else None
+        last = int(last) if last.strip() else None
+    except ValueError:
+        return None
+    if not separator or (first is None and last is None):
+        return None
+
+    if first is None:
+        # Suffix range: the final ``last`` bytes
+        if last == 0 or size == 0:
+            raise ValueError("Unsatisfiable range")
+        return max(size - last, 0), size - 1
+
+    if last is not None and last < first:
+        return None
+    if first >= size:
+        raise ValueError("Unsatisfiable range")
+    return first, min(last if last is not None else size - 1, size - 1)
+
+
+def pdf_range_response(range_header, size, read, filename):
+    """
+    Build a 206 or 416 response for a PDF of ``size`` bytes.
 
+    ``read(start, length)`` returns the requested slice. Returns ``None``
+    when the request should be answered with the full document instead.
+    """
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+
+    if byte_range is None:
+        return None
+
+    start, end = byte_range
+    response = HttpResponse(
+        read(start, end - start + 1), status=206, content_type="application/pdf"
+    )
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
 
-def generate_cv_pdf_buffer(cv):
+
+def pdf_file_response(path, filename, range_header=None, sendfile=True):
     """
-    Helper function to generate CV PDF and return as BytesIO buffer.
-    Used by both download view and Celery email task.
+    Serve a pre-rendered PDF file from disk.
+
+    Delegates the transfer to the front-end server when
+    ``PDF_SENDFILE_BACKEND`` is "nginx" (``X-Accel-Redirect``) or "apache"
+    (``X-Sendfile``), which then handles ``Range`` itself; otherwise answers
+    byte ranges directly and streams full downloads with ``FileResponse``,
+    which uses the WSGI server's ``sendfile`` support where available.
+    ``sendfile=False`` skips the front-end server for files outside the
+    PDF cache directory.
+
+    Otherwise the file is opened first, so a response is never broken by
+    the file being deleted afterwards; an ``OSError`` (usually
+    ``FileNotFoundError``) means it was already gone.
     """
-    generator = PDFGenerator(cv)
-    return generator.generate()
+    sendfile_backend = getattr(settings, "PDF_SENDFILE_BACKEND", "") if sendfile else ""
+
+    if sendfile_backend in ("nginx", "apache"):
+        response = HttpResponse(content_type="application/pdf")
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        if sendfile_backend == "nginx":
+            relative_path = path.relative_to(get_pdf_cache().location).as_posix()
+            response["X-Accel-Redirect"] = settings.PDF_SENDFILE_URL + relative_path
+        else:
+            response["X-Sendfile"] = str(path)
+        return response
+
+    pdf_file = open(path, "rb")
+    if range_header:
+
+        def read(start, length):
+            pdf_file.seek(start)
+            return pdf_file.read(length)
+
+        try:
+            response = pdf_range_response(
+                range_header, os.fstat(pdf_file.fileno()).st_size, read, filename
+            )
+        except Exception:
+            pdf_file.close()
+            raise
+        if response is not None:
+            pdf_file.close()
+            return response
+
+    return FileResponse(
+        pdf_file,
+        as_attachment=True,
+        filename=filename,
+        content_type="application/pdf",
+    )
+
+
+def _if_range_matches(request, etag, last_modified):
+    """Return whether a ``Range`` may be honoured under ``If-Range``."""
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if not if_range:
+        return True
+    if if_range.startswith(('"', "W/")):
+        # Byte ranges need a strong validator
+        return if_range == etag
+    return parse_http_date_safe(if_range) == last_modified
+
+
+def _set_pdf_validators(response, etag, last_modified):
+    """Attach the caching headers shared by every PDF download response."""
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    patch_cache_control(response, public=True, no_cache=True)
+    if response.status_code in (200, 206):
+        response["Accept-Ranges"] = "bytes"
+    return response
 
 
 def cv_pdf_download(request, pk):
-    """Generate and download CV as PDF using ReportLab."""
-    cv = get_object_or_404(CV, pk=pk)
+    """
+    Download CV as PDF.
+
+    Answers conditional requests from the CV content hash (``ETag``) and
+    the newest ``updated_at`` of the CV and its rows (``Last-Modified``)
+    without rendering. Serves the pre-rendered file when one exists for the
+    current CV content, falls back to rendering with ReportLab on a cache
+    miss, and honours single byte ranges either way.
+
+    ``?lang=<language>`` downloads the CV translated into one of the
+    supported languages. The translation comes from the translation cache;
+    when it is missing, a translation task is queued and the response is
+    ``202 Accepted`` with the task id to poll.
+    """
+    cv = get_object_or_404(
+        CV.objects.prefetch_related("skills", "projects", "contacts"), pk=pk
+    )
+    # One snapshot feeds both the cache key and the layout, so rendering
+    # runs without touching the database
+    data = CVData.from_cv(cv)
+    filename = f"{data.full_name.replace(' ', '_')}_CV.pdf"
+
+    translation = None
+    lang = request.GET.get("lang", "").strip()
+    if lang:
+        language = SUPPORTED_LANGUAGES.get(language_key(lang))
+        if language is None:
+            return JsonResponse(
+                {"success": False, "error": f"Unsupported language: {lang}"},
+                status=400,
+            )
 
-    # Generate PDF using helper function
-    buffer = generate_cv_pdf_buffer(cv)
-    pdf = buffer.getvalue()
-    buffer.close()
+        translation = get_cached_translation(data, language)
+        if translation is None and not getattr(settings, "OPENAI_API_KEY", None):
+            return JsonResponse(
+                {"success": False, "error": "Translation service is not configured"},
+                status=503,
+            )
+        if translation is None:
+            from .tasks import translate_cv_content
 
-    # Create HTTP response
-    response = HttpResponse(pdf, content_type="application/pdf")
-    filename = f"{cv.full_name.replace(' ', '_')}_CV.pdf"
-    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+            task = translate_cv_content.delay(cv_id=cv.pk, target_language=language)
+            response = JsonResponse(
+                {
+                    "success": False,
+                    "message": f"Translation to {language} started, retry shortly.",
+                    "task_id": task.id,
+                    "target_language": language,
+                },
+                status=202,
+            )
+            response["Retry-After"] = "10"
+            return response
+
+        filename = f"{data.full_name.replace(' ', '_')}_CV_{language_key(language)}.pdf"
+
+    content_hash = cv_content_hash(data, pdf_render_options(translation=translation))
+
+    etag = quote_etag(content_hash)
+    last_modified = int(cv_last_modified(cv).timestamp())
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is not None:
+        return _set_pdf_validators(response, etag, last_modified)
+
+    range_header = None
+    if request.method == "GET" and _if_range_matches(request, etag, last_modified):
+        range_header = request.META.get("HTTP_RANGE")
+
+    # Pre-rendered file available: serve it without touching ReportLab
+    path = get_pdf_cache().get_path(cv.pk, content_hash)
+    if path is not None:
+        try:
+            response = pdf_file_response(path, filename, range_header)
+        except OSError as e:
+            # Invalidated or culled since the lookup: render it instead
+            logger.info(f"Cached PDF of CV {cv.pk} disappeared: {str(e)}")
+        else:
+            return _set_pdf_validators(response, etag, last_modified)
+
+    # Cache miss: render on demand (this also stores the PDF for next time)
+    try:
+        pdf = get_cv_pdf(data, content_hash, translation=translation)
+    except PDFRenderError as e:
+        logger.warning(f"PDF rendering unavailable for CV {cv.pk}: {str(e)}")
+        response = HttpResponse(
+            "PDF rendering is busy, please retry shortly.",
+            status=503,
+            content_type="text/plain",
+        )
+        response["Retry-After"] = "5"
+        return response
+
+    response = None
+    if range_header:
+        response = pdf_range_response(
+            range_header,
+            len(pdf),
+            lambda start, length: pdf[start : start + length],
+            filename,
+        )
+
+    if response is None:
+        # Create HTTP response
+        response = HttpResponse(pdf, content_type="application/pdf")
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
 
+    return _set_pdf_validators(response, etag, last_modified)
+
+
+@require_http_methods(["GET", "HEAD"])
+def cv_pdf_link(request, token):
+    """
+    Download a CV PDF through a signed link sent by email.
+
+    The token names the stored file (see ``main.pdf_links``); expired links
+    and files already cleaned up answer ``410 Gone``.
+    """
+    try:
+        path, filename = resolve_pdf_link(token)
+    except signing.SignatureExpired:
+        return HttpResponse(
+            "This download link has expired.", status=410, content_type="text/plain"
+        )
+    except signing.BadSignature:
+        raise Http404("Invalid download link")
+
+    range_header = request.META.get("HTTP_RANGE") if request.method == "GET" else None
+    try:
+        response = pdf_file_response(path, filename, range_header, sendfile=False)
+    except FileNotFoundError:
+        return HttpResponse(
+            "This CV is no longer available.", status=410, content_type="text/plain"
+        )
+    response["Accept-Ranges"] = "bytes"
+    # The file behind a link never changes
+    patch_cache_control(response, private=True, max_age=pdf_link_max_age())
     return response
 
 
@@ -563,6 +672,123 @@ def settings_api(request):
     return JsonResponse(json_data, encoder=DjangoJSONEncoder)
 
 
+@require_http_methods(["GET"])
+def render_metrics_api(request):
+    """
+    Expose aggregated context processor and template render metrics.
+
+    Returns JSON by default, or the Prometheus text format with
+    ``?format=prometheus``. Only staff users and scrapers connecting from
+    an address in ``INTERNAL_IPS`` may read them.
+    """
+    from .instrumentation import render_metrics
+
+    user = getattr(request, "user", None)
+    internal = request.META.get("REMOTE_ADDR") in settings.INTERNAL_IPS
+    if not (internal or (user is not None and user.is_staff)):
+        raise PermissionDenied
+
+    if request.GET.get("format") == "prometheus":
+        return HttpResponse(
+            render_metrics.as_prometheus(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    return JsonResponse(
+        {
+            "enabled": getattr(settings, "RENDER_INSTRUMENTATION_ENABLED", False),
+            **render_metrics.snapshot(),
+        }
+    )
+
+
+@require_http_methods(["GET"])
+def cv_pdf_export(request):
+    """
+    Download the PDFs of several CVs as one streamed ZIP archive.
+
+    Accepts ``ids`` (comma separated), ``q``, ``created_from`` and
+    ``created_to`` (``YYYY-MM-DD``) query parameters, at least one of which
+    is required. Only staff users may export, and at most
+    ``PDF_EXPORT_MAX_CVS`` CVs per archive. The archive starts transferring
+    as soon as the first PDF is ready.
+    """
+    user = getattr(request, "user", None)
+    if user is None or not user.is_staff:
+        raise PermissionDenied
+
+    ids = [pk for pk in request.GET.get("ids", "").split(",") if pk.strip()]
+    filters = {
+        "ids": ids,
+        "q": request.GET.get("q", "").strip(),
+        "created_from": request.GET.get("created_from"),
+        "created_to": request.GET.get("created_to"),
+    }
+    if not any(filters.values()):
+        return JsonResponse(
+            {
+                "success": False,
+                "error": "Select CVs with ids, q, created_from or created_to",
+            },
+            status=400,
+        )
+
+    try:
+        queryset = filter_cvs(**filters)
+    except ValueError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+
+    max_cvs = getattr(settings, "PDF_EXPORT_MAX_CVS", 500)
+    if queryset[: max_cvs + 1].count() > max_cvs:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": f"More than {max_cvs} CVs selected, narrow the filters",
+            },
+            status=400,
+        )
+
+    filename = f"cv_export_{timezone.now().strftime('%Y%m%d_%H%M%S')}.zip"
+    response = StreamingHttpResponse(
+        stream_zip(iter_cv_pdfs(queryset)), content_type="application/zip"
+    )
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def email_rate_limited(request, recipient=None):
+    """
+    Return a 429 response if the client or ``recipient`` is over its limit.
+
+    The client's bucket pays for the request. The recipient's bucket is only
+    checked here and paid by the task when it sends, so a request cannot use
+    up a recipient's allowance without delivering; bulk sends skip limited
+    recipients in the task instead.
+    """
+    retry_after = 0
+    recipient_limiter = get_email_rate_limiter("RECIPIENT")
+    if recipient and recipient_limiter is not None:
+        allowed, retry_after = recipient_limiter.take(recipient.lower(), tokens=0)
+
+    sender_limiter = get_email_rate_limiter("SENDER")
+    if not retry_after and sender_limiter is not None:
+        allowed, retry_after = sender_limiter.take(client_ip(request))
+
+    if not retry_after:
+        return None
+
+    response = JsonResponse(
+        {
+            "success": False,
+            "error": f"Too many emails, please retry in {retry_after} seconds.",
+            "retry_after": retry_after,
+        },
+        status=429,
+    )
+    response["Retry-After"] = str(retry_after)
+    return response
+
+
 def email_cv_view(request, pk):
     """Handle CV email sending via AJAX."""
     if request.method != "POST":
@@ -578,6 +804,7 @@ def email_cv_view(request, pk):
             data = json.loads(request.body)
             email = data.get("email", "").strip()
             sender_name = data.get("sender_name", "").strip()
+            language = data.get("language", "").strip()
         except json.JSONDecodeError:
             return JsonResponse(
                 {"success": False, "error": "Invalid JSON data"}, status=400
@@ -589,13 +816,26 @@ def email_cv_view(request, pk):
                 {"success": False, "error": "Email address is required"}, status=400
             )
 
-        email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
-        if not re.match(email_pattern, email):
+        if not re.match(EMAIL_PATTERN, email):
             return JsonResponse(
                 {"success": False, "error": "Please enter a valid email address"},
                 status=400,
             )
 
+        # Optional language of the attached PDF
+        task_kwargs = {}
+        if language:
+            if language not in SUPPORTED_LANGUAGES:
+                return JsonResponse(
+                    {"success": False, "error": f"Unsupported language: {language}"},
+                    status=400,
+                )
+            task_kwargs["language"] = SUPPORTED_LANGUAGES[language]
+
+        limited = email_rate_limited(request, email)
+        if limited is not None:
+            return limited
+
         # Queue email task
         from .tasks import send_cv_pdf_email
 
@@ -603,6 +843,16 @@ def email_cv_view(request, pk):
             cv_id=cv.pk,
             recipient_email=email,
             sender_name=sender_name or "CV Management System",
+            **task_kwargs,
+        )
+        # The task may already have recorded its delivery
+        EmailDelivery.objects.get_or_create(
+            task_id=task.id,
+            defaults={
+                "cv": cv,
+                "recipient": email,
+                "language": task_kwargs.get("language", ""),
+            },
         )
 
         return JsonResponse(
@@ -622,6 +872,113 @@ def email_cv_view(request, pk):
         )
 
 
+def parse_recipients(value):
+    """
+    Return unique recipient addresses from a list or a separated string.
+
+    Addresses may be separated by commas, semicolons or whitespace; the
+    first spelling of each address (compared case-insensitively) is kept.
+    """
+    if isinstance(value, str):
+        value = re.split(r"[,;\s]+", value)
+
+    recipients = []
+    seen = set()
+    for address in value:
+        address = str(address).strip()
+        if address and address.lower() not in seen:
+            seen.add(address.lower())
+            recipients.append(address)
+    return recipients
+
+
+def bulk_email_cv_view(request, pk):
+    """
+    Queue one CV email to many recipients via AJAX.
+
+    Expects ``recipients`` (a list or a separated string) plus the optional
+    ``sender_name`` and ``language`` of ``email_cv_view``. Progress is polled
+    through ``check_email_task_status``.
+    """
+    if request.method != "POST":
+        return JsonResponse(
+            {"success": False, "error": "Method not allowed"}, status=405
+        )
+
+    cv = get_object_or_404(CV, pk=pk)
+
+    try:
+        data = json.loads(request.body)
+        recipients = parse_recipients(data.get("recipients") or [])
+        sender_name = data.get("sender_name", "").strip()
+        language = data.get("language", "").strip()
+    except (json.JSONDecodeError, AttributeError, TypeError):
+        return JsonResponse(
+            {"success": False, "error": "Invalid JSON data"}, status=400
+        )
+
+    if not recipients:
+        return JsonResponse(
+            {"success": False, "error": "At least one recipient is required"},
+            status=400,
+        )
+
+    max_recipients = getattr(settings, "EMAIL_BULK_MAX_RECIPIENTS", 500)
+    if len(recipients) > max_recipients:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": f"At most {max_recipients} recipients can be sent at once",
+            },
+            status=400,
+        )
+
+    invalid = [
+        address for address in recipients if not re.match(EMAIL_PATTERN, address)
+    ]
+    if invalid:
+        return JsonResponse(
+            {
+                "success": False,
+                "error": "Please enter valid email addresses",
+                "invalid": invalid,
+            },
+            status=400,
+        )
+
+    task_kwargs = {}
+    if language:
+        if language not in SUPPORTED_LANGUAGES:
+            return JsonResponse(
+                {"success": False, "error": f"Unsupported language: {language}"},
+                status=400,
+            )
+        task_kwargs["language"] = SUPPORTED_LANGUAGES[language]
+
+    limited = email_rate_limited(request)
+    if limited is not None:
+        return limited
+
+    from .tasks import send_cv_pdf_bulk_email
+
+    task = send_cv_pdf_bulk_email.delay(
+        cv_id=cv.pk,
+        recipients=recipients,
+        sender_name=sender_name or "CV Management System",
+        **task_kwargs,
+    )
+
+    return JsonResponse(
+        {
+            "success": True,
+            "message": f"CV email queued for {len(recipients)} recipients.",
+            "task_id": task.id,
+            "cv_name": cv.full_name,
+            "total": len(recipients),
+        }
+    )
+
+
 def translate_cv_view(request, pk):
     """Handle CV translation via AJAX."""
     if request.method != "POST":
@@ -647,34 +1004,27 @@ def translate_cv_view(request, pk):
                 {"success": False, "error": "Target language is required"}, status=400
             )
 
-        # Define supported languages
-        supported_languages = {
-            "cornish": "Cornish",
-            "manx": "Manx",
-            "breton": "Breton",
-            "inuktitut": "Inuktitut",
-            "kalaallisut": "Kalaallisut",
-            "romani": "Romani",
-            "occitan": "Occitan",
-            "ladino": "Ladino",
-            "northern_sami": "Northern Sami",
-            "upper_sorbian": "Upper Sorbian",
-            "kashubian": "Kashubian",
-            "zazaki": "Zazaki",
-            "chuvash": "Chuvash",
-            "livonian": "Livonian",
-            "tsakonian": "Tsakonian",
-            "saramaccan": "Saramaccan",
-            "bislama": "Bislama",
-        }
-
-        if target_language not in supported_languages:
+        if target_language not in SUPPORTED_LANGUAGES:
             return JsonResponse(
                 {"success": False, "error": f"Unsupported language: {target_language}"},
                 status=400,
             )
 
-        # Check if OpenAI API key is configured
+        # Answer from the stored translation while the CV is unchanged
+        translation = stored_translation(cv, target_language)
+        if translation is not None:
+            return JsonResponse(
+                {
+                    "success": True,
+                    "message": f"Translated to {SUPPORTED_LANGUAGES[target_language]}",
+                    "translated_data": translation,
+                    "cv_name": cv.full_name,
+                    "target_language": SUPPORTED_LANGUAGES[target_language],
+                    "target_language_key": target_language,
+                }
+            )
+
+        # New translations need the OpenAI API key
         if not getattr(settings, "OPENAI_API_KEY", None):
             return JsonResponse(
                 {
@@ -688,16 +1038,16 @@ def translate_cv_view(request, pk):
         from .tasks import translate_cv_content
 
         task = translate_cv_content.delay(
-            cv_id=cv.pk, target_language=supported_languages[target_language]
+            cv_id=cv.pk, target_language=SUPPORTED_LANGUAGES[target_language]
         )
 
         return JsonResponse(
             {
                 "success": True,
-                "message": f"Translation to {supported_languages[target_language]} started...",
+                "message": f"Translation to {SUPPORTED_LANGUAGES[target_language]} started...",
                 "task_id": task.id,
                 "cv_name": cv.full_name,
-                "target_language": supported_languages[target_language],
+                "target_language": SUPPORTED_LANGUAGES[target_language],
                 "target_language_key": target_language,
             }
         )
@@ -719,9 +1069,108 @@ def translate_cv_view(request, pk):
         )
 
 
+# Task-style state and message reported for each EmailDelivery state
+DELIVERY_TASK_STATES = {
+    EmailDelivery.STATE_QUEUED: ("PENDING", "Task is waiting to be processed..."),
+    EmailDelivery.STATE_SENDING: ("PROGRESS", "Email is being sent..."),
+    EmailDelivery.STATE_RETRYING: ("PROGRESS", "Sending failed, retrying..."),
+    EmailDelivery.STATE_SENT: ("SUCCESS", "Email sent successfully!"),
+    EmailDelivery.STATE_DUPLICATE: ("SUCCESS", "Email was already sent recently."),
+    EmailDelivery.STATE_FAILED: ("FAILURE", "Task failed"),
+}
+
+
+def email_delivery_status(task_id):
+    """
+    Return the status response for the delivery recorded by ``task_id``.
+
+    Responses are cached for ``EMAIL_STATUS_CACHE_TIMEOUT`` seconds so
+    frequent polling costs one query per interval. Returns ``None`` when the
+    task recorded no delivery.
+    """
+    cache_key = f"email:status:{task_id}"
+    response = cache.get(cache_key)
+    if response is not None:
+        return response
+
+    delivery = EmailDelivery.objects.filter(task_id=task_id).first()
+    if delivery is None:
+        response = bulk_delivery_status(task_id)
+        if response is not None:
+            cache.set(
+                cache_key, response, getattr(settings, "EMAIL_STATUS_CACHE_TIMEOUT", 2)
+            )
+        return response
+
+    state, status = DELIVERY_TASK_STATES[delivery.state]
+    response = {
+        "state": state,
+        "status": status,
+        "delivery": {
+            "recipient": delivery.recipient,
+            "state": delivery.state,
+            "attempts": delivery.attempts,
+            "message_size": delivery.message_size,
+            "created_at": delivery.created_at.isoformat(),
+            "duration_ms": delivery.duration_ms,
+        },
+    }
+    if state == "FAILURE":
+        response["error"] = delivery.error
+
+    cache.set(cache_key, response, getattr(settings, "EMAIL_STATUS_CACHE_TIMEOUT", 2))
+    return response
+
+
+def bulk_delivery_status(task_id):
+    """
+    Return the status response for the bulk send ``task_id`` from the
+    ``EmailDelivery`` rows of its recipients, or ``None`` if it has none.
+    """
+    from .tasks import bulk_progress
+
+    deliveries = EmailDelivery.objects.filter(batch_id=task_id).order_by("pk")
+    statuses = {}
+    started = False
+    for delivery in deliveries:
+        started = started or delivery.state != EmailDelivery.STATE_QUEUED
+        if delivery.state in (EmailDelivery.STATE_SENT, EmailDelivery.STATE_DUPLICATE):
+            statuses[delivery.recipient] = {"status": "sent"}
+        elif delivery.state == EmailDelivery.STATE_FAILED:
+            statuses[delivery.recipient] = {"status": "failed", "error": delivery.error}
+        else:
+            statuses[delivery.recipient] = {"status": "pending"}
+    if not statuses:
+        return None
+
+    progress = bulk_progress(statuses)
+    if not progress["pending"]:
+        return {
+            "state": "SUCCESS",
+            "status": "Email sent successfully!",
+            "result": {"success": not progress["failed"], **progress},
+        }
+    if not started:
+        return {"state": "PENDING", "status": "Task is waiting to be processed..."}
+    return {
+        "state": "PROGRESS",
+        "status": "Task is being processed...",
+        "progress": progress,
+    }
+
+
 @require_http_methods(["GET"])
 def check_email_task_status(request, task_id):
-    """Check the status of an email task."""
+    """
+    Check the status of an email task.
+
+    Single emails and bulk sends are read from their ``EmailDelivery``
+    rows; other tasks fall back to the Celery result backend.
+    """
+    response = email_delivery_status(task_id)
+    if response is not None:
+        return JsonResponse(response)
+
     try:
         from celery.result import AsyncResult
         from core.celery import app as celery_app
@@ -736,6 +1185,10 @@ def check_email_task_status(request, task_id):
             "PROGRESS": {
                 "state": task_result.state,
                 "status": "Task is being processed...",
+                # Per-recipient progress of bulk sends
+                "progress": (
+                    task_result.info if isinstance(task_result.info, dict) else None
+                ),
             },
             "SUCCESS": {
                 "state": task_result.state,
@@ -764,8 +1217,19 @@ def check_email_task_status(request, task_id):
 
 @require_http_methods(["GET"])
 def check_translation_task_status(request, task_id):
-    """Check the status of a translation task."""
+    """
+    Check the status of a translation task.
+
+    With ``cv`` and ``language`` query parameters, a complete stored
+    translation of that CV is returned without reading the task result.
+    """
     try:
+        translation = _stored_translation_status(
+            request.GET.get("cv"), request.GET.get("language", "")
+        )
+        if translation is not None:
+            return JsonResponse(translation)
+
         from celery.result import AsyncResult
         from core.celery import app as celery_app
 
@@ -775,6 +1239,19 @@ def check_translation_task_status(request, task_id):
             response = {"state": "PENDING", "status": "Translation is being queued..."}
         elif task_result.state == "PROGRESS":
             response = {"state": "PROGRESS", "status": "Translation in progress..."}
+            # Fields translated so far, published by translate_cv_content
+            if isinstance(task_result.info, dict):
+                response.update(
+                    {
+                        key: task_result.info.get(key)
+                        for key in (
+                            "translated_data",
+                            "target_language",
+                            "done",
+                            "total",
+                        )
+                    }
+                )
         elif task_result.state == "SUCCESS":
             result = task_result.result
             if result and result.get("success"):
@@ -818,3 +1295,26 @@ def check_translation_task_status(request, task_id):
             },
             status=500,
         )
+
+
+def _stored_translation_status(cv_id, language):
+    """Return a SUCCESS status from a stored translation, or ``None``."""
+    if not cv_id or not cv_id.isdigit() or language not in SUPPORTED_LANGUAGES:
+        return None
+    cv = (
+        CV.objects.prefetch_related("skills", "projects", "contacts")
+        .filter(pk=cv_id)
+        .first()
+    )
+    if cv is None:
+        return None
+    translation = stored_translation(cv, language)
+    if translation is None:
+        return None
+    return {
+        "state": "SUCCESS",
+        "status": "Translation completed successfully!",
+        "translated_data": translation,
+        "target_language": SUPPORTED_LANGUAGES[language],
+        "cv_name": cv.full_name,
+    }